@@ -483,7 +483,12 @@ def main():
     )
     parser.add_argument("--connection_string")
     parser.add_argument(
-        "--seqrepo_service_url", default="http://localhost:5000/seqrepo"
+        "--seqrepo_service_url",
+        default="http://localhost:5000/seqrepo",
+        help=(
+            "seqrepo service URL, local seqrepo directory, "
+            "or faidx-indexed FASTA file (fasta+/path/to/GRCh38.fa.gz)"
+        ),
     )
     parser.add_argument(
         "--dataset", type=comma_separated_list, help="one or more dataset IDs"
@@ -0,0 +1,129 @@
+"""
+Typed accessors for the reference lookup tables shared by GenomicsDB plugins
+through the pipeline `ReferenceCache`.
+
+Cached references are shared between plugins; do not modify them.
+"""
+
+from typing import Dict, List, Optional
+
+from niagads.database.genomicsdb.schema.gene.structure import GeneModel
+from niagads.database.genomicsdb.schema.gene.xrefs import GeneIdentifierType, GeneXRef
+from niagads.database.genomicsdb.schema.reference.interval_bin import IntervalBin
+from niagads.database.genomicsdb.schema.reference.ontology import OntologyTerm
+from niagads.etl.plugins.references import ReferenceCache
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# chromosome -> bin level -> {"starts": [bin start], "bins": [(bin end, bin index)]},
+# levels ordered from the deepest (smallest bins)
+BinIndexReference = Dict[str, Dict[int, Dict[str, List]]]
+
+
+async def _load_bin_index_reference(session: AsyncSession) -> BinIndexReference:
+    stmt = select(IntervalBin).order_by(
+        IntervalBin.chromosome,
+        IntervalBin.bin_level.desc(),
+        func.lower(IntervalBin.span),
+    )
+    result = (await session.execute(stmt)).scalars().all()
+
+    reference: BinIndexReference = {}
+    bin: IntervalBin
+    for bin in result:
+        level = reference.setdefault(bin.chromosome, {}).setdefault(
+            bin.bin_level, {"starts": [], "bins": []}
+        )
+        level["starts"].append(bin.span.start)
+        level["bins"].append((bin.span.end, bin.bin_index))
+    return reference
+
+
+async def fetch_bin_index_reference(
+    session: AsyncSession, cache_dir: Optional[str] = None
+) -> BinIndexReference:
+    """
+    Fetch the IntervalBin index, sorted for bisection by bin start.
+
+    Args:
+        session (AsyncSession): database session.
+        cache_dir (Optional[str], optional): reference snapshot directory. Defaults to None.
+
+    Returns:
+        BinIndexReference: bin starts and (end, bin index) pairs by chromosome and level.
+    """
+    return await ReferenceCache.get(
+        session,
+        "bin_index",
+        _load_bin_index_reference,
+        sources=[IntervalBin],
+        cache_dir=cache_dir,
+    )
+
+
+async def fetch_gene_pk_mapping(
+    session: AsyncSession,
+    gene_identifier_type: GeneIdentifierType,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Fetch the gene identifier -> gene primary key mapping.
+
+    Args:
+        session (AsyncSession): database session.
+        gene_identifier_type (GeneIdentifierType): gene identifier to map.
+        cache_dir (Optional[str], optional): reference snapshot directory. Defaults to None.
+
+    Returns:
+        Dict[str, int]: mapping from gene identifier to gene_id.
+    """
+
+    async def load(session: AsyncSession) -> Dict[str, int]:
+        return await GeneXRef.retrieve_gene_pk_mapping(
+            session, gene_identifier_type=gene_identifier_type
+        )
+
+    return await ReferenceCache.get(
+        session,
+        "gene_pk",
+        load,
+        sources=[GeneModel, GeneXRef],
+        cache_dir=cache_dir,
+        gene_identifier_type=str(gene_identifier_type),
+    )
+
+
+async def fetch_ontology_term_pk_mapping(
+    session: AsyncSession,
+    external_database_id: int,
+    map_thru_term: bool = False,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Fetch the ontology curie (or term and synonym) -> ontology_term_id mapping.
+
+    Args:
+        session (AsyncSession): database session.
+        external_database_id (int): ontology external database.
+        map_thru_term (bool, optional): map terms and synonyms instead of curies.
+            Defaults to False.
+        cache_dir (Optional[str], optional): reference snapshot directory. Defaults to None.
+
+    Returns:
+        Dict[str, int]: mapping from curie (or term) to ontology_term_id.
+    """
+
+    async def load(session: AsyncSession) -> Dict[str, int]:
+        return await OntologyTerm.retrieve_term_pk_mapping(
+            session, ontology_ref=external_database_id, map_thru_term=map_thru_term
+        )
+
+    return await ReferenceCache.get(
+        session,
+        "ontology_term_pk",
+        load,
+        sources=[OntologyTerm],
+        cache_dir=cache_dir,
+        external_database_id=external_database_id,
+        map_thru_term=map_thru_term,
+    )
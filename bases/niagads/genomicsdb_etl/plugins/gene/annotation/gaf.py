@@ -20,8 +20,7 @@ from niagads.database.genomicsdb.schema.gene.annotation import (
     AnnotationEvidence,
     GOAssociation,
 )
-from niagads.database.genomicsdb.schema.gene.xrefs import GeneIdentifierType, GeneXRef
-from niagads.database.genomicsdb.schema.reference.ontology import OntologyTerm
+from niagads.database.genomicsdb.schema.gene.xrefs import GeneIdentifierType
 from niagads.etl.plugins.base import AbstractBasePlugin
 from niagads.etl.plugins.metadata import PluginMetadata
 from niagads.etl.plugins.parameters import (
@@ -34,6 +33,10 @@ from niagads.etl.plugins.types import ETLLoadStrategy
 from niagads.genomicsdb_etl.plugins.common.mixins.parameters import (
     ExternalDatabaseRefMixin,
 )
+from niagads.genomicsdb_etl.plugins.common.references import (
+    fetch_gene_pk_mapping,
+    fetch_ontology_term_pk_mapping,
+)
 from niagads.utils.sys import read_open_ctx
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
@@ -109,10 +112,13 @@ metadata = PluginMetadata(
         "Maps gene identifiers via UniProtKB"
     ),
     affected_tables=[AnnotationEvidence, GOAssociation],
-    load_strategy=ETLLoadStrategy.BATCH,  # processing in bulk is the best way to handle duplicates
+    # stream + group by uniprot_id|go_id, so duplicate associations are merged
+    # without loading the whole file
+    load_strategy=ETLLoadStrategy.BATCH,
     operation=ETLOperation.INSERT,
     is_large_dataset=False,
     parameter_model=GAFLoaderParams,
+    streaming=True,
 )
 
 
@@ -175,19 +181,21 @@ class GAFLoader(AbstractBasePlugin):
 
             # going to have to pretty much match whole gene table, so cache it
             # to speed things up
-            self.__gene_pk_ref = await GeneXRef.retrieve_gene_pk_mapping(
-                session, gene_identifier_type=GeneIdentifierType.UNIPROT
+            # (shared w/other plugins through the reference cache)
+            cache_dir = self._params.reference_cache_dir
+            self.__gene_pk_ref = await fetch_gene_pk_mapping(
+                session, GeneIdentifierType.UNIPROT, cache_dir=cache_dir
             )
 
             # cache ontology mappings
             # map thru evidence codes
-            self.__evidence_code_pk_ref = await OntologyTerm.retrieve_term_pk_mapping(
-                session, ontology_ref=self.__eco_xdbr_id, map_thru_term=True
+            self.__evidence_code_pk_ref = await fetch_ontology_term_pk_mapping(
+                session, self.__eco_xdbr_id, map_thru_term=True, cache_dir=cache_dir
             )
 
             # map thru GO CURIES
-            self.__go_curie_pk_ref = await OntologyTerm.retrieve_term_pk_mapping(
-                session, ontology_ref=self.__go_xdbr_id
+            self.__go_curie_pk_ref = await fetch_ontology_term_pk_mapping(
+                session, self.__go_xdbr_id, cache_dir=cache_dir
             )
 
             # Get table reference for annotation evidence
@@ -205,16 +213,17 @@ class GAFLoader(AbstractBasePlugin):
     def extract(self) -> Iterator[GAFEntry]:
         """Extract GO annotations from GAF file."""
         fields = list(GAFEntry.model_fields.keys())
-        entries = []
         with read_open_ctx(self._params.file) as fh:
             for line in fh:
                 if line.startswith("!"):
                     continue
                 values = line.strip().split("\t")
                 entry = dict(zip(fields, values))
-                entries.append(GAFEntry(**entry))
+                yield GAFEntry(**entry)
 
-        return entries
+    def group_key(self, record: GAFEntry) -> str:
+        """Evidence is merged per UniProt ID / GO term association."""
+        return f"{record.db_object_id}|{record.go_id}"
 
     def __lookup_gene_pk(self, uniprot_id: str) -> Optional[int]:
         """Look up gene ID by UniProt identifier."""
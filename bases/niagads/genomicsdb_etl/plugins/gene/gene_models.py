@@ -20,7 +20,8 @@ from niagads.enums.core import CaseInsensitiveEnum
 from niagads.etl.plugins.metadata import PluginMetadata
 from niagads.etl.plugins.parameters import PathValidatorMixin
 from niagads.etl.plugins.registry import PluginRegistry
-from niagads.etl.plugins.types import ETLLoadStrategy
+from niagads.etl.plugins.types import ETLInsertMethod, ETLLoadStrategy
+from niagads.etl.utils import offset_line_reader
 from niagads.genome_reference.human import HumanGenome
 from niagads.genome_reference.types import Strand
 from niagads.genomicsdb_etl.plugins.common.bases.features import (
@@ -30,9 +31,11 @@ from niagads.genomicsdb_etl.plugins.common.bases.features import (
 from niagads.genomicsdb_etl.plugins.common.mixins.parameters import (
     ExternalDatabaseRefMixin,
 )
+from niagads.genomicsdb_etl.plugins.common.references import (
+    fetch_ontology_term_pk_mapping,
+)
 from niagads.utils.dict import info_string_to_dict
 from niagads.utils.string import regex_replace
-from niagads.utils.sys import read_open_ctx
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -68,7 +71,9 @@ class GFF3Entry(BaseModel):
     phase: str
     attributes: dict
     line: str
+    offset: Optional[int] = None
     children: Optional[list] = []
+    protein_ids: list[str] = []  # transcripts only
 
     @field_validator("strand", mode="before")
     def validate_strand(cls, strand: str):
@@ -85,6 +90,7 @@ class TranscriptFeature(BaseModel, arbitrary_types_allowed=True):
 class GeneFeature(BaseModel, arbitrary_types_allowed=True):
     gene: GeneModel
     transcripts: list[TranscriptFeature] = []
+    offset: Optional[int] = None  # file offset of the gene line
 
 
 # ----------- Plugin
@@ -118,6 +124,8 @@ metadata = PluginMetadata(
     is_large_dataset=False,
     parameter_model=EnsemblGFF3LoaderParams,
     can_resume=True,
+    pipelined=True,
+    insert_method=ETLInsertMethod.CORE,
 )
 
 
@@ -146,7 +154,6 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
         self.__ontology_term_ref = {}
         # External database ID for sequence ontology
         self.__so_external_database_id = None
-        self.__transcript_protein_ref: dict[str, set[str]] = {}
 
     async def on_run_start(self, session):
         await super().on_run_start(session)
@@ -158,6 +165,17 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
             self.__so_external_database_id = so_xdbref.external_database_id
             self.logger.debug(f"SO XDBREF ID = {self.__so_external_database_id}")
 
+            # SO term (& synonym) lookups; copied b/c biotypes matched in the
+            # database are added and the cached reference is shared
+            self.__ontology_term_ref = dict(
+                await fetch_ontology_term_pk_mapping(
+                    session,
+                    self.__so_external_database_id,
+                    map_thru_term=True,
+                    cache_dir=self._params.reference_cache_dir,
+                )
+            )
+
     def get_record_id(
         self, record: Union[GeneModel, TranscriptModel, ExonModel]
     ) -> str:
@@ -185,8 +203,19 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
         parsed_gene_count = 0
         current_gene: GFF3Entry = None
         current_transcript: GFF3Entry = None
-        with read_open_ctx(self._params.file) as fh:
-            for line_number, line in enumerate(fh, start=1):
+        # transcript id -> protein ids; attached to the transcripts when the gene is yielded
+        # so that `transform` does not read extract state (extract may run ahead in a thread)
+        transcript_proteins: dict[str, set[str]] = {}
+        if self._params.resume_offset is not None:
+            # seek to the checkpoint gene; it is skipped again in `load`
+            self.logger.info(
+                f"Seeking to resume checkpoint at offset {self._params.resume_offset}"
+            )
+
+        with offset_line_reader(
+            self._params.file, self._params.resume_offset
+        ) as reader:
+            for line_number, (offset, line) in enumerate(reader, start=1):
                 gene_is_yielded: bool = False
                 if line.startswith("#"):
                     skipped_line_count += 1
@@ -211,10 +240,10 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
                     parent_id = entry["attributes"].get("Parent")
                     if parent_id is not None and "transcript" in parent_id:
                         transcript_id = parent_id.split(":")[1]
-                        if transcript_id in self.__transcript_protein_ref:
-                            self.__transcript_protein_ref[transcript_id].add(protein_id)
+                        if transcript_id in transcript_proteins:
+                            transcript_proteins[transcript_id].add(protein_id)
                         else:
-                            self.__transcript_protein_ref[transcript_id] = {protein_id}
+                            transcript_proteins[transcript_id] = {protein_id}
 
                 if "exon_id" in entry["attributes"]:
                     entry_id = entry["attributes"].get("exon_id")
@@ -240,6 +269,7 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
                     id=entry_id,
                     parent_id=parent_id,
                     line=line,
+                    offset=offset,
                     **entry,
                 )
 
@@ -252,6 +282,7 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
                     # if we are seeing a new gene, return the old one
                     elif current_gene.id != feature.id:
                         gene_is_yielded = True
+                        self.__attach_protein_ids(current_gene, transcript_proteins)
                         yield current_gene
 
                         parsed_gene_count += 1
@@ -282,6 +313,7 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
         # duplicating final entry
         if not gene_is_yielded:
             parsed_gene_count += 1
+            self.__attach_protein_ids(current_gene, transcript_proteins)
             yield current_gene
 
         self.logger.info(
@@ -289,6 +321,14 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
             f"Skipped {skipped_line_count} lines."
         )
 
+    @staticmethod
+    def __attach_protein_ids(
+        gene: GFF3Entry, transcript_proteins: dict[str, set[str]]
+    ):
+        """Move the protein ids of the gene's transcripts onto the transcript entries."""
+        for transcript in gene.children:
+            transcript.protein_ids = sorted(transcript_proteins.pop(transcript.id, []))
+
     def __create_gene_model(self, entry: GFF3Entry) -> GeneModel:
         # self.logger.debug(f"{entry.attributes}")
         gene_name = entry.attributes.get("description")
@@ -331,7 +371,7 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
             gene_type_id=gene_type,
         )
 
-        return GeneFeature(gene=gene)
+        return GeneFeature(gene=gene, offset=entry.offset)
 
     def __create_transcript_model(self, entry: GFF3Entry) -> TranscriptModel:
         is_canonical: bool = False
@@ -352,9 +392,8 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
 
         transcript_feature = TranscriptFeature(transcript=transcript)
 
-        if transcript.source_id in self.__transcript_protein_ref:
-            for pid in self.__transcript_protein_ref[transcript.source_id]:
-                transcript_feature.proteins.append(ProteinModel(source_id=pid))
+        for pid in entry.protein_ids:
+            transcript_feature.proteins.append(ProteinModel(source_id=pid))
 
         for exon in entry.children:
             transcript_feature.exons.append(self.__create_exon_model(exon))
@@ -442,8 +481,67 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
         )
         self.inc_tx_count(ExonModel, ETLOperation.SKIP, num_exons)
 
+    async def __submit_gene_features(
+        self, session, gene_features: list[GeneFeature]
+    ):
+        """
+        Insert the genes, transcripts, proteins, and exons of a batch of genes,
+        one statement per table; generated gene and transcript primary keys
+        (returned in record order) link the child records.
+        """
+        gene_pks = await self.submit_many(
+            session,
+            GeneModel,
+            [gene_feature.gene for gene_feature in gene_features],
+            return_primary_keys=True,
+        )
+
+        transcripts = []
+        for gene_feature, gene_pk in zip(gene_features, gene_pks):
+            for transcript_feature in gene_feature.transcripts:
+                transcript = transcript_feature.transcript
+                self.__set_common_attributes(transcript)
+                transcript.gene_id = gene_pk
+                transcripts.append(transcript)
+
+        # transcript primary keys are needed to link proteins and exons
+        if len(transcripts) > 0:
+            await self.submit_many(
+                session, TranscriptModel, transcripts, return_primary_keys=True
+            )
+
+        exons = []
+        proteins = []
+        for gene_feature, gene_pk in zip(gene_features, gene_pks):
+            exon_count = 0
+            for transcript_feature in gene_feature.transcripts:
+                transcript_id = transcript_feature.transcript.transcript_id
+                for protein in transcript_feature.proteins:
+                    protein.external_database_id = self.external_database_id
+                    protein.run_id = self.run_id
+                    protein.transcript_id = transcript_id
+                    proteins.append(protein)
+
+                for exon in transcript_feature.exons:
+                    self.__set_common_attributes(exon)
+                    exon.gene_id = gene_pk
+                    exon.transcript_id = transcript_id
+                    exons.append(exon)
+                    exon_count += 1
+
+            if self._verbose:
+                self.logger.info(
+                    f"Loaded Gene {gene_feature.gene.source_id} - "
+                    f"Transcripts = {len(gene_feature.transcripts)} | Exons = {exon_count}."
+                )
+
+        if len(proteins) > 0:
+            await self.submit_many(session, ProteinModel, proteins)
+        if len(exons) > 0:
+            await self.submit_many(session, ExonModel, exons)
+
     async def load(self, session, records: list[GeneFeature]):
-        gene_id = None
+        gene_features: list[GeneFeature] = []  # genes to insert
         for gene_feature in records:
             gene: GeneModel = gene_feature.gene
 
@@ -470,42 +568,12 @@ class EnsemblGFF3Loader(BaseFeatureLoaderPlugin):
             if self._params.verify_biotypes_only:
                 continue
 
-            gene_id = gene.source_id
             self.__set_common_attributes(gene)
-            gene_pk = await gene.submit(session)
-
-            transcripts = []
-            for transcript_feature in gene_feature.transcripts:
-                transcript = transcript_feature.transcript
-                self.__set_common_attributes(transcript)
-                transcript.gene_id = gene_pk
-                transcripts.append(transcript)
-
-            await TranscriptModel.submit_many(session, transcripts)
-
-            exons = []
-            proteins = []
-            exon_count = 0
-            for transcript_feature in gene_feature.transcripts:
-                for protein in transcript_feature.proteins:
-                    protein.external_database_id = self.external_database_id
-                    protein.run_id = self.run_id
-                    protein.transcript_id = transcript_feature.transcript.transcript_id
-                    proteins.append(protein)
-
-                for exon in transcript_feature.exons:
-                    self.__set_common_attributes(exon)
-                    exon.gene_id = gene_pk
-                    exon.transcript_id = transcript_feature.transcript.transcript_id
-                    exons.append(exon)
-                    exon_count += 1
+            gene_features.append(gene_feature)
 
-            if len(proteins) > 0:
-                await ProteinModel.submit_many(session, proteins)
-            await ExonModel.submit_many(session, exons)  # submit exons in batch
+        if len(gene_features) > 0:
+            await self.__submit_gene_features(session, gene_features)
 
-            if self._verbose:
-                self.logger.info(
-                    f"Loaded Gene {gene_id} - Transcripts = {len(gene_feature.transcripts)} | Exons = {exon_count}."
-                )
-        return self.create_checkpoint(record=records[-1].gene)
+        return self.create_checkpoint(
+            record=records[-1].gene, offset=records[-1].offset
+        )
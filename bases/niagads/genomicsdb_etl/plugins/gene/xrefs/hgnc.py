@@ -27,7 +27,7 @@ from niagads.etl.plugins.parameters import (
     ResumeCheckpoint,
 )
 from niagads.etl.plugins.registry import PluginRegistry
-from niagads.etl.plugins.types import ETLLoadStrategy
+from niagads.etl.plugins.types import ETLInsertMethod, ETLLoadStrategy
 from niagads.exceptions.core import ValidationError
 from niagads.genomicsdb_etl.plugins.gene.xrefs.mappings import HGNC_XREF_CATEGORY_MAP
 from niagads.genomicsdb_etl.plugins.common.mixins.parameters import (
@@ -82,6 +82,7 @@ metadata = PluginMetadata(
     operation=ETLOperation.INSERT,
     is_large_dataset=False,
     parameter_model=HGNCXRefLoaderParams,
+    insert_method=ETLInsertMethod.COPY,
 )
 
 
@@ -210,7 +211,9 @@ class HGNCXRefLoader(AbstractBasePlugin):
                 category = HGNC_XREF_CATEGORY_MAP[xref_label]
             except KeyError as err:
                 if self._params.verify_xref_keys:
-                    self.logger.warning(f"Invalid xref: {key}")
+                    self.logger.repeated_warning(
+                        "invalid xrefs", f"Invalid xref: {key}"
+                    )
                 else:
                     raise err
 
@@ -282,7 +285,7 @@ class HGNCXRefLoader(AbstractBasePlugin):
             )
             gene_xref_count += 1
 
-        await GeneXRef.submit_many(session, xrefs)
+        await self.submit_many(session, GeneXRef, xrefs)
         return self.create_checkpoint(record=entries[-1])
 
     async def on_run_complete(self):
@@ -14,7 +14,7 @@ from niagads.etl.plugins.base import AbstractBasePlugin
 from niagads.etl.plugins.metadata import PluginMetadata
 from niagads.etl.plugins.parameters import BasePluginParams, PathValidatorMixin
 from niagads.etl.plugins.registry import PluginRegistry
-from niagads.etl.plugins.types import ETLLoadStrategy
+from niagads.etl.plugins.types import ETLInsertMethod, ETLLoadStrategy
 from niagads.genomicsdb_etl.plugins.common.mixins.parameters import (
     ExternalDatabaseRefMixin,
 )
@@ -52,6 +52,8 @@ metadata = PluginMetadata(
     operation=ETLOperation.INSERT,
     is_large_dataset=False,
     parameter_model=RefSNPMergeHistoryLoaderParams,
+    pipelined=True,
+    insert_method=ETLInsertMethod.COPY,
 )
 
 
@@ -153,5 +155,5 @@ class RefSNPMergeHistory(AbstractBasePlugin):
                 )
             )
 
-        await RefSNPAlias.submit_many(session, aliases)
+        await self.submit_many(session, RefSNPAlias, aliases)
         return self.create_checkpoint(record=records[-1])
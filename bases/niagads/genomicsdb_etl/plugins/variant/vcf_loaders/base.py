@@ -1,5 +1,7 @@
-from typing import Dict, Iterator, Optional
+import os
+from typing import Dict, Iterator, List, Optional
 import cyvcf2
+import pysam
 from niagads.common.variant.models.ga4gh_vrs import Allele
 from niagads.common.variant.models.record import VariantRecord
 from niagads.common.variant.types import VariantClass
@@ -11,7 +13,7 @@ from niagads.genomicsdb_etl.plugins.common.bases.features import (
     BaseFeatureLoaderParams,
     BaseFeatureLoaderPlugin,
 )
-from niagads.vcf.types import VCFEntry
+from niagads.vcf.types import VCFRecord
 from pydantic import Field
 
 
@@ -25,7 +27,17 @@ class BaseVCFLoaderParams(BaseFeatureLoaderParams, PathValidatorMixin):
 
     seqrepo_service_url: Optional[str] = Field(
         default="http://localhost:5000/seqrepo",
-        description="URL to seqrepo service for GA4GH VRS",
+        description=(
+            "URL to seqrepo service for GA4GH VRS; or a local seqrepo directory "
+            "or faidx-indexed (bgzipped) FASTA file (e.g., fasta+/path/to/GRCh38.fa.gz) "
+            "for offline GA4GH VRS"
+        ),
+    )
+
+    sequence_cache_dir: Optional[str] = Field(
+        default=None,
+        description="directory for a persistent cache of refget accessions and reference sequence windows "
+        "fetched from seqrepo, shared by transform workers, partitions, and runs; not cached if not set",
     )
 
     seqrepo_batch_size: Optional[int] = Field(
@@ -60,16 +72,29 @@ class BaseVCFLoader(BaseFeatureLoaderPlugin):
         self._pk_generator = PrimaryKeyGenerator(
             genome_build=self._params.genome_build,
             seqrepo_service_url=self._params.seqrepo_service_url,
+            sequence_cache_dir=self._params.sequence_cache_dir,
             logger=self.logger if self._verbose else None,
         )
 
-    def extract(self) -> Iterator[VCFEntry]:
-        """Extract variants from VCF."""
+    def partitions(self) -> Optional[List[str]]:
+        """Chromosomes (contigs) with variants in the VCF; requires a tabix (.tbi or .csi) index."""
+        file = self._params.file
+        if not any(os.path.exists(f"{file}.{ext}") for ext in ("tbi", "csi")):
+            self.logger.warning(f"VCF file is not tabix indexed: {file}")
+            return None
+        with pysam.TabixFile(file) as index:
+            return list(index.contigs)
+
+    def _read_vcf(self, reader: cyvcf2.Reader) -> Iterator[cyvcf2.Variant]:
+        """Iterate over the VCF, or only the variants in `partition` if set."""
+        return reader(self.partition) if self.partition is not None else reader
+
+    def extract(self) -> Iterator[VCFRecord]:
+        """Extract variants from VCF; one record per ALT allele (see `VCFRecord`)."""
         reader = cyvcf2.Reader(self._params.file)
         try:
-            for entry in reader:
-                for alt in entry.ALT:
-                    yield VCFEntry.from_cyvcf2_variant(entry, alt_allele=alt)
+            for entry in self._read_vcf(reader):
+                yield from VCFRecord.from_cyvcf2_site(entry)
 
         finally:
             reader.close()
@@ -77,9 +102,50 @@ class BaseVCFLoader(BaseFeatureLoaderPlugin):
     def get_record_id(self, record: Variant) -> str:
         return record.id
 
+    def transform_worker_init_args(self) -> tuple:
+        return (
+            self._params.genome_build,
+            self._params.seqrepo_service_url,
+            self._params.sequence_cache_dir,
+        )
+
+    @staticmethod
+    def initialize_transform_worker(
+        genome_build: GenomeBuild,
+        seqrepo_service_url: str,
+        sequence_cache_dir: Optional[str] = None,
+    ) -> PrimaryKeyGenerator:
+        """Create a primary key generator for each transform worker process."""
+        return PrimaryKeyGenerator(
+            genome_build=genome_build,
+            seqrepo_service_url=seqrepo_service_url,
+            sequence_cache_dir=sequence_cache_dir,
+        )
+
     def _generate_variant_identifier_record(
-        self, entry: VCFEntry, require_validation: bool = True
+        self, entry: VCFRecord, require_validation: bool = True
     ):
+        return self._build_variant_identifier_record(
+            self._pk_generator,
+            entry,
+            skip_normalization=self._skip_normalization,
+            require_validation=require_validation,
+            logger=self.logger if self._verbose else None,
+        )
+
+    @staticmethod
+    def _build_variant_identifier_record(
+        pk_generator: PrimaryKeyGenerator,
+        entry: VCFRecord,
+        skip_normalization: bool = False,
+        require_validation: bool = True,
+        logger=None,
+    ) -> VariantRecord:
+        """
+        Build a variant record with GA4GH VRS allele and primary key.
+
+        Static so that it can be run by plugin transform workers in other processes.
+        """
         positional_id = f"{entry.chrom}:{entry.pos}:{entry.ref}:{entry.alt}"
         record: VariantRecord = VariantRecord.from_positional_id(positional_id)
         record.ref_snp_id = (
@@ -87,18 +153,18 @@ class BaseVCFLoader(BaseFeatureLoaderPlugin):
         )
 
         # generate the GA4GH VRS allele
-        ga4gh_allele = self._pk_generator.ga4gh_service.variant_to_vrs_allele(
+        ga4gh_allele = pk_generator.ga4gh_service.variant_to_vrs_allele(
             record,
-            normalize=not self._skip_normalization,
+            normalize=not skip_normalization,
             require_validation=require_validation,
             as_json=False,
         )
 
         # if a short indel use the normalized GA4GH VRS allele to generate the normalized positional id
-        if not self._skip_normalization and record.variant_class.is_short_indel():
+        if not skip_normalization and record.variant_class.is_short_indel():
             try:
                 record.normalized_positional_id = (
-                    self._pk_generator.ga4gh_service.allele_to_positional_variant(
+                    pk_generator.ga4gh_service.allele_to_positional_variant(
                         ga4gh_allele
                     )
                 )
@@ -107,12 +173,12 @@ class BaseVCFLoader(BaseFeatureLoaderPlugin):
         else:
             record.normalized_positional_id = positional_id
 
-        if self._verbose:
-            self.logger.debug(
+        if logger is not None:
+            logger.debug(
                 f"{positional_id} | {record.variant_class} | {ga4gh_allele.model_dump(exclude_none=True)}"
             )
 
         record.ga4gh_vrs = Allele(**ga4gh_allele.model_dump(exclude_none=True))
-        self._pk_generator.set_primary_key(record, require_validation=False)
+        pk_generator.set_primary_key(record, require_validation=False)
 
         return record
@@ -18,13 +18,13 @@ from niagads.database.genomicsdb.schema.variant.documents import Variant
 from niagads.etl.plugins.metadata import PluginMetadata
 from niagads.etl.plugins.parameters import ResumeCheckpoint
 from niagads.etl.plugins.registry import PluginRegistry
-from niagads.etl.plugins.types import ETLLoadStrategy
+from niagads.etl.plugins.types import ETLInsertMethod, ETLLoadStrategy
 
 from niagads.genomicsdb_etl.plugins.variant.vcf_loaders.base import (
     BaseVCFLoader,
     BaseVCFLoaderParams,
 )
-from niagads.vcf.types import VCFEntry
+from niagads.vcf.types import VCFRecord
 from sqlalchemy.ext.asyncio import AsyncSession
 
 metadata = PluginMetadata(
@@ -35,6 +35,9 @@ metadata = PluginMetadata(
     operation=ETLOperation.INSERT,
     is_large_dataset=True,
     parameter_model=BaseVCFLoaderParams,
+    pipelined=True,
+    transform_workers=4,  # override with --transform-workers
+    insert_method=ETLInsertMethod.COPY,
 )
 
 
@@ -42,6 +45,53 @@ class dbSNPRecord(VariantRecord):
     allele_frequency: Optional[dict] = None
 
 
+def parse_allele_frequencies(
+    freq_values: list[Optional[str]], allele_indexes: list[int]
+) -> list[Optional[dict]]:
+    """
+    Parse the ALFA `FREQ` INFO values of a batch of VCF records.
+
+    `FREQ` values have the form `study:ref_freq,alt1_freq,...|study:...`,
+    where missing frequencies are `.`.  Each distinct `FREQ` value is split
+    only once, i.e., once per site for the consecutive (per ALT allele)
+    records of a multi-allelic site.
+
+    Args:
+        freq_values (list[Optional[str]]): `FREQ` value of each record (None if not annotated).
+        allele_indexes (list[int]): allele index of each record (1 = first ALT allele).
+
+    Returns:
+        list[Optional[dict]]: `{study: allele frequency}` for each record (the
+            `allele_frequency` JSONB payload); studies without a frequency for the
+            allele are skipped; None if the record has no `FREQ` annotation.
+
+    Raises:
+        ValueError: if a frequency is not a number or `.`.
+    """
+    frequencies = []
+    previous_value, study_frequencies = None, []
+    for freq_value, allele_index in zip(freq_values, allele_indexes):
+        if freq_value is None:
+            frequencies.append(None)
+            continue
+        if freq_value != previous_value:
+            previous_value = freq_value
+            study_frequencies = [
+                (study, values.split(","))
+                for study, _, values in (
+                    item.partition(":") for item in freq_value.split("|")
+                )
+            ]
+        frequencies.append(
+            {
+                study: float(values[allele_index])
+                for study, values in study_frequencies
+                if allele_index < len(values) and values[allele_index] != "."
+            }
+        )
+    return frequencies
+
+
 @PluginRegistry.register(metadata)
 class dbSNPVCFLoader(BaseVCFLoader):
 
@@ -56,63 +106,74 @@ class dbSNPVCFLoader(BaseVCFLoader):
         super().__init__(params, name, log_path, debug, verbose)
         self._skip_normalization = True
 
-    def __parse_allele_frequencies(self, freq_str: str, allele_index: int):
-
-        def get_value(values):
-            try:
-                freq_value = values[allele_index]
-                return None if freq_value == "." else float(freq_value)
-            except IndexError:
-                return None
-
-        frequencies = {}
-        for population_frequencies in freq_str.split("|"):
-            pop, pop_freq_str = population_frequencies.split(":")
-            pop_allele_freq = get_value(pop_freq_str.split(","))
-            if pop_allele_freq is not None:
-                frequencies[pop] = pop_allele_freq
-
-        return frequencies
+    def extract(self) -> Iterator[list[VCFRecord]]:
+        """
+        Extract variants from VCF in seqrepo_batch_size batches.
 
-    def extract(self) -> Iterator[list[VCFEntry]]:
-        """Extract variants from VCF in seqrepo_batch_size batches."""
+        The ALFA `FREQ` INFO annotations of each batch are parsed together
+        (see `parse_allele_frequencies`).
+        """
         reader = cyvcf2.Reader(self._params.file)
         batch = []
+        allele_indexes = []
         try:
-            for entry in reader:
+            for entry in self._read_vcf(reader):
+                records = VCFRecord.from_cyvcf2_site(entry, info_keys=["FREQ"])
                 # index starts at 1 b/c ref is 0 in lists in INFO annotations
-                for allele_index, alt in enumerate(entry.ALT, start=1):
-                    vcf_entry = VCFEntry.from_cyvcf2_variant(entry, alt_allele=alt)
-                    if "FREQ" in vcf_entry.info:  # ALFA frequencies
-                        vcf_entry.info["FREQ"] = self.__parse_allele_frequencies(
-                            vcf_entry.info["FREQ"], allele_index
-                        )
-                    else:
-                        vcf_entry.info["FREQ"] = None
-                    batch.append(vcf_entry)
+                for allele_index, record in enumerate(records, start=1):
+                    batch.append(record)
+                    allele_indexes.append(allele_index)
 
                     if len(batch) >= self._params.seqrepo_batch_size:
-                        yield batch
+                        yield self.__set_allele_frequencies(batch, allele_indexes)
                         batch = []
+                        allele_indexes = []
 
             # yield residual batch
             if batch:
-                yield batch
+                yield self.__set_allele_frequencies(batch, allele_indexes)
 
         finally:
             reader.close()
 
-    async def transform(self, entries: list[VCFEntry]) -> list[dbSNPRecord]:
+    @staticmethod
+    def __set_allele_frequencies(
+        batch: list[VCFRecord], allele_indexes: list[int]
+    ) -> list[VCFRecord]:
+        """Replace the raw `FREQ` INFO values with `{study: allele frequency}`."""
+        frequencies = parse_allele_frequencies(
+            [entry.get_info("FREQ") for entry in batch], allele_indexes
+        )
+        for entry, allele_frequencies in zip(batch, frequencies):
+            entry.set_info("FREQ", allele_frequencies)
+        return batch
+
+    @staticmethod
+    def _create_dbsnp_record(pk_generator, entry: VCFRecord, logger=None) -> dbSNPRecord:
+        record: dbSNPRecord = dbSNPRecord(
+            **BaseVCFLoader._build_variant_identifier_record(
+                pk_generator,
+                entry,
+                skip_normalization=True,
+                require_validation=False,  # trust dbSNP
+                logger=logger,
+            ).model_dump()
+        )
+        record.allele_frequency = entry.get_info("FREQ")
+        return record
+
+    @staticmethod
+    def transform_worker(pk_generator, entries: list[VCFRecord]) -> list[dbSNPRecord]:
+        """Transform VCF variants to Variant records (with standardized IDs) in a worker process."""
+        return [dbSNPVCFLoader._create_dbsnp_record(pk_generator, e) for e in entries]
+
+    async def transform(self, entries: list[VCFRecord]) -> list[dbSNPRecord]:
         """Transform VCF variants to Variant records (with standardized IDs) concurrently."""
 
-        async def process_entry(entry: VCFEntry) -> dbSNPRecord:
-            record: dbSNPRecord = dbSNPRecord(
-                **self._generate_variant_identifier_record(
-                    entry, require_validation=False  # trust dbSNP
-                ).model_dump()
+        async def process_entry(entry: VCFRecord) -> dbSNPRecord:
+            return self._create_dbsnp_record(
+                self._pk_generator, entry, self.logger if self._verbose else None
             )
-            record.allele_frequency = entry.info["FREQ"]
-            return record
 
         return await asyncio.gather(*[process_entry(entry) for entry in entries])
 
@@ -137,7 +198,8 @@ class dbSNPVCFLoader(BaseVCFLoader):
 
         for record in records:
             if self.__is_duplicate(record):
-                self.logger.warning(
+                self.logger.repeated_warning(
+                    "duplicate variants skipped",
                     f"Skipping Duplicate Variant: NIAGADS_ID = {record.id}; RECORD = {record.positional_id} / {record.ref_snp_id} / DUPLICATES {self._current_bin_variants[record.id]}"
                 )
                 self.inc_tx_count(Variant, ETLOperation.INSERT)
@@ -157,5 +219,5 @@ class dbSNPVCFLoader(BaseVCFLoader):
                 self._current_bin_variants = {}
             self._current_bin_variants[record.id] = record.ref_snp_id
 
-        await Variant.submit_many(session, variants)
+        await self.submit_many(session, Variant, variants)
         return self.create_checkpoint(record=records[-1])
@@ -6,6 +6,7 @@ from niagads.arg_parser.core import (
     json_type,
 )
 from niagads.common.types import ProcessStatus
+from niagads.etl.plugins.profiling import ProfileMode
 from niagads.etl.plugins.registry import PluginRegistry
 from niagads.etl.pipeline.manager import PipelineManager
 from niagads.etl.types import ETLExecutionMode
@@ -50,6 +51,10 @@ class PipelineRunner:
             manager.resume_point = args.resume_at
         if args.resume_checkpoint:
             manager.checkpoint = args.resume_checkpoint
+        if args.force:
+            manager.force = True
+        if args.profile:
+            manager.profile = args.profile
 
         if args.plan_only:
             manager.print_plan()
@@ -103,6 +108,17 @@ async def main():
         type=str,
         help="Resume checkpoint for the resume-at task: 'line=N' or 'id=VALUE'",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rerun tasks even if their inputs and params are unchanged since their last successful run",
+    )
+    parser.add_argument(
+        "--profile",
+        type=case_insensitive_enum_type(ProfileMode),
+        help="Profile plugin task runs: SAMPLE (low-overhead sampling; collapsed stacks for flamegraphs) "
+        "or CPROFILE (deterministic, for short runs); hotspots are reported in each plugin log",
+    )
     parser.add_argument("--log-file", type=str, help="pipeline log file name")
     parser.add_argument(
         "--param",
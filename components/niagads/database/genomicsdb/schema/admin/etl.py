@@ -12,8 +12,9 @@ from niagads.common.types import ETLOperation, ProcessStatus
 from niagads.database.genomicsdb.schema.admin.base import AdminTableBase
 from niagads.database.genomicsdb.schema.admin.helpers import etlrun_fk_column
 from niagads.database.helpers import datetime_column, enum_column, enum_constraint
-from sqlalchemy import String, Text
+from sqlalchemy import String, Text, select
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -38,9 +39,38 @@ class ETLRun(AdminTableBase):
     status: Mapped[str] = enum_column(ProcessStatus, nullable=False)
     operation: Mapped[str] = enum_column(ETLOperation, nullable=False)
     is_test_run: Mapped[bool] = mapped_column(default=False)  # python default only
+    fingerprint: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True, index=True
+    )  # pipeline task fingerprint (plugin, params, and inputs)
 
     # Timing + metrics
     start_time: Mapped[datetime] = datetime_column()
     end_time: Mapped[datetime] = datetime_column(nullable=True)
     rows_processed: Mapped[int] = mapped_column(server_default="0")
     run_id: Mapped[int] = etlrun_fk_column(nullable=True)
+
+    @classmethod
+    async def find_successful_run(
+        cls, session: AsyncSession, fingerprint: str
+    ) -> Optional[int]:
+        """
+        Find the most recent successful, committed run with the given task fingerprint.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session.
+            fingerprint (str): pipeline task fingerprint.
+
+        Returns:
+            Optional[int]: the etl_run_id of the matching run, or None.
+        """
+        result = await session.execute(
+            select(cls.etl_run_id)
+            .where(
+                cls.fingerprint == fingerprint,
+                cls.status == ProcessStatus.SUCCESS,
+                cls.is_test_run.is_(False),
+            )
+            .order_by(cls.etl_run_id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
@@ -1,10 +1,89 @@
-from datetime import datetime
-from typing import Self
-from sqlalchemy import exists, func, select
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Self, Tuple, Union
+
+from asyncpg import Range as AsyncPGRange
+from sqlalchemy import ARRAY, Column, exists, func, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.exc import ProgrammingError
 
+# PostgreSQL COPY text format special characters
+_COPY_TEXT_NULL = "\\N"
+_COPY_TEXT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _array_literal(value: Any) -> str:
+    """
+    Format a (bind processed) ARRAY column value as a PostgreSQL array
+    literal, e.g., ["a", None, 'b"c'] -> {"a",NULL,"b\\"c"}.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return "{" + ",".join(_array_literal(item) for item in value) + "}"
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    # quote all elements (e.g., empty strings, commas, braces, `NULL`)
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _copy_text_value(value: Any, is_array: bool = False) -> str:
+    """
+    Format a (bind processed) column value as a field in a
+    PostgreSQL COPY text format row.
+    """
+    if value is None:
+        return _COPY_TEXT_NULL
+    if is_array:
+        return _array_literal(value).translate(_COPY_TEXT_ESCAPES)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, AsyncPGRange):
+        if value.isempty:
+            return "empty"
+        lower = "" if value.lower is None else value.lower
+        upper = "" if value.upper is None else value.upper
+        return (
+            f"{'[' if value.lower_inc else '('}{lower},"
+            f"{upper}{']' if value.upper_inc else ')'}"
+        )
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = "\\x" + bytes(value).hex()
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif hasattr(value, "path"):  # sqlalchemy_utils Ltree
+        value = value.path
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+
+def _python_default(column: Column) -> Any:
+    """evaluate a column's Python-side (scalar or callable) default, if any"""
+    default = column.default
+    if default is None:
+        return None
+    if default.is_scalar:
+        return default.arg
+    if default.is_callable:
+        return default.arg(None)
+    return None
+
+
+def _is_server_generated(column: Column) -> bool:
+    """column value is filled in by the database if omitted from the insert"""
+    return (
+        column.server_default is not None
+        or column is column.table.autoincrement_column
+        or (column.default is not None and column.default.is_sequence)
+    )
+
 
 class TransactionTableMixin(DeclarativeBase):
     __abstract__ = True
@@ -58,6 +137,176 @@ class TransactionTableMixin(DeclarativeBase):
         session.add_all(records)
         await session.flush()
 
+    @classmethod
+    def __bulk_insert_columns(cls, records: list[Self]) -> List[Tuple[str, Column]]:
+        """
+        Determine the columns to write for a batch of records inserted
+        outside of the ORM unit of work (COPY or Core insert).
+
+        Server-generated columns (e.g., serial primary keys, timestamps with a
+        server default) are omitted when no record sets a value.
+
+        Returns:
+            list of (attribute key, column) tuples
+        """
+        columns = []
+        for attr in cls.__mapper__.column_attrs:
+            column: Column = attr.columns[0]
+            if column.table is not cls.__table__:
+                continue
+
+            values_set = [getattr(r, attr.key) is not None for r in records]
+            if _is_server_generated(column):
+                if not any(values_set):
+                    continue
+                if not all(values_set):
+                    raise ValueError(
+                        f"Cannot bulk insert into {cls.table_name()}: column '{column.name}' "
+                        "has a server-side default but is only set for some records"
+                    )
+
+            columns.append((attr.key, column))
+        return columns
+
+    @classmethod
+    def __bulk_insert_rows(cls, records: list[Self]) -> List[Dict[str, Any]]:
+        """
+        Extract {column key: value} parameters for a batch of records; values
+        not set fall back to the column's Python-side default, if any.
+        """
+        columns = cls.__bulk_insert_columns(records)
+        rows = []
+        for record in records:
+            row = {}
+            for key, column in columns:
+                value = getattr(record, key)
+                if value is None:
+                    value = _python_default(column)
+                row[column.key] = value
+            rows.append(row)
+        return rows
+
+    @classmethod
+    async def copy_many(cls, session: AsyncSession, records: list[Self]) -> int:
+        """
+        Insert records using PostgreSQL COPY on the session's connection.
+
+        Bypasses the ORM unit of work (no identity map, no flush events), so
+        records are not attached to the session, generated primary keys are
+        not fetched, and the after flush transaction tally is not triggered;
+        callers are responsible for counting the returned rows.  The COPY runs
+        in the session's current transaction, so commit / rollback behave as
+        for `submit_many`.
+
+        Values are converted with the same column type bind processors as the
+        ORM (e.g., Range -> INT4RANGE, dict -> JSONB, Ltree, pgvector) and
+        sent in COPY text format; ARRAY column values are sent as array literals.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session.
+            records (list[Self]): unsaved instances of this table.
+
+        Returns:
+            int: number of rows copied
+        """
+        if not records:
+            raise ValueError("Record list is empty; nothing to submit")
+
+        cls.verify_record_type(records)
+
+        rows = cls.__bulk_insert_rows(records)
+        columns = [cls.__table__.columns[key] for key in rows[0]]
+
+        connection = await session.connection()
+        dialect = connection.dialect
+        bind_processors = [
+            column.type.dialect_impl(dialect).bind_processor(dialect)
+            for column in columns
+        ]
+        is_array = [isinstance(column.type, ARRAY) for column in columns]
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(
+                "\t".join(
+                    _copy_text_value(
+                        value if process is None else process(value), array
+                    )
+                    for value, process, array in zip(
+                        row.values(), bind_processors, is_array
+                    )
+                )
+            )
+            buffer.write("\n")
+
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not driver_connection.is_in_transaction():
+            # the asyncpg adapter opens the session transaction lazily;
+            # make sure the COPY does not run in autocommit mode
+            await connection.execute(text("SELECT 1"))
+
+        status = await driver_connection.copy_to_table(
+            cls.__table__.name,
+            schema_name=cls.__table__.schema,
+            columns=[column.name for column in columns],
+            source=io.BytesIO(buffer.getvalue().encode("utf-8")),
+            format="text",
+        )
+
+        # status is the command tag, e.g., "COPY 5000"
+        return int(status.split()[-1])
+
+    @classmethod
+    async def insert_many_core(
+        cls,
+        session: AsyncSession,
+        records: list[Self],
+        return_primary_keys: bool = False,
+    ) -> Union[int, list]:
+        """
+        Insert records with a Core `INSERT` executemany on the session's connection.
+
+        Sits between `submit_many` (ORM) and `copy_many` (COPY): the ORM unit of
+        work, identity map, and flush events are bypassed, but the statement is
+        run through SQLAlchemy's "insertmanyvalues" batching, so primary keys
+        can be returned.  As with `copy_many`, records are not attached to the
+        session and callers are responsible for counting the inserted rows.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session.
+            records (list[Self]): unsaved instances of this table.
+            return_primary_keys (bool, optional): fetch the generated primary
+                keys (in record order) and set them on the records.
+                Defaults to False.
+
+        Returns:
+            Union[int, list]: list of primary key values if `return_primary_keys`,
+                otherwise the number of rows inserted
+        """
+        if not records:
+            raise ValueError("Record list is empty; nothing to submit")
+
+        cls.verify_record_type(records)
+        rows = cls.__bulk_insert_rows(records)
+
+        statement = insert(cls.__table__)
+        if not return_primary_keys:
+            result = await session.execute(statement, rows)
+            return result.rowcount if result.rowcount >= 0 else len(rows)
+
+        pk_attr = cls.__mapper__.get_property_by_column(
+            cls.__mapper__.primary_key[0]
+        )
+        statement = statement.returning(
+            cls.__mapper__.primary_key[0], sort_by_parameter_order=True
+        )
+        result = await session.execute(statement, rows)
+        primary_keys = result.scalars().all()
+        for record, pk in zip(records, primary_keys):
+            setattr(record, pk_attr.key, pk)
+        return primary_keys
+
     @classmethod
     async def detach_many(cls, session: AsyncSession, records: list[Self]):
         """
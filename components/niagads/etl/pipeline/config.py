@@ -3,7 +3,7 @@ from typing import Optional, Dict, Any, List
 
 from niagads.settings.core import CustomSettings
 from niagads.utils.regular_expressions import RegularExpressions
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from niagads.enums.core import CaseInsensitiveEnum
 
 
@@ -51,6 +51,50 @@ class ParallelMode(CaseInsensitiveEnum):
     PROCESS = auto()
 
 
+class FanOutSource(CaseInsensitiveEnum):
+    """
+    Items a fan-out task is split over:
+    - GLOB:       files matching `pattern`
+    - TABIX:      contigs (regions) in the tabix index of the `pattern` file
+    - CHROMOSOME: human chromosomes (1-22, X, Y, M)
+    """
+
+    GLOB = auto()
+    TABIX = auto()
+    CHROMOSOME = auto()
+
+
+class FanOutConfig(BaseModel):
+    """
+    Fan-out config: run a task as one sub-task per item, with bounded concurrency.
+    The task succeeds only if all of its sub-tasks succeed.
+    """
+
+    source: FanOutSource = Field(..., description="Items to split the task over")
+    pattern: Optional[str] = Field(
+        None,
+        description="File glob (GLOB) or tabix indexed file (TABIX); supports ${...} interpolation",
+    )
+    variable: str = Field(
+        "fan_out",
+        description="Name of the interpolation variable (${variable}) holding each sub-task's item",
+    )
+    exclude: Optional[List[str]] = Field(
+        None, description="Items to skip, e.g., ['M'] or ['chrUn_gl000220']"
+    )
+    max_concurrency: int = Field(
+        4,
+        ge=1,
+        description="Max number of sub-tasks running at once; the task `resources` are reserved for each",
+    )
+
+    @model_validator(mode="after")
+    def require_pattern(self):
+        if self.source != FanOutSource.CHROMOSOME and not self.pattern:
+            raise ValueError(f"Fan-out over {self.source} must define 'pattern'")
+        return self
+
+
 class TaskConfig(BaseModel):
     """
     Task config. Default type is 'plugin'. Other types do not use DB.
@@ -69,6 +113,49 @@ class TaskConfig(BaseModel):
     deprecated: Optional[bool] = Field(False, description="Mark task deprecated")
     comment: Optional[str] = Field(None, description="Task annotation/comment")
 
+    # Scheduling
+    depends_on: Optional[List[str]] = Field(
+        None,
+        description="Tasks (`Stage.Task`) or stages (`Stage`) that must complete before this task starts; "
+        "if not set, the task waits for the previous stage (or previous task in a sequential stage)",
+    )
+    resources: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Resources held while the task runs, e.g., {'db_connections': 4, 'cpu': 8, 'memory_gb': 32}; "
+        "limited by the pipeline-level `resources` capacities",
+    )
+    estimated_minutes: Optional[float] = Field(
+        None, gt=0, description="Estimated runtime, used to report the critical path"
+    )
+
+    fan_out: Optional[FanOutConfig] = Field(
+        None,
+        description="Split the task into parallel sub-tasks over input files, tabix regions, or chromosomes",
+    )
+
+    # Incremental runs
+    inputs: Optional[List[str]] = Field(
+        None,
+        description="Input file glob patterns included in the task fingerprint "
+        "(in addition to file paths found in the task params)",
+    )
+    hash_inputs: bool = Field(
+        False,
+        description="Fingerprint input file contents (SHA-256) instead of size and modification time",
+    )
+
+    # Retries
+    timeout_seconds: Optional[float] = Field(
+        None, gt=0, description="Max runtime of each attempt; the task is cancelled (and retried) on timeout"
+    )
+    retries: int = Field(0, ge=0, description="Number of times to retry a failed task")
+    retry_backoff_seconds: float = Field(
+        30, ge=0, description="Initial delay before a retry; doubles after each failed attempt (jittered)"
+    )
+    retry_max_backoff_seconds: float = Field(
+        600, ge=0, description="Max delay before a retry"
+    )
+
     # Non-plugin fields (shell/file/validation/notify)
     command: Optional[str] = Field(None, description="Shell command (type='shell')")
     path: Optional[str] = Field(None, description="File path (type='file')")
@@ -86,8 +173,9 @@ class TaskConfig(BaseModel):
 
 class StageConfig(BaseModel):
     """
-    Stage config — barrier semantics:
-    - If any task fails in the stage, the stage fails and the pipeline stops.
+    Stage config — barrier semantics by default:
+    - Tasks wait for all tasks in the previous stage, unless they declare `depends_on`.
+    - If a task fails, tasks that depend on it (directly or through a barrier) are not run.
     """
 
     name: str = Field(..., description="Stage name")
@@ -95,7 +183,7 @@ class StageConfig(BaseModel):
         ParallelMode.NONE, description="Execution mode for tasks"
     )
     max_concurrency: Optional[int] = Field(
-        None, ge=1, description="Max concurrency when parallel_mode='async'"
+        None, ge=1, description="Max concurrent tasks in this stage when parallel_mode is THREAD or PROCESS"
     )
     tasks: List[TaskConfig] = Field(..., description="Tasks in this stage")
     skip: bool = Field(False, description="Skip this stage")
@@ -107,12 +195,23 @@ class PipelineConfig(BaseModel):
     """
     Pipeline config.
     - params are pipeline-level defaults; tasks can reference via ${...} interpolation.
+    - max_concurrency and resources cap the tasks running at once, across stages.
     """
 
     params: Dict[str, Any] = Field(
         default_factory=dict, description="Pipeline-level parameters"
     )
     stages: List[StageConfig] = Field(..., description="Pipeline stages")
+    max_concurrency: Optional[int] = Field(
+        None, ge=1, description="Max number of tasks running at once (across stages)"
+    )
+    resources: Dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Capacity of each resource requested by tasks, "
+            "e.g., {'db_connections': 20, 'cpu': 32, 'memory_gb': 256}"
+        ),
+    )
     comment: Optional[str] = Field(
         None, description="Pipeline-level annotation/comment"
     )
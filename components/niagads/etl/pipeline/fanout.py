@@ -0,0 +1,94 @@
+"""
+Expansion of fan-out pipeline tasks.
+
+A task with a `fan_out` config is run as one sub-task per item (input file,
+tabix region, or chromosome).  The item is added to the interpolation scope
+of the sub-task as `${<variable>}`, e.g.:
+
+    {
+        "name": "load_dbsnp",
+        "plugin": "dbSNPVCFLoader",
+        "params": {"file": "${dbsnp_vcf}", "partition": "${chromosome}"},
+        "fan_out": {"source": "tabix", "pattern": "${dbsnp_vcf}",
+                    "variable": "chromosome", "max_concurrency": 8}
+    }
+"""
+
+import glob
+import os
+from typing import Any, Dict, List, Tuple
+
+from niagads.etl.pipeline.config import FanOutConfig, FanOutSource, TaskConfig
+from niagads.etl.utils import interpolate_params
+from niagads.genome_reference.human import HumanGenome
+
+
+def expand_fan_out(
+    fan_out: FanOutConfig, scope: Dict[str, Any]
+) -> List[Tuple[str, str]]:
+    """
+    List the items a fan-out task is split over.
+
+    Args:
+        fan_out (FanOutConfig): fan-out config.
+        scope (Dict[str, Any]): pipeline parameters, for interpolation of the pattern.
+
+    Returns:
+        List[Tuple[str, str]]: (label, value) pairs; the label (file basename
+            for GLOB, otherwise the value) names the sub-task.
+
+    Raises:
+        FileNotFoundError: if the tabix indexed file does not exist.
+    """
+    pattern = (
+        interpolate_params({"pattern": fan_out.pattern}, scope)["pattern"]
+        if fan_out.pattern
+        else None
+    )
+
+    match fan_out.source:
+        case FanOutSource.GLOB:
+            items = [
+                (os.path.basename(path), path) for path in sorted(glob.glob(pattern))
+            ]
+        case FanOutSource.TABIX:
+            import pysam
+
+            if not os.path.exists(pattern):
+                raise FileNotFoundError(f"Fan-out tabix file not found: {pattern}")
+            with pysam.TabixFile(pattern) as reader:
+                items = [(contig, contig) for contig in reader.contigs]
+        case FanOutSource.CHROMOSOME:
+            # values (`1`, ..., `X`, `Y`, `M`) w/out the `chr` prefix of the member names
+            items = [(chromosome.value, chromosome.value) for chromosome in HumanGenome]
+
+    exclude = set(fan_out.exclude or [])
+    return [(label, value) for label, value in items if value not in exclude]
+
+
+def fan_out_task(
+    task: TaskConfig, label: str, value: str, scope: Dict[str, Any]
+) -> Tuple[TaskConfig, Dict[str, Any]]:
+    """
+    Create the sub-task of a fan-out task for one item.
+
+    The sub-task is named `<task>[<label>]`; shell commands and file paths are
+    interpolated here, plugin params when the sub-task is run.
+
+    Args:
+        task (TaskConfig): the fan-out task.
+        label (str): item label.
+        value (str): item value.
+        scope (Dict[str, Any]): pipeline parameters.
+
+    Returns:
+        Tuple[TaskConfig, Dict[str, Any]]: the sub-task and its interpolation scope.
+    """
+    scope = {**scope, task.fan_out.variable: value}
+    update = {"name": f"{task.name}[{label}]", "fan_out": None}
+    for field in ("command", "path"):
+        if getattr(task, field):
+            update[field] = interpolate_params({field: getattr(task, field)}, scope)[
+                field
+            ]
+    return task.model_copy(update=update), scope
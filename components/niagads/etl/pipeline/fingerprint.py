@@ -0,0 +1,120 @@
+"""
+Content-addressed fingerprints for pipeline tasks.
+
+A task fingerprint is a SHA-256 digest of the plugin name and version, the
+resolved plugin parameters, and the state of the task's input files (size
+and modification time, or a content hash).  It is recorded with the task's
+ETLRun, so that a rerun of an unchanged task can be skipped.
+"""
+
+import functools
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+# parameters that do not affect the result of a (successful) run
+VOLATILE_PARAMS = {
+    "mode",
+    "commit",
+    "database_uri",
+    "resume_from",
+    "resume_after",
+    "resume_offset",
+    "fingerprint",
+    "reference_cache_dir",
+    "sequence_cache_dir",
+    "metrics_file",
+    "prometheus_textfile",
+    "pushgateway_url",
+    "profile",
+    "profile_output",
+    "profile_top_n",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    """SHA-256 of a file's contents (cached while its size and mtime are unchanged)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _find_input_files(value: Any) -> List[str]:
+    """Parameter values (incl. nested in lists / dicts) that are existing files."""
+    if isinstance(value, str):
+        return [value] if os.path.isfile(value) else []
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return [path for item in value for path in _find_input_files(item)]
+    return []
+
+
+def file_signature(path: str, hash_contents: bool = False) -> Dict[str, Any]:
+    """
+    Signature of an input file.
+
+    Args:
+        path (str): file path.
+        hash_contents (bool, optional): use a SHA-256 of the contents instead of
+            the modification time. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: path, size, and mtime (ns) or sha256.
+    """
+    stat = os.stat(path)
+    signature = {"path": os.path.abspath(path), "size": stat.st_size}
+    if hash_contents:
+        signature["sha256"] = _file_digest(
+            signature["path"], stat.st_size, stat.st_mtime_ns
+        )
+    else:
+        signature["mtime_ns"] = stat.st_mtime_ns
+    return signature
+
+
+def task_fingerprint(
+    plugin: str,
+    version: Optional[str],
+    params: Dict[str, Any],
+    inputs: Optional[List[str]] = None,
+    hash_inputs: bool = False,
+) -> str:
+    """
+    Fingerprint a plugin task.
+
+    Input files are the parameter values that are paths to existing files,
+    plus the files matching the `inputs` glob patterns.
+
+    Args:
+        plugin (str): plugin name.
+        version (Optional[str]): plugin version.
+        params (Dict[str, Any]): resolved (interpolated) plugin parameters.
+        inputs (Optional[List[str]], optional): additional input file glob patterns.
+            Defaults to None.
+        hash_inputs (bool, optional): fingerprint input file contents instead of
+            their modification times. Defaults to False.
+
+    Returns:
+        str: hex digest.
+    """
+    stable_params = {k: v for k, v in params.items() if k not in VOLATILE_PARAMS}
+
+    files = set(_find_input_files(stable_params))
+    for pattern in inputs or []:
+        files.update(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+    content = {
+        "plugin": plugin,
+        "version": version,
+        "params": stable_params,
+        "inputs": [file_signature(path, hash_inputs) for path in sorted(files)],
+    }
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode()
+    ).hexdigest()
@@ -2,13 +2,26 @@
 # and logged in a try block
 import asyncio
 import json
+import logging
+import multiprocessing
 import os
+import random
 import traceback
+from collections import Counter
 from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, List, Optional, Tuple
 
 from niagads.common.core import ComponentBaseMixin
 from niagads.common.types import ProcessStatus
+from niagads.database.genomicsdb.schema.admin.etl import ETLRun
+from niagads.database.session import DatabaseSessionManager
+from niagads.etl.plugins.profiling import ProfileMode
+from niagads.etl.plugins.types import (
+    ETLRunStatus,
+    ResumeCheckpoint,
+    TelemetrySummary,
+)
 from niagads.etl.types import ETLExecutionMode
 from niagads.etl.pipeline.config import (
     ParallelMode,
@@ -18,20 +31,81 @@ from niagads.etl.pipeline.config import (
     TaskConfig,
     TaskType,
 )
+from niagads.etl.pipeline.fanout import expand_fan_out, fan_out_task
 from niagads.etl.pipeline.filters import PipelineFilters
+from niagads.etl.pipeline.fingerprint import task_fingerprint
+from niagads.etl.pipeline.scheduler import ResourcePool, TaskGraph, TaskNode
 from niagads.etl.pipeline.selectors import StageTaskSelector
 from niagads.etl.utils import interpolate_params, register_plugins
 from niagads.utils.dict import deep_merge
+from niagads.utils.logging import (
+    LOG_FORMAT_STR,
+    ExitOnCriticalExceptionHandler,
+    FunctionContextLoggerWrapper,
+)
 
 os.environ["PYDANTIC_ERRORS_OMIT_URL"] = "1"
 
+# log records streamed from task worker processes are tagged w/the plugin (task) name
+WORKER_LOG_FORMAT_STR = "%(asctime)s %(levelname)-8s [%(name)s] %(message)s"
+
+
+def _initialize_task_worker(
+    project: str, packages: Optional[List[str]], log_queue, debug: bool
+) -> None:
+    """
+    ProcessPoolExecutor initializer; runs once in each task worker process.
+
+    Builds the plugin registry (registrations made in the parent are not
+    inherited by spawned processes) and forwards all log records to the
+    parent through `log_queue`.
+    """
+    register_plugins(project=project, packages=packages)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+
+def _run_plugin_task_worker(
+    plugin: str,
+    task_name: str,
+    params: Dict[str, Any],
+    debug: bool,
+    verbose: bool,
+    timeout_seconds: Optional[float] = None,
+) -> ETLRunStatus:
+    """
+    Run a plugin task in a worker process and return its status report.
+
+    The timeout is enforced in the worker, so a timed out plugin run is
+    cancelled (and its ETLRun finalized) without terminating the worker;
+    the `TimeoutError` is raised to the caller.
+    """
+    from niagads.etl.plugins.registry import PluginRegistry
+
+    plugin_cls = PluginRegistry.get(plugin)
+    instance = plugin_cls(name=task_name, params=params, debug=debug, verbose=verbose)
+    asyncio.run(asyncio.wait_for(instance.run(), timeout_seconds))
+    return instance.status_report
+
 
 class PipelineManager(ComponentBaseMixin):
     """
     Pipeline executor with:
-        - Stage barrier semantics (stages run in order, next waits for previous)
-        - Async parallel stage execution (max_concurrency controls concurrency)
-        - Task retries and per-task timeouts
+        - Dependency (DAG) scheduling: a task starts as soon as the tasks it
+          `depends_on` complete; tasks without `depends_on` keep stage barrier
+          semantics (wait for the previous stage)
+        - Global (max_concurrency), per-stage, and per-resource (e.g., DB
+          connections, CPU slots, memory) concurrency caps
+        - Incremental runs: plugin tasks whose fingerprint (plugin, params, input
+          files) matches a successful committed ETLRun are skipped unless `force`
+        - Fan-out tasks: one task split into sub-tasks over input files, tabix
+          regions, or chromosomes, run w/bounded concurrency
+        - Per-stage totals of plugin batch telemetry (stage times, throughput)
+        - Task retries (w/jittered exponential backoff, resuming from the last
+          committed checkpoint if the plugin `can_resume`) and per-task timeouts
+        - Optional profiling of plugin task runs (sampling or cProfile)
         - CLI overrides for params, resume_from, only/skip filters, plan-only output
         - Dry-run by default; --commit enables writes
     """
@@ -43,7 +117,9 @@ class PipelineManager(ComponentBaseMixin):
         Args:
             config_path (str): Path to the pipeline configuration JSON file.
         """
-        super().__init__(debug=debug, verbose=verbose)
+        super().__init__(
+            debug=debug, verbose=verbose, logger=self.__initialize_logger(debug)
+        )
 
         with open(config_file, "r") as f:
             config = json.load(f)
@@ -51,11 +127,40 @@ class PipelineManager(ComponentBaseMixin):
 
         # Filters and plan
         self.__filters = PipelineFilters()
-
-        register_plugins(
-            project=PipelineSettings.from_env().PROJECT,
-            packages=PipelineSettings.from_env().PLUGIN_PACKAGES,
-        )
+        self.__checkpoint: Optional[Dict[str, Any]] = None
+
+        # last committed checkpoint of each plugin task (by `stage.task`), for retries
+        self.__task_checkpoints: Dict[str, Optional[ResumeCheckpoint]] = {}
+        # plugin batch telemetry totals (by stage)
+        self.__stage_telemetry: Dict[str, TelemetrySummary] = {}
+
+        # rerun tasks even if unchanged since their last successful run
+        self.__force: bool = False
+        # profile plugin task runs (`profile` plugin param)
+        self.__profile: Optional[ProfileMode] = None
+        # for ETLRun fingerprint lookups (by database URI), created on demand
+        self.__session_managers: Dict[str, DatabaseSessionManager] = {}
+
+        # process pools for PROCESS stages (by stage name), created on demand
+        self.__process_pools: Dict[str, ProcessPoolExecutor] = {}
+        self.__worker_log_queue = None
+
+        settings = PipelineSettings.from_env()
+        self.__project = settings.PROJECT
+        self.__plugin_packages = settings.PLUGIN_PACKAGES
+        register_plugins(project=self.__project, packages=self.__plugin_packages)
+
+    def __initialize_logger(self, debug: bool):
+        """
+        Pipeline logger; task failures are logged as errors but do not exit,
+        so that failed tasks can be retried and independent tasks can complete.
+        """
+        logger = logging.getLogger(self.__class__.__module__)
+        logger.addHandler(ExitOnCriticalExceptionHandler(format=LOG_FORMAT_STR))
+        if debug:
+            logger = FunctionContextLoggerWrapper(logger=logger)
+            logger.setLevel(logging.DEBUG)
+        return logger
 
     # ---- planning & filtering ----
     def _plan(self) -> List[Tuple[StageConfig, List[TaskConfig]]]:
@@ -123,15 +228,32 @@ class PipelineManager(ComponentBaseMixin):
             None
         """
         plan = self._plan()
-        lines = ["Pipeline Plan:"]
+        graph = TaskGraph(plan, self.__config.stages)
+        lines = [
+            f"Pipeline Plan:  max={self.__config.max_concurrency or '-'}  resources={self.__config.resources or '-'}"
+        ]
         for stage, tasks in plan:
             lines.append(
                 f"[Stage] {stage.name}  mode={stage.parallel_mode}  max={stage.max_concurrency or '-'}"
             )
             for t in tasks:
+                node = graph[f"{stage.name}.{t.name}"]
+                lines.append(
+                    f"    - {t.name:<12} type={t.type:<10} plugin={t.plugin or '-':<16} "
+                    f"timeout={str(t.timeout_seconds or '-'):<6} retries={t.retries}"
+                )
                 lines.append(
-                    f"    - {t.name:<12} type={t.type:<10} plugin={t.plugin or '-':<16} timeout={str(t.timeout_seconds) if getattr(t, 'timeout_seconds', None) else '-':<6} retries={getattr(t, 'retries', '-') if hasattr(t, 'retries') else '-'}"
+                    f"        after={node.depends_on or '-'}  resources={t.resources or '-'}  "
+                    f"est={t.estimated_minutes or '-'}"
                 )
+                if t.fan_out:
+                    lines.append(
+                        f"        fan_out={t.fan_out.source}:{t.fan_out.pattern or '-'}  "
+                        f"${{{t.fan_out.variable}}}  max={t.fan_out.max_concurrency}"
+                    )
+
+        length, path = graph.critical_path()
+        lines.append(f"Critical Path (~{length:g} min): {' -> '.join(path) or '-'}")
         output = "\n" + "\n".join(lines)
         if log:
             self.logger.info(output)
@@ -139,25 +261,130 @@ class PipelineManager(ComponentBaseMixin):
             print(output)
 
     # ---- task executors ----
-    async def _run_plugin_task(
+    def _resolve_plugin_params(
         self,
         task: TaskConfig,
         mode: ETLExecutionMode,
         pipeline_scope: Dict[str, Any],
-    ) -> ProcessStatus:
-        from niagads.etl.plugins.registry import PluginRegistry
-
-        plugin_cls = PluginRegistry.get(task.plugin)
-        params = interpolate_params(
-            deep_merge(self.__config.params, task.params), scope=pipeline_scope
+        resume: Optional[ResumeCheckpoint] = None,
+        fingerprint: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        params = self.__interpolate_params(task, pipeline_scope)
+        params["fingerprint"] = (
+            fingerprint if fingerprint is not None else self.__fingerprint(task, params)
         )
         if self.__checkpoint:
             params["resume_from"] = self.__checkpoint
+        if resume is not None:  # retry
+            params["resume_after"] = (
+                resume.line if resume.line is not None else resume.record_id
+            )
+            if resume.offset is not None:
+                params["resume_offset"] = resume.offset
+        if self.__profile is not None:
+            params["profile"] = self.__profile
         # add mode into the plugin parameters
         params["mode"] = mode
+        return params
+
+    def __interpolate_params(
+        self, task: TaskConfig, pipeline_scope: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return interpolate_params(
+            deep_merge(self.__config.params, task.params), scope=pipeline_scope
+        )
+
+    async def __task_fingerprint(
+        self, task: TaskConfig, pipeline_scope: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Fingerprint of a plugin task, computed once per task in a worker thread
+        (input files are stat'ed or hashed) so that it does not block the event loop.
+        None for non-plugin tasks, or if the fingerprint can not be computed
+        (the error is then raised, and reported, by the task run).
+        """
+        if task.type != TaskType.PLUGIN:
+            return None
+        try:
+            params = self.__interpolate_params(task, pipeline_scope)
+            return await asyncio.to_thread(self.__fingerprint, task, params)
+        except Exception as e:
+            self.logger.warning(f"[Task] {task.name} unable to compute fingerprint: {e}")
+            return None
+
+    def __fingerprint(self, task: TaskConfig, params: Dict[str, Any]) -> str:
+        from niagads.etl.plugins.registry import PluginRegistry
+
+        return task_fingerprint(
+            task.plugin,
+            PluginRegistry.get_metadata(task.plugin).version,
+            params,
+            inputs=task.inputs,
+            hash_inputs=task.hash_inputs,
+        )
+
+    async def __is_unchanged(
+        self,
+        task: TaskConfig,
+        mode: ETLExecutionMode,
+        pipeline_scope: Dict[str, Any],
+        fingerprint: Optional[str],
+    ) -> bool:
+        """
+        Whether a committed plugin task has a successful ETLRun with the same
+        fingerprint (and can be skipped).
+        """
+        if self.__force or task.type != TaskType.PLUGIN or mode != ETLExecutionMode.RUN:
+            return False
+        if fingerprint is None:
+            return False
+
+        params = self.__interpolate_params(task, pipeline_scope)
+        if not params.get("commit"):
+            return False
+
+        database_uri = params.get("database_uri") or PipelineSettings.from_env().DATABASE_URI
+        if database_uri is None:
+            return False
+        if database_uri not in self.__session_managers:
+            self.__session_managers[database_uri] = DatabaseSessionManager(
+                connection_string=database_uri, pool_size=1
+            )
+
+        try:
+            async with self.__session_managers[database_uri].session_ctx() as session:
+                etl_run_id = await ETLRun.find_successful_run(session, fingerprint)
+        except Exception as e:
+            self.logger.warning(
+                f"[Task] {task.name} unable to look up previous runs by fingerprint: {e}"
+            )
+            return False
+
+        if etl_run_id is None:
+            return False
+
+        self.logger.info(
+            f"[Task] {task.name} skipped; unchanged since successful ETL run {etl_run_id} (use --force to rerun)"
+        )
+        return True
+
+    async def _run_plugin_task(
+        self,
+        task: TaskConfig,
+        mode: ETLExecutionMode,
+        pipeline_scope: Dict[str, Any],
+        resume: Optional[ResumeCheckpoint] = None,
+        fingerprint: Optional[str] = None,
+    ) -> ETLRunStatus:
+        from niagads.etl.plugins.registry import PluginRegistry
+
+        plugin_cls = PluginRegistry.get(task.plugin)
+        params = self._resolve_plugin_params(
+            task, mode, pipeline_scope, resume, fingerprint
+        )
         plugin = plugin_cls(name=task.name, params=params)
         await plugin.run()
-        return ProcessStatus.SUCCESS
+        return plugin.status_report
 
     async def _run_shell_task(self, task: TaskConfig) -> ProcessStatus:
         """
@@ -170,7 +397,12 @@ class PipelineManager(ComponentBaseMixin):
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await proc.communicate()
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:  # timeout
+            proc.kill()
+            await proc.wait()
+            raise
         if proc.returncode == 0:
             return ProcessStatus.SUCCESS
         else:
@@ -221,99 +453,379 @@ class PipelineManager(ComponentBaseMixin):
         # Placeholder for Slack/email/webhook; callers can implement an adapter.
         raise NotImplementedError("Notification Tasks not yet implemented")
 
-    # ---- stage execution ----
-    async def _run_stage(
+    # ---- task scheduling ----
+    async def _run_graph(
         self,
-        stage: StageConfig,
-        tasks: List[TaskConfig],
+        graph: TaskGraph,
         mode: ETLExecutionMode,
         pipeline_scope: Dict[str, Any],
     ) -> ProcessStatus:
         """
-        Execute all tasks in a stage, either in parallel (async/thread/process) or sequentially.
+        Run the planned tasks, starting each task as soon as its dependencies
+        have completed and its resources are available.
+
+        Ready tasks are started in topological (then plan) order.  If a task
+        fails, the tasks that depend on it are not run; independent tasks
+        continue.
 
         Args:
-            stage (StageConfig): The stage configuration.
-            tasks (List[TaskConfig]): List of tasks to execute in the stage.
+            graph (TaskGraph): The planned tasks and their dependencies.
             mode (ETLMode): ETL execution mode (COMMIT, NON_COMMIT, DRY_RUN).
             pipeline_scope (Dict[str, Any]): Pipeline-wide parameters for interpolation.
 
         Returns:
-            bool: True if all tasks succeed, False if any task fails.
+            ProcessStatus: SUCCESS if all tasks succeed, FAIL otherwise.
         """
-        match stage.parallel_mode:
-            case ParallelMode.NONE:
-                return await self._run_stage_sequential(
-                    stage, tasks, mode, pipeline_scope
-                )
-            case ParallelMode.THREAD:
-                return await self._run_stage_parallel_thread(
-                    stage, tasks, mode, pipeline_scope
-                )
-            case ParallelMode.PROCESS:
-                return await self._run_stage_parallel_process(
-                    stage, tasks, mode, pipeline_scope
-                )
-            case _:
-                raise ValueError(
-                    f"Unknown parallel mode: {stage.parallel_mode!r} for stage '{stage.name}'"
+        pool = ResourcePool.from_config(self.__config, graph)
+        pending: List[TaskNode] = graph.nodes
+        running: Dict[asyncio.Task, TaskNode] = {}
+        completed: set = set()
+        not_run: set = set()  # failed, or blocked by a failed dependency
+        stage_tasks = Counter(node.stage.name for node in pending)
+        started_stages: set = set()
+
+        while pending or running:
+            for node in list(pending):
+                if any(key in not_run for key in node.depends_on):
+                    self.logger.warning(
+                        f"[Task] {node.task.name} not run; dependency failed: "
+                        f"{[key for key in node.depends_on if key in not_run]}"
+                    )
+                    pending.remove(node)
+                    not_run.add(node.key)
+                    self.__complete_stage_task(node, stage_tasks, not_run)
+                    continue
+                if not all(key in completed for key in node.depends_on):
+                    continue
+                if not pool.try_acquire(node.requirements()):
+                    continue
+
+                if node.stage.name not in started_stages:
+                    started_stages.add(node.stage.name)
+                    self.logger.info(f"[Stage] {node.stage.name} started.")
+                pending.remove(node)
+                running[
+                    asyncio.create_task(
+                        self._run_scheduled_task(node, mode, pipeline_scope)
+                    )
+                ] = node
+
+            if not running:
+                if pending:
+                    raise RuntimeError(
+                        f"Unable to schedule tasks: {[node.key for node in pending]}"
+                    )
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                pool.release(node.requirements())
+                if future.result() is ProcessStatus.SUCCESS:
+                    completed.add(node.key)
+                else:
+                    not_run.add(node.key)
+                self.__complete_stage_task(node, stage_tasks, not_run)
+
+        return ProcessStatus.FAIL if not_run else ProcessStatus.SUCCESS
+
+    def __record_task_report(
+        self, stage: StageConfig, task: TaskConfig, report: Optional[ETLRunStatus]
+    ) -> None:
+        """Keep a plugin task's last checkpoint (for retries) and add its telemetry to the stage totals."""
+        if report is None:
+            return
+        self.__task_checkpoints[f"{stage.name}.{task.name}"] = report.checkpoint
+        if report.telemetry is not None:
+            self.__stage_telemetry.setdefault(stage.name, TelemetrySummary()).merge(
+                report.telemetry
+            )
+
+    def __complete_stage_task(
+        self, node: TaskNode, stage_tasks: Counter, not_run: set
+    ) -> None:
+        """Count down the tasks remaining in the node's stage and log when it completes."""
+        stage = node.stage.name
+        stage_tasks[stage] -= 1
+        if stage_tasks[stage] == 0:
+            if stage in self.__stage_telemetry:
+                self.logger.info(
+                    f"[Stage] {stage} telemetry: {self.__stage_telemetry[stage].as_info_string()}"
                 )
+            if any(key.startswith(f"{stage}.") for key in not_run):
+                self.logger.error(f"[Stage] {stage} failed.")
+            else:
+                self.logger.info(f"[Stage] {stage} completed successfully.")
+
+    async def _run_scheduled_task(
+        self,
+        node: TaskNode,
+        mode: ETLExecutionMode,
+        pipeline_scope: Dict[str, Any],
+    ) -> ProcessStatus:
+        if node.task.fan_out is not None:
+            return await self._run_fan_out_task(
+                node.stage, node.task, mode, pipeline_scope
+            )
+        return await self.__run_with_retries(
+            node.stage, node.task, mode, pipeline_scope
+        )
 
-    async def _run_stage_parallel_thread(
-        self, stage, tasks, mode, pipeline_scope
+    async def _run_fan_out_task(
+        self,
+        stage: StageConfig,
+        task: TaskConfig,
+        mode: ETLExecutionMode,
+        pipeline_scope: Dict[str, Any],
     ) -> ProcessStatus:
-        results = await asyncio.gather(
-            *(self._run_stage_task(stage, t, mode, pipeline_scope) for t in tasks),
-            return_exceptions=True,
+        """
+        Split a task into one sub-task per fan-out item (file, tabix region, or
+        chromosome) and run them, at most `fan_out.max_concurrency` at a time.
+        Each sub-task is retried, fingerprinted, and checkpointed independently.
+
+        Returns:
+            ProcessStatus: SUCCESS if all sub-tasks succeed, FAIL otherwise.
+        """
+        try:
+            items = expand_fan_out(task.fan_out, pipeline_scope)
+        except Exception as e:
+            self.logger.error(
+                f"[Task] {task.name} unable to expand fan-out: {e}\n{traceback.format_exc()}"
+            )
+            return ProcessStatus.FAIL
+        if not items:
+            self.logger.error(
+                f"[Task] {task.name} fan-out over {task.fan_out.source} "
+                f"`{task.fan_out.pattern or '-'}` matched no items"
+            )
+            return ProcessStatus.FAIL
+
+        self.logger.info(
+            f"[Task] {task.name} fan-out: {len(items)} sub-tasks over {task.fan_out.source} "
+            f"(max_concurrency={task.fan_out.max_concurrency})"
+        )
+        semaphore = asyncio.Semaphore(task.fan_out.max_concurrency)
+
+        async def run_sub_task(label: str, value: str) -> ProcessStatus:
+            async with semaphore:
+                sub_task, scope = fan_out_task(task, label, value, pipeline_scope)
+                return await self.__run_with_retries(stage, sub_task, mode, scope)
+
+        statuses = await asyncio.gather(
+            *(run_sub_task(label, value) for label, value in items)
         )
-        # Only check status, error handling/logging is centralized in _run_stage_task
-        if any(r is not ProcessStatus.SUCCESS for r in results):
+        failed = [
+            label
+            for (label, _), status in zip(items, statuses)
+            if status is not ProcessStatus.SUCCESS
+        ]
+        if failed:
+            self.logger.error(
+                f"[Task] {task.name} failed: {len(failed)} of {len(items)} sub-tasks failed: {failed}"
+            )
             return ProcessStatus.FAIL
+
+        self.logger.info(
+            f"[Task] {task.name} completed successfully ({len(items)} sub-tasks)."
+        )
         return ProcessStatus.SUCCESS
 
-    # FIXME: potentially being handled incorrectly; something to do w/pickling
-    async def _run_stage_parallel_process(
+    async def __run_with_retries(
         self,
         stage: StageConfig,
-        tasks: list[TaskConfig],
+        task: TaskConfig,
         mode: ETLExecutionMode,
-        pipeline_scope: dict,
+        pipeline_scope: Dict[str, Any],
     ) -> ProcessStatus:
+        """
+        Run a task, retrying up to `retries` times after a jittered exponential
+        backoff.  Retries of plugins that `can_resume` (in commit mode) resume
+        after the last checkpoint committed by the failed attempt.
+        """
+        fingerprint = await self.__task_fingerprint(task, pipeline_scope)
+        if await self.__is_unchanged(task, mode, pipeline_scope, fingerprint):
+            return ProcessStatus.SUCCESS
 
-        max_workers = stage.max_concurrency or len(tasks)
-        loop = asyncio.get_running_loop()
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
-                loop.run_in_executor(
-                    executor,
-                    lambda t=t: asyncio.run(
-                        self._run_stage_task(stage, t, mode, pipeline_scope)
-                    ),
-                    t,
+        key = f"{stage.name}.{task.name}"
+        resume: Optional[ResumeCheckpoint] = None
+        for attempt in range(task.retries + 1):
+            if attempt > 0:
+                delay = self.__retry_delay(task, attempt)
+                checkpoint = self.__task_checkpoints.pop(key, None)
+                if checkpoint is not None and self.__can_resume(
+                    task, mode, pipeline_scope
+                ):
+                    resume = checkpoint
+                self.logger.warning(
+                    f"[Task] {task.name} retry {attempt} of {task.retries} in {delay:.0f}s"
+                    + (f"; resuming after {resume.as_info_string()}" if resume else "")
                 )
-                for t in tasks
-            ]
-            results = await asyncio.gather(*futures, return_exceptions=True)
+                await asyncio.sleep(delay)
 
-            # Only check status, error handling/logging is centralized in _run_stage_task
-            if any(r is not ProcessStatus.SUCCESS for r in results):
-                return ProcessStatus.FAIL
-            return ProcessStatus.SUCCESS
+            status = await self.__run_task_attempt(
+                stage, task, mode, pipeline_scope, resume, fingerprint
+            )
+            if status is ProcessStatus.SUCCESS:
+                return status
+
+        return ProcessStatus.FAIL
 
-    async def _run_stage_sequential(
+    async def __run_task_attempt(
         self,
         stage: StageConfig,
-        tasks: List[TaskConfig],
+        task: TaskConfig,
         mode: ETLExecutionMode,
         pipeline_scope: Dict[str, Any],
+        resume: Optional[ResumeCheckpoint],
+        fingerprint: Optional[str],
     ) -> ProcessStatus:
-        for t in tasks:
-            result = await self._run_stage_task(stage, t, mode, pipeline_scope)
+        if stage.parallel_mode == ParallelMode.PROCESS:
+            # timeout enforced in the worker
+            return await self._run_task_in_process(
+                stage, task, mode, pipeline_scope, resume, fingerprint
+            )
+        try:
+            return await asyncio.wait_for(
+                self._run_stage_task(
+                    stage, task, mode, pipeline_scope, resume, fingerprint
+                ),
+                task.timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"[Task] {task.name} timed out after {task.timeout_seconds}s"
+            )
+            return ProcessStatus.FAIL
+
+    @staticmethod
+    def __retry_delay(task: TaskConfig, attempt: int) -> float:
+        """Exponential backoff w/'equal jitter' (half fixed, half random)."""
+        delay = min(
+            task.retry_max_backoff_seconds,
+            task.retry_backoff_seconds * 2 ** (attempt - 1),
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def __can_resume(
+        self, task: TaskConfig, mode: ETLExecutionMode, pipeline_scope: Dict[str, Any]
+    ) -> bool:
+        """Whether a failed plugin task can be resumed from its last committed checkpoint."""
+        from niagads.etl.plugins.registry import PluginRegistry
+
+        if task.type != TaskType.PLUGIN or mode != ETLExecutionMode.RUN:
+            return False
+        if not PluginRegistry.get_metadata(task.plugin).can_resume:
+            return False
+        return bool(self.__interpolate_params(task, pipeline_scope).get("commit"))
 
-            # Only check status, error handling/logging is centralized in _run_stage_task
-            if result is not ProcessStatus.SUCCESS:
+    def __get_process_pool(self, stage: StageConfig) -> ProcessPoolExecutor:
+        """
+        Process pool for a PROCESS stage, sized by the stage `max_concurrency`
+        (or number of tasks), or the largest fan-out `max_concurrency`.  Workers are spawned, so they share no database
+        connections or event loop state with the pipeline process.
+        """
+        if stage.name not in self.__process_pools:
+            context = multiprocessing.get_context("spawn")
+            if self.__worker_log_queue is None:
+                self.__worker_log_queue = context.Queue()
+            max_workers = max(
+                [stage.max_concurrency or len(stage.tasks)]
+                + [task.fan_out.max_concurrency for task in stage.tasks if task.fan_out]
+            )
+            self.__process_pools[stage.name] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=context,
+                initializer=_initialize_task_worker,
+                initargs=(
+                    self.__project,
+                    self.__plugin_packages,
+                    self.__worker_log_queue,
+                    self._debug,
+                ),
+            )
+        return self.__process_pools[stage.name]
+
+    def __start_worker_log_listener(self) -> QueueListener:
+        """Stream log records from task worker processes to the pipeline log (stderr)."""
+        if self.__worker_log_queue is None:
+            self.__worker_log_queue = multiprocessing.get_context("spawn").Queue()
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(WORKER_LOG_FORMAT_STR))
+        listener = QueueListener(self.__worker_log_queue, handler)
+        listener.start()
+        return listener
+
+    def __shutdown_process_pools(self):
+        for executor in self.__process_pools.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        self.__process_pools = {}
+
+    async def _run_task_in_process(
+        self,
+        stage: StageConfig,
+        task: TaskConfig,
+        mode: ETLExecutionMode,
+        pipeline_scope: dict,
+        resume: Optional[ResumeCheckpoint] = None,
+        fingerprint: Optional[str] = None,
+    ) -> ProcessStatus:
+        """
+        Run a plugin task in the stage's process pool.
+
+        Only a picklable task spec (plugin name, task name, and resolved
+        parameters) is sent to the worker, which returns the plugin's
+        `ETLRunStatus`.  Non-plugin tasks run in the pipeline process.
+        """
+        if task.type != TaskType.PLUGIN:
+            try:
+                return await asyncio.wait_for(
+                    self._run_stage_task(stage, task, mode, pipeline_scope),
+                    task.timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                self.logger.error(
+                    f"[Task] {task.name} timed out after {task.timeout_seconds}s"
+                )
                 return ProcessStatus.FAIL
+
+        self.logger.info(f"[Task] {task.name} started (type={task.type}; process)")
+        loop = asyncio.get_running_loop()
+        try:
+            params = self._resolve_plugin_params(
+                task, mode, pipeline_scope, resume, fingerprint
+            )
+            status: ETLRunStatus = await loop.run_in_executor(
+                self.__get_process_pool(stage),
+                _run_plugin_task_worker,
+                task.plugin,
+                task.name,
+                params,
+                self._debug,
+                self._verbose,
+                task.timeout_seconds,
+            )
+            self.__record_task_report(stage, task, status)
+        except asyncio.TimeoutError:  # raised by the worker
+            self.logger.error(
+                f"[Task] {task.name} timed out after {task.timeout_seconds}s"
+            )
+            return ProcessStatus.FAIL
+        except (Exception, SystemExit) as e:  # SystemExit raised by logger handlers
+            self.logger.error(
+                f"[Task] {task.name} raised exception: {e!r}\n{traceback.format_exc()}"
+            )
+            return ProcessStatus.FAIL
+
+        if status is None or status.status is not ProcessStatus.SUCCESS:
+            self.logger.error(
+                f"[Task] {task.name} failed: {status.status if status else 'no status report'}"
+            )
+            return ProcessStatus.FAIL
+
+        self.logger.info(
+            f"[Task] {task.name} completed successfully (run_id={status.run_id}; "
+            f"runtime={status.runtime:.2f}s)."
+        )
         return ProcessStatus.SUCCESS
 
     async def _run_stage_task(
@@ -322,12 +834,18 @@ class PipelineManager(ComponentBaseMixin):
         task: TaskConfig,
         mode: ETLExecutionMode,
         pipeline_scope: Dict[str, Any],
+        resume: Optional[ResumeCheckpoint] = None,
+        fingerprint: Optional[str] = None,
     ) -> ProcessStatus:
         self.logger.info(f"[Task] {task.name} started (type={task.type})")
         try:
             match task.type:
                 case TaskType.PLUGIN:
-                    result = await self._run_plugin_task(task, mode, pipeline_scope)
+                    report = await self._run_plugin_task(
+                        task, mode, pipeline_scope, resume, fingerprint
+                    )
+                    self.__record_task_report(stage, task, report)
+                    result = report.status
                 case TaskType.SHELL:
                     result = await self._run_shell_task(task)
                 case TaskType.FILE:
@@ -374,27 +892,25 @@ class PipelineManager(ComponentBaseMixin):
         if parameter_overrides:
             self.params = deep_merge(self.params, parameter_overrides)
 
-        plan = self._plan()
+        graph = TaskGraph(self._plan(), self.__config.stages)
         self._log_pipeline_start(mode)
 
-        all_success = True
-        for stage, tasks in plan:
-            self.logger.info(
-                f"[Stage] {stage.name} started. Tasks: {[t.name for t in tasks]}"
-            )
-            status = await self._run_stage(
-                stage=stage,
-                tasks=tasks,
-                mode=mode,
-                pipeline_scope=self.params,
-            )
-            if status is not ProcessStatus.SUCCESS:
-                self.logger.error(f"[Stage] {stage.name} failed.")
-                all_success = False
-                break
-            self.logger.info(f"[Stage] {stage.name} completed successfully.")
-
-        if all_success:
+        listener = (
+            self.__start_worker_log_listener()
+            if any(node.stage.parallel_mode == ParallelMode.PROCESS for node in graph.nodes)
+            else None
+        )
+        try:
+            status = await self._run_graph(graph, mode=mode, pipeline_scope=self.params)
+        finally:
+            self.__shutdown_process_pools()
+            if listener is not None:
+                listener.stop()
+            for session_manager in self.__session_managers.values():
+                await session_manager.close()
+            self.__session_managers = {}
+
+        if status is ProcessStatus.SUCCESS:
             self.logger.info("Pipeline completed successfully.")
             return ProcessStatus.SUCCESS
         else:
@@ -442,6 +958,22 @@ class PipelineManager(ComponentBaseMixin):
     def resume_point(self, value):
         self.__filters.resume_point = value
 
+    @property
+    def force(self) -> bool:
+        return self.__force
+
+    @force.setter
+    def force(self, value: bool):
+        self.__force = value
+
+    @property
+    def profile(self) -> Optional[ProfileMode]:
+        return self.__profile
+
+    @profile.setter
+    def profile(self, value: Optional[ProfileMode]):
+        self.__profile = value
+
     @property
     def checkpoint(self) -> Optional[Dict[str, Any]]:
         return self.__checkpoint
@@ -0,0 +1,252 @@
+"""
+Dependency graph and resource accounting for the pipeline task scheduler.
+
+Tasks are identified by `stage.task` keys.  A task without `depends_on` keeps
+the stage barrier semantics: it depends on all tasks in the previous stage
+(or, in a sequential stage, on the previous task in the stage).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from niagads.etl.pipeline.config import (
+    ParallelMode,
+    PipelineConfig,
+    StageConfig,
+    TaskConfig,
+)
+from niagads.etl.pipeline.selectors import StageTaskSelector
+
+
+class TaskNode:
+    """A task in the pipeline graph."""
+
+    def __init__(self, stage: StageConfig, task: TaskConfig):
+        self.stage = stage
+        self.task = task
+        self.depends_on: List[str] = []
+        self.dependents: List[str] = []
+
+    @property
+    def key(self) -> str:
+        return f"{self.stage.name}.{self.task.name}"
+
+    @property
+    def weight(self) -> float:
+        """Estimated runtime (minutes) used for the critical path; 1 if not estimated."""
+        return self.task.estimated_minutes or 1
+
+    def requirements(self) -> Dict[str, float]:
+        """
+        Resources held while the task runs, including a slot in its stage.
+        A fan-out task holds the task resources for each concurrent sub-task.
+        """
+        scale = self.task.fan_out.max_concurrency if self.task.fan_out else 1
+        return {
+            **{resource: amount * scale for resource, amount in self.task.resources.items()},
+            f"stage:{self.stage.name}": 1,
+        }
+
+
+class TaskGraph:
+    """
+    Directed acyclic graph of the planned pipeline tasks.
+
+    Dependencies on tasks that exist in the pipeline config but are not in the
+    plan (skipped, filtered, or before the resume point) are considered complete.
+
+    Args:
+        plan (List[Tuple[StageConfig, List[TaskConfig]]]): planned stages and tasks.
+        stages (List[StageConfig]): all stages in the pipeline config, used to
+            validate `depends_on` references.
+
+    Raises:
+        ValueError: if a dependency cannot be resolved or the graph has a cycle.
+    """
+
+    def __init__(
+        self,
+        plan: List[Tuple[StageConfig, List[TaskConfig]]],
+        stages: List[StageConfig],
+    ):
+        self.__nodes: Dict[str, TaskNode] = {}
+        for stage, tasks in plan:
+            for task in tasks:
+                node = TaskNode(stage, task)
+                self.__nodes[node.key] = node
+
+        self.__resolve_dependencies(plan, stages)
+        self.__order: List[str] = self.__topological_sort()
+
+    @property
+    def nodes(self) -> List[TaskNode]:
+        """Tasks in topological order (ties broken by plan order)."""
+        return [self.__nodes[key] for key in self.__order]
+
+    def __getitem__(self, key: str) -> TaskNode:
+        return self.__nodes[key]
+
+    def __resolve_dependencies(self, plan, stages: List[StageConfig]):
+        config_tasks = {
+            stage.name: [task.name for task in stage.tasks] for stage in stages
+        }
+
+        previous_stage_keys: List[str] = []
+        for stage, tasks in plan:
+            stage_keys = []
+            for task in tasks:
+                node = self.__nodes[f"{stage.name}.{task.name}"]
+                if task.depends_on is None:  # barrier semantics
+                    if stage.parallel_mode == ParallelMode.NONE and stage_keys:
+                        dependencies = [stage_keys[-1]]
+                    else:
+                        dependencies = previous_stage_keys
+                else:
+                    dependencies = []
+                    for reference in task.depends_on:
+                        dependencies.extend(
+                            self.__resolve_reference(reference, node, config_tasks)
+                        )
+
+                for dependency in dict.fromkeys(dependencies):
+                    if dependency == node.key:
+                        raise ValueError(f"Task `{node.key}` depends on itself")
+                    if dependency in self.__nodes:
+                        node.depends_on.append(dependency)
+                        self.__nodes[dependency].dependents.append(node.key)
+
+                stage_keys.append(node.key)
+            previous_stage_keys = stage_keys
+
+    @staticmethod
+    def __resolve_reference(
+        reference: str, node: TaskNode, config_tasks: Dict[str, List[str]]
+    ) -> List[str]:
+        """Expand a `Stage` or `Stage.Task` reference to task keys."""
+        selector = StageTaskSelector.from_str(reference)
+        if selector.stage not in config_tasks:
+            raise ValueError(
+                f"Task `{node.key}` depends on unknown stage `{selector.stage}`"
+            )
+        if selector.task is None:
+            return [f"{selector.stage}.{task}" for task in config_tasks[selector.stage]]
+        if selector.task not in config_tasks[selector.stage]:
+            raise ValueError(f"Task `{node.key}` depends on unknown task `{reference}`")
+        return [reference]
+
+    def __topological_sort(self) -> List[str]:
+        keys = list(self.__nodes)
+        in_degree = {key: len(self.__nodes[key].depends_on) for key in keys}
+        order = []
+        ready = [key for key in keys if in_degree[key] == 0]
+        while ready:
+            key = ready.pop(0)
+            order.append(key)
+            for dependent in self.__nodes[key].dependents:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+            ready.sort(key=keys.index)  # plan order among ready tasks
+
+        if len(order) < len(keys):
+            cycle = [key for key in keys if in_degree[key] > 0]
+            raise ValueError(f"Task dependencies contain a cycle: {cycle}")
+        return order
+
+    def critical_path(self) -> Tuple[float, List[str]]:
+        """
+        Longest chain of dependent tasks, weighted by `estimated_minutes`.
+
+        Returns:
+            Tuple[float, List[str]]: estimated length and the task keys on the path.
+        """
+        length: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for node in self.nodes:
+            previous[node.key] = max(
+                node.depends_on, key=lambda key: length[key], default=None
+            )
+            length[node.key] = node.weight + (
+                length[previous[node.key]] if previous[node.key] else 0
+            )
+
+        if not length:
+            return 0, []
+
+        key = max(length, key=length.get)
+        total = length[key]
+        path = []
+        while key is not None:
+            path.append(key)
+            key = previous[key]
+        return total, path[::-1]
+
+
+class ResourcePool:
+    """
+    Tracks the resources (e.g., DB connections, CPU slots, memory) held by
+    running tasks against the pipeline capacities.
+
+    Resources without a capacity are not limited.
+
+    Args:
+        capacities (Dict[str, float]): capacity of each named resource.
+        max_tasks (Optional[int]): max number of concurrently running tasks.
+    """
+
+    def __init__(self, capacities: Dict[str, float], max_tasks: Optional[int] = None):
+        self.__capacities = dict(capacities)
+        self.__max_tasks = max_tasks
+        self.__in_use: Dict[str, float] = {}
+        self.__running = 0
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig, graph: TaskGraph) -> "ResourcePool":
+        """
+        Create the pool for a pipeline, with a `stage:<name>` resource capping
+        the concurrency within each stage (1 for sequential stages).
+
+        Raises:
+            ValueError: if a task requires more of a resource than its capacity.
+        """
+        capacities = dict(config.resources)
+        for node in graph.nodes:
+            stage = node.stage
+            capacities[f"stage:{stage.name}"] = (
+                1
+                if stage.parallel_mode == ParallelMode.NONE
+                else stage.max_concurrency or float("inf")
+            )
+
+        pool = cls(capacities, config.max_concurrency)
+        for node in graph.nodes:
+            for resource, amount in node.requirements().items():
+                if amount > capacities.get(resource, float("inf")):
+                    raise ValueError(
+                        f"Task `{node.key}` requires {amount} `{resource}`; "
+                        f"pipeline capacity is {capacities[resource]}"
+                    )
+        return pool
+
+    def try_acquire(self, requirements: Dict[str, float]) -> bool:
+        """
+        Reserve the resources if all are available.
+
+        Returns:
+            bool: True if the resources were reserved.
+        """
+        if self.__max_tasks is not None and self.__running >= self.__max_tasks:
+            return False
+        for resource, amount in requirements.items():
+            capacity = self.__capacities.get(resource, float("inf"))
+            if self.__in_use.get(resource, 0) + amount > capacity:
+                return False
+
+        for resource, amount in requirements.items():
+            self.__in_use[resource] = self.__in_use.get(resource, 0) + amount
+        self.__running += 1
+        return True
+
+    def release(self, requirements: Dict[str, float]):
+        for resource, amount in requirements.items():
+            self.__in_use[resource] -= amount
+        self.__running -= 1
@@ -1,31 +1,139 @@
+import asyncio
+import functools
+import multiprocessing
 import os
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from datetime import datetime
-from typing import Any, Dict, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 import psutil
 from niagads.common.core import ComponentBaseMixin
 from niagads.common.types import ProcessStatus, ETLOperation
 from niagads.database.session import DatabaseSessionManager
 from niagads.etl.pipeline.config import PipelineSettings
+from niagads.etl.plugins.batching import AdaptiveBatchSizer
+from niagads.etl.plugins.grouping import (
+    chunk_groups,
+    chunk_stream,
+    group_external,
+    group_sorted,
+)
 from niagads.etl.plugins.logger import ETLLogger
 from niagads.etl.plugins.metadata import PluginMetadata
 from niagads.etl.plugins.parameters import BasePluginParams
+from niagads.etl.plugins.profiling import PluginProfiler
+from niagads.etl.plugins.references import ReferenceCache
+from niagads.etl.plugins.telemetry import ETLTelemetry, timed_iterator
 from niagads.etl.plugins.types import (
+    ETLInsertMethod,
     ETLLoadStrategy,
     ETLRunStatus,
+    ETLStage,
+    PartitionResult,
     ResumeCheckpoint,
 )
 from niagads.etl.types import ETLExecutionMode
 from niagads.database.genomicsdb.schema.admin.etl import ETLRun
-from niagads.utils.asynchronous import null_async_context
+from niagads.utils.asynchronous import (
+    as_async_iterator,
+    null_async_context,
+    prefetch,
+    threaded_iterator,
+)
 from niagads.utils.list import chunker
 from pydantic import ValidationError
-from sqlalchemy import delete, event
+from sqlalchemy import delete, event, select
+from sqlalchemy.schema import CreateIndex, DropIndex
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Mapper
 from sqlalchemy.exc import IntegrityError
 
+# per-process context created by the plugin's `initialize_transform_worker`
+_TRANSFORM_WORKER_CONTEXT: Any = None
+
+
+def _initialize_transform_worker(initializer: Callable, args: tuple) -> None:
+    """ProcessPoolExecutor initializer; runs once in each transform worker process."""
+    global _TRANSFORM_WORKER_CONTEXT
+    _TRANSFORM_WORKER_CONTEXT = initializer(*args)
+
+
+@functools.cache
+def _qualified_table_name(table: Type[DeclarativeBase]) -> str:
+    """schema.table name of a mapped class (cached per class)"""
+    return f"{table.__table__.schema}.{table.__table__.name}"
+
+
+# ORM flush row counts by (mapper, operation); set in the flushing connection's
+# `info` by ETL sessions only (see `AbstractBasePlugin.__track_etl_transactions`)
+_FLUSH_COUNTS_KEY = "etl_flush_counts"
+
+
+def _count_flushed_row(operation: ETLOperation) -> Callable:
+    """Mapper event listener that counts the rows flushed by ETL sessions."""
+
+    def listener(mapper, connection, target) -> None:
+        counts = connection.info.get(_FLUSH_COUNTS_KEY)
+        if counts is not None:
+            key = (mapper, operation)
+            counts[key] = counts.get(key, 0) + 1
+
+    return listener
+
+
+@functools.cache
+def _register_flush_row_counters() -> None:
+    """Register the mapper-level flush row counters (once per process)."""
+    for event_name, operation in (
+        ("after_insert", ETLOperation.INSERT),
+        ("after_update", ETLOperation.UPDATE),
+        ("after_delete", ETLOperation.DELETE),
+    ):
+        event.listen(Mapper, event_name, _count_flushed_row(operation))
+
+
+def _run_transform_worker(worker: Callable, records: Any) -> Any:
+    """Run the plugin's `transform_worker` on a chunk in a worker process."""
+    return worker(_TRANSFORM_WORKER_CONTEXT, records)
+
+
+def _run_partition(
+    plugin_class: Type["AbstractBasePlugin"],
+    params: Dict[str, Any],
+    name: str,
+    log_path: Optional[str],
+    debug: bool,
+    verbose: bool,
+    run_id: Optional[int],
+) -> PartitionResult:
+    """Load one partition of a partitioned plugin run in a worker process."""
+    try:
+        plugin = plugin_class(
+            params, name=name, log_path=log_path, debug=debug, verbose=verbose
+        )
+    except BaseException as err:  # SystemExit raised by logger handlers
+        return PartitionResult(
+            partition=params["partition"],
+            status=ProcessStatus.FAIL,
+            error=f"Failed to initialize plugin: {err!r}",
+        )
+    return asyncio.run(plugin.run_partition(run_id))
+
 
 class AbstractBasePlugin(ABC, ComponentBaseMixin):
     """
@@ -54,10 +162,11 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         self.__metadata: PluginMetadata = self.__retrieve_plugin_metadata()
 
         self._name = name or self.__class__.__name__
+        self.__log_file = self.__resolve_log_file_path(log_path)
 
         self.logger: ETLLogger = ETLLogger(
             name=self._name,
-            log_file=self.__resolve_log_file_path(log_path),
+            log_file=self.__log_file,
             debug=self._debug,
         )
 
@@ -74,20 +183,55 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
                 "Resume at checkpoint not implemented for this plugin, cannot proceed with `--resume-at` option"
             )
 
+        if self.is_streaming and self.load_strategy != ETLLoadStrategy.BATCH:
+            raise NotImplementedError(
+                "`streaming` is only supported for the BATCH load strategy"
+            )
+        if self.is_grouped and not self.is_streaming:
+            raise NotImplementedError(
+                "Plugin implements `group_key` but grouping is only supported "
+                "for streaming BATCH loads; set `streaming=True` in the plugin metadata"
+            )
+
+        if self.transform_workers > 1:
+            if not self.__is_chunked:
+                raise NotImplementedError(
+                    "Parallel transform workers are only supported for CHUNKED "
+                    "or streaming BATCH loads"
+                )
+            if type(self).transform_worker is AbstractBasePlugin.transform_worker:
+                raise NotImplementedError(
+                    "`transform_workers` > 1 but plugin does not implement `transform_worker`"
+                )
+
+        if self._params.partition is not None and not self.is_partitioned:
+            raise NotImplementedError(
+                "Plugin does not implement `partitions`, cannot proceed with `--partition` option"
+            )
+
         # flag indicating in load is resumed (needs) to be class level b/c chunked loading
         self._resume: bool = False if self._params.resume_after is not None else True
 
         # parameter based properties
         self._mode = ETLExecutionMode(self._params.mode)
         self._batch_size: int = self._params.batch_size
+        self.__batch_sizer: Optional[AdaptiveBatchSizer] = None
 
+        self.__log_path: Optional[str] = log_path
         self.__start_time: Optional[datetime] = None
         self.__status_report: ETLRunStatus = None
         self.__checkpoint: ResumeCheckpoint = None
         self.__etl_run: ETLRun = None
         self.__transaction_record: Dict[str, Dict[str, int]] = {}
+        self.__batch_start_time: float = None
+        self.__batch_start_tx_total: int = 0
         self.__execution_status: ProcessStatus = None
 
+        self.__telemetry: Optional[ETLTelemetry] = None
+        # pipelined load queues (for telemetry)
+        self.__extract_queue: Optional[asyncio.Queue] = None
+        self.__load_queue: Optional[asyncio.Queue] = None
+
         self._database_uri = (
             self._params.database_uri or PipelineSettings.from_env().DATABASE_URI
         )
@@ -144,6 +288,56 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
     def is_large_dataset(self) -> bool:
         return self.__metadata.is_large_dataset
 
+    @property
+    def is_pipelined(self) -> bool:
+        """
+        Whether CHUNKED extract, transform, and load stages run concurrently.
+        """
+        return self.__metadata.pipelined
+
+    @property
+    def is_streaming(self) -> bool:
+        """
+        Whether a BATCH load streams records through extract / transform
+        instead of materializing the whole dataset.
+        """
+        return self.__metadata.streaming
+
+    @property
+    def is_grouped(self) -> bool:
+        """Whether the plugin groups records by `group_key` before transform."""
+        return type(self).group_key is not AbstractBasePlugin.group_key
+
+    @property
+    def __is_chunked(self) -> bool:
+        """CHUNKED and streaming BATCH loads share the chunked load process."""
+        return self.load_strategy == ETLLoadStrategy.CHUNKED or self.is_streaming
+
+    @property
+    def transform_workers(self) -> int:
+        """
+        Number of worker processes used to transform CHUNKED loads (1 = in-process);
+        the `transform_workers` parameter overrides the plugin metadata.
+        """
+        return self._params.transform_workers or self.__metadata.transform_workers or 1
+
+    @property
+    def is_partitioned(self) -> bool:
+        """Whether the plugin supports partitioned loads (implements `partitions`)."""
+        return type(self).partitions is not AbstractBasePlugin.partitions
+
+    @property
+    def partition(self) -> Optional[str]:
+        """The partition loaded by this plugin instance, or None for all the data."""
+        return self._params.partition
+
+    @property
+    def insert_method(self) -> ETLInsertMethod:
+        """
+        How `submit_many` writes new records (ORM or COPY).
+        """
+        return self.__metadata.insert_method
+
     @property
     def load_strategy(self) -> ETLLoadStrategy:
         """
@@ -196,6 +390,11 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         else:
             return None
 
+    @property
+    def status_report(self) -> Optional[ETLRunStatus]:
+        """Status report (status, transaction tally, runtime, throughput) of the last run."""
+        return self.__status_report
+
     # -------------------------
     # Initialization helpers
     # -------------------------
@@ -214,6 +413,14 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
 
         return os.path.join(log_path, f"{self._name}.log")
 
+    def __resolve_prometheus_textfile(self) -> Optional[str]:
+        """Prometheus textfile; one per partition (`<name>.<partition>.prom`) in partitioned loads."""
+        textfile = self._params.prometheus_textfile
+        if textfile and self.partition is not None:
+            root, ext = os.path.splitext(textfile)
+            return f"{root}.{self.partition}{ext}"
+        return textfile
+
     def __initialize_database_session(self):
         if self._database_uri is None:
             raise ValueError(
@@ -292,6 +499,80 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         """
         ...
 
+    # -------------------------
+    # Streaming Group-By Hooks
+    # -------------------------
+
+    def group_key(self, record: Any) -> Hashable:
+        """
+        Return the aggregation key of an extracted record.
+
+        Override in streaming BATCH plugins whose `transform` must see all
+        records sharing a key together (e.g., to merge evidence for an
+        annotation).  Records are grouped before transform, and each chunk
+        passed to `transform` contains only whole groups.  If the input is not
+        sorted by key (`--group-input-sorted`), records are grouped by spilling
+        them to temporary files, so extracted records must be picklable.
+        """
+        raise NotImplementedError("Plugin does not implement `group_key`")
+
+    # -------------------------
+    # Partitioned Load Hooks
+    # -------------------------
+
+    def partitions(self) -> Optional[List[str]]:
+        """
+        Return the keys of independent partitions of the input (e.g., the
+        chromosomes in a tabix indexed file).
+
+        Override in plugins whose input can be loaded as independent shards.
+        When `partition_workers` > 1, each partition is loaded in its own
+        process by a plugin instance with `partition` set; `extract` must then
+        yield only the records in `self.partition`.  Return None if the input
+        cannot be partitioned (e.g., the file is not indexed) to fall back to
+        a single stream.
+        """
+        raise NotImplementedError("Plugin does not implement `partitions`")
+
+    # -------------------------
+    # Parallel Transform Hooks
+    # -------------------------
+
+    def transform_worker_init_args(self) -> tuple:
+        """
+        Return the (picklable) arguments passed to `initialize_transform_worker`
+        in each transform worker process.
+
+        Override in your plugin if `transform_workers` is set in the metadata.
+        """
+        return ()
+
+    @staticmethod
+    def initialize_transform_worker(*args) -> Any:
+        """
+        Create per-process state for `transform_worker` (e.g., service clients).
+
+        Runs once in each worker process; the return value is passed to
+        `transform_worker` as `context`.  Must be a static method (or
+        module-level function) so that it can be pickled.
+        """
+        return None
+
+    @staticmethod
+    def transform_worker(context: Any, records: Any) -> Any:
+        """
+        Synchronous, picklable equivalent of `transform` run in a worker process
+        when `transform_workers` > 1 in the plugin metadata.
+
+        Args:
+            context (Any): per-process state returned by `initialize_transform_worker`.
+            records (Any): a chunk yielded by `extract`; must be picklable.
+
+        Returns:
+            Transformed chunk (must be picklable), as `transform` would return.
+        """
+        raise NotImplementedError("Plugin does not implement `transform_worker`")
+
     # -------------------------
     # Overridable Lifecycle Hooks
     # -------------------------
@@ -346,7 +627,12 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         If you need the DB session, for undo,
         use self.session_ctx() or self.session_manager() as best fits
         your application
+
+        Large datasets (`is_large_dataset`) are deleted in batches (see `undo_in_batches`).
         """
+        if self.is_large_dataset:
+            await self.undo_in_batches()
+            return
 
         async with self.session_ctx() as session:
             for table in self.affected_tables:
@@ -378,6 +664,134 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
             else:
                 await session.rollback()
 
+    async def undo_in_batches(self) -> None:
+        """
+        Delete the rows for the run in primary key (keyset) ordered batches of
+        `batch_size`, committing after each batch, so that locks and WAL volume
+        stay bounded for very large runs.  In non-commit mode, the whole UNDO
+        runs in one transaction that is rolled back at the end (rolling back
+        each batch would restore child rows before their parents are deleted).
+
+        Tables are processed in `affected_tables` order (children first); tables
+        without a single-column primary key are deleted in one statement.  Each
+        committed batch is logged with a `table:primary key` checkpoint.  An
+        interrupted UNDO can be resumed by re-running it: committed batches are
+        already gone, so it continues with the remaining rows.
+
+        If `undo_drop_indexes` is set (and in commit mode), secondary indexes on
+        each table (except those needed to find the run's rows) are dropped
+        before the delete and recreated after.
+        """
+        run_id = self._params.run_id
+        async with self.session_ctx() as session:
+            for table in self.affected_tables:
+                dropped_indexes = []
+                if self._params.undo_drop_indexes and self.commit:
+                    dropped_indexes = await self.__drop_secondary_indexes(
+                        session, table
+                    )
+
+                try:
+                    if len(table.__mapper__.primary_key) != 1:
+                        result = await session.execute(
+                            delete(table).where(table.run_id == run_id)
+                        )
+                        self.inc_tx_count(table, ETLOperation.DELETE, result.rowcount)
+                        await self.__complete_undo_batch(
+                            session, ResumeCheckpoint(record_id=table.table_name())
+                        )
+                        continue
+
+                    pk_column = table.__mapper__.primary_key[0]
+                    last_pk = None
+                    while True:
+                        batch = (
+                            select(pk_column)
+                            .where(table.run_id == run_id)
+                            .order_by(pk_column)
+                            .limit(self._batch_size)
+                        )
+                        if last_pk is not None:
+                            batch = batch.where(pk_column > last_pk)
+                        result = await session.execute(
+                            delete(table)
+                            .where(pk_column.in_(batch.scalar_subquery()))
+                            .returning(pk_column)
+                        )
+                        deleted = result.scalars().all()
+                        if not deleted:
+                            break
+
+                        last_pk = max(deleted)
+                        self.inc_tx_count(table, ETLOperation.DELETE, len(deleted))
+                        await self.__complete_undo_batch(
+                            session,
+                            ResumeCheckpoint(
+                                record_id=f"{table.table_name()}:{last_pk}"
+                            ),
+                        )
+
+                except IntegrityError as err:
+                    raise IntegrityError(
+                        f"Foreign key contraint violation."
+                        f" Attempted to delete rows from {table.table_name()} before"
+                        f" all child rows were removed. Order `affected_tables` in the "
+                        f" plugin metadata so that they delete child records first.",
+                        None,
+                        err.orig,
+                    ) from err
+
+                finally:
+                    if dropped_indexes:
+                        await self.__recreate_indexes(session, dropped_indexes)
+
+            result = await session.execute(delete(ETLRun).where(ETLRun.run_id == run_id))
+            self.inc_tx_count(ETLRun, ETLOperation.DELETE, result.rowcount)
+            # commits the final batch, or rolls back the whole (non-commit) UNDO
+            await self.__handle_transaction(
+                session, ResumeCheckpoint(record_id=f"{ETLRun.table_name()}:{run_id}")
+            )
+
+    async def __complete_undo_batch(
+        self, session: AsyncSession, checkpoint: ResumeCheckpoint
+    ) -> None:
+        """Commit an UNDO batch; in non-commit mode only log it (see `undo_in_batches`)."""
+        if self.commit:
+            await self.__handle_transaction(session, checkpoint)
+        else:
+            self.logger.debug(
+                f"DELETED {self.__get_total_transactions()} records (not committed)"
+                f" - CHECKPOINT: {checkpoint.as_info_string(self._debug)}"
+            )
+
+    async def __drop_secondary_indexes(
+        self, session: AsyncSession, table: Type[DeclarativeBase]
+    ) -> list:
+        """
+        Drop model-defined indexes that are not needed to find the run's rows
+        (i.e., not on `run_id` or the primary key); returns the dropped indexes.
+        """
+        keep_columns = {table.__table__.c.run_id, *table.__table__.primary_key.columns}
+        indexes = [
+            index
+            for index in table.__table__.indexes
+            if not keep_columns.intersection(index.columns)
+        ]
+        for index in indexes:
+            self.logger.info(f"Dropping index {index.name} on {table.table_name()}")
+            await session.execute(DropIndex(index, if_exists=True))
+        await session.commit()
+        return indexes
+
+    async def __recreate_indexes(self, session: AsyncSession, indexes: list):
+        """Recreate indexes dropped by `__drop_secondary_indexes`."""
+        if session.in_transaction():
+            await session.rollback()  # clear failed transaction, if any
+        for index in indexes:
+            self.logger.info(f"Recreating index {index.name}")
+            await session.execute(CreateIndex(index, if_not_exists=True))
+        await session.commit()
+
     # -------------------------
     # Transaction Management
     # -------------------------
@@ -397,14 +811,62 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
             amount: Number of records to increment by. Defaults to 1.
         """
 
-        table_name = table if isinstance(table, str) else f"{table.table_name()}"
-        if table_name not in self.__transaction_record:
-            self.__transaction_record[table_name] = {}
+        table_name = table if isinstance(table, str) else _qualified_table_name(table)
+        operation = str(ETLOperation(operation))
+        counts = self.__transaction_record.setdefault(table_name, {})
+        counts[operation] = counts.get(operation, 0) + amount
 
-        self.__transaction_record[table_name][str(ETLOperation(operation))] = (
-            self.__transaction_record[table_name].get(str(ETLOperation(operation)), 0)
-            + amount
-        )
+    async def submit_many(
+        self,
+        session: AsyncSession,
+        table: Type[DeclarativeBase],
+        records: list[DeclarativeBase],
+        return_primary_keys: bool = False,
+    ) -> Optional[list]:
+        """
+        Insert a batch of new records using the plugin's `insert_method`.
+
+        ORM inserts are tallied by the session flush listener; CORE and COPY
+        bypass the session so the inserted rows are tallied here.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session.
+            table (Type[DeclarativeBase]): table class (TransactionTableMixin).
+            records (list[DeclarativeBase]): new instances of `table`.
+            return_primary_keys (bool, optional): ensure generated primary keys
+                are set on the records and return them (ORM or CORE only).
+                Defaults to False.
+
+        Returns:
+            Optional[list]: primary key values in record order if `return_primary_keys`
+
+        Raises:
+            NotImplementedError: if primary keys are requested for a COPY insert
+        """
+        if self.insert_method == ETLInsertMethod.COPY:
+            if return_primary_keys:
+                raise NotImplementedError(
+                    "Generated primary keys cannot be returned when `insert_method` is COPY"
+                )
+            count = await table.copy_many(session, records)
+            self.inc_tx_count(table, ETLOperation.INSERT, count)
+            return None
+
+        if self.insert_method == ETLInsertMethod.CORE:
+            result = await table.insert_many_core(
+                session, records, return_primary_keys=return_primary_keys
+            )
+            count = len(result) if return_primary_keys else result
+            self.inc_tx_count(table, ETLOperation.INSERT, count)
+            return result if return_primary_keys else None
+
+        await table.submit_many(session, records)
+        if return_primary_keys:
+            pk_attr = table.__mapper__.get_property_by_column(
+                table.__mapper__.primary_key[0]
+            )
+            return [getattr(record, pk_attr.key) for record in records]
+        return None
 
     def __get_total_transactions(self, skips_only: bool = False) -> int:
         """
@@ -433,57 +895,38 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
 
             sync_session.info["etl_self.__transaction_record_listener_attached"] = True
 
+            _register_flush_row_counters()
+            event.listen(
+                sync_session,
+                "before_flush",
+                self.__start_etl_transaction_count,
+            )
             event.listen(
                 sync_session,
                 "after_flush",
                 self.__track_etl_transactions,
             )
 
+    @staticmethod
+    def __start_etl_transaction_count(sync_session, flush_context, instances) -> None:
+        """SQLAlchemy before_flush listener; starts counting rows on the flush connection."""
+        sync_session.connection().info[_FLUSH_COUNTS_KEY] = {}
+
     def __track_etl_transactions(self, sync_session, flush_context) -> None:
         """
         SQLAlchemy after_flush listener that tracks per-table inserts, updates, and deletes.
 
-        Tracks across multiple flushes in the same session.
+        Tracks across multiple flushes in the same session.  Rows are counted per
+        mapper (and operation) by mapper events during the flush, so the session's
+        new / dirty / deleted objects are not walked; table names are cached per
+        mapped class.
 
         Args:
             sync_session: The SQLAlchemy sync session (listeners not attached to async).
         """
-
-        # Track new (INSERT) objects
-        for obj in sync_session.new:
-            table_name = (
-                f"{obj.__class__.__table__.schema}.{obj.__class__.__table__.name}"
-            )
-            if table_name not in self.__transaction_record:
-                self.__transaction_record[table_name] = {}
-            self.__transaction_record[table_name][str(ETLOperation.INSERT)] = (
-                self.__transaction_record[table_name].get(str(ETLOperation.INSERT), 0)
-                + 1
-            )
-
-        # Track modified (UPDATE) objects
-        for obj in sync_session.dirty:
-            table_name = (
-                f"{obj.__class__.__table__.schema}.{obj.__class__.__table__.name}"
-            )
-            if table_name not in self.__transaction_record:
-                self.__transaction_record[table_name] = {}
-            self.__transaction_record[table_name][str(ETLOperation.UPDATE)] = (
-                self.__transaction_record[table_name].get(str(ETLOperation.UPDATE), 0)
-                + 1
-            )
-
-        # Track deleted (DELETE) objects
-        for obj in sync_session.deleted:
-            table_name = (
-                f"{obj.__class__.__table__.schema}.{obj.__class__.__table__.name}"
-            )
-            if table_name not in self.__transaction_record:
-                self.__transaction_record[table_name] = {}
-            self.__transaction_record[table_name][str(ETLOperation.DELETE)] = (
-                self.__transaction_record[table_name].get(str(ETLOperation.DELETE), 0)
-                + 1
-            )
+        counts = sync_session.connection().info.pop(_FLUSH_COUNTS_KEY, None)
+        for (mapper, operation), count in (counts or {}).items():
+            self.inc_tx_count(_qualified_table_name(mapper.class_), operation, count)
 
     def session_ctx(self, allow_null_if_unintialized: bool = False):
         """
@@ -536,6 +979,56 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
             echo=self._debug,
         )
 
+    def __record_batch_throughput(
+        self, tx_total: int, checkpoint: Optional[ResumeCheckpoint]
+    ) -> float:
+        """
+        Update the status report and telemetry with the throughput of the batch
+        that ended at this transaction, adapt the batch size (if enabled), and
+        start timing the next batch.
+
+        Returns:
+            float: batch throughput in rows / second
+        """
+        now = time.perf_counter()
+        rows = tx_total - self.__batch_start_tx_total
+        elapsed = now - self.__batch_start_time
+        self.__status_report.record_batch(rows, elapsed)
+        self.__telemetry.record_batch(
+            rows,
+            elapsed,
+            batch_size=self._batch_size,
+            rss_mb=psutil.Process().memory_info().rss / (1024 * 1024),
+            run_id=self.run_id,
+            partition=self.partition,
+            checkpoint=(
+                checkpoint.as_info_string(self._debug) if checkpoint else None
+            ),
+            extract_queue_depth=(
+                self.__extract_queue.qsize() if self.__extract_queue else None
+            ),
+            load_queue_depth=self.__load_queue.qsize() if self.__load_queue else None,
+        )
+        if self.__batch_sizer is not None:
+            self.__adapt_batch_size(elapsed)
+        self.__batch_start_time = now
+        self.__batch_start_tx_total = tx_total
+        return rows / elapsed if elapsed > 0 else 0.0
+
+    def __adapt_batch_size(self, elapsed: float):
+        """
+        Tune the batch size for the next batch from the latency of the last
+        batch and the current memory usage; logs each adjustment.
+        """
+        previous_batch_size = self._batch_size
+        mem_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        reason = self.__batch_sizer.update(elapsed, mem_mb)
+        if reason is not None:
+            self._batch_size = self.__batch_sizer.batch_size
+            self.logger.info(
+                f"Adjusted batch size {previous_batch_size} -> {self._batch_size} ({reason})"
+            )
+
     async def __handle_transaction(
         self, session: AsyncSession, checkpoint: ResumeCheckpoint
     ) -> None:
@@ -547,18 +1040,26 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         msg = f"{tx_total} records"
         if not self._resume:
             msg = f"SKIPPED {msg}"
-        elif self.commit:
-            await session.commit()
-            msg = f"COMMITTED {msg}"
+            # time the first loaded batch from the end of the skipped records
+            self.__batch_start_time = time.perf_counter()
+            self.__batch_start_tx_total = 0
         else:
-            await session.rollback()
-            msg = f"ROLLED BACK {msg}"
+            with self.__telemetry.timer(ETLStage.COMMIT):
+                if self.commit:
+                    await session.commit()
+                    msg = f"COMMITTED {msg}"
+                else:
+                    await session.rollback()
+                    msg = f"ROLLED BACK {msg}"
+            throughput = self.__record_batch_throughput(tx_total, checkpoint)
+            msg = f"{msg} ({throughput:.0f} rows/sec)"
 
         # if transaction is successful, can update the checkpoint
         self.__checkpoint = checkpoint
         self.logger.info(
             f"{msg} - CHECKPOINT: {self.__checkpoint.as_info_string(self._debug)}"
         )
+        self.logger.summarize_repeated_warnings()
 
     async def __execute_load(self, session, buffer) -> ResumeCheckpoint:
         """
@@ -610,10 +1111,111 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         checkpoint = None
 
         if not self.is_dry_run:
-            checkpoint = await self.__execute_load(session, buffer)
+            with self.__telemetry.timer(ETLStage.LOAD):
+                checkpoint = await self.__execute_load(session, buffer)
 
         return checkpoint
 
+    async def __transform_in_workers(self, chunks: AsyncIterator) -> AsyncIterator:
+        """
+        Transform chunks in a process pool, yielding results in input order.
+
+        Up to 2x `transform_workers` chunks are in flight at a time.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=self.transform_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_transform_worker,
+            initargs=(
+                type(self).initialize_transform_worker,
+                self.transform_worker_init_args(),
+            ),
+        )
+        pending: deque = deque()
+        try:
+            async for records in chunks:
+                pending.append(
+                    loop.run_in_executor(
+                        executor,
+                        _run_transform_worker,
+                        type(self).transform_worker,
+                        records,
+                    )
+                )
+                if len(pending) >= 2 * self.transform_workers:
+                    with self.__telemetry.timer(ETLStage.TRANSFORM):
+                        result = await pending.popleft()
+                    yield result
+
+            while pending:
+                with self.__telemetry.timer(ETLStage.TRANSFORM):
+                    result = await pending.popleft()
+                yield result
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __extract_chunks(self) -> Iterator:
+        """
+        Chunks for the chunked load process, timed as the EXTRACT stage
+        (including grouping, for grouped streaming loads).
+        """
+        return timed_iterator(
+            self.__generate_chunks(), self.__telemetry, ETLStage.EXTRACT
+        )
+
+    def __generate_chunks(self) -> Iterator:
+        """
+        Chunks for the chunked load process.
+
+        For CHUNKED loads, `extract` yields the chunks.  For streaming BATCH
+        loads, `extract` yields records, which are grouped by `group_key` (if
+        implemented) and combined into chunks of ~`batch_size` records.
+        """
+        if not self.is_streaming:
+            return self.extract()
+
+        if not self.is_grouped:
+            return chunk_stream(self.extract(), self._batch_size)
+
+        if self._params.group_input_sorted:
+            groups = group_sorted(self.extract(), self.group_key)
+        else:
+            groups = group_external(
+                self.extract(),
+                self.group_key,
+                num_partitions=self._params.group_spill_partitions,
+            )
+        return chunk_groups(groups, self._batch_size)
+
+    async def __extract_transform(self) -> AsyncIterator:
+        """
+        Yield transformed chunks in extract order.
+
+        In pipelined mode, `extract` runs in a producer thread so that parsing
+        continues while chunks are transformed and loaded.  If the plugin
+        sets `transform_workers`, chunks are transformed in a process pool.
+        """
+        if self.is_pipelined:
+            self.__extract_queue = asyncio.Queue(self._params.pipeline_queue_size)
+            chunks = threaded_iterator(
+                self.__extract_chunks(), queue=self.__extract_queue
+            )
+        else:
+            chunks = as_async_iterator(self.__extract_chunks())
+
+        async with aclosing(chunks):
+            if self.transform_workers > 1:
+                async with aclosing(self.__transform_in_workers(chunks)) as results:
+                    async for processed_records in results:
+                        yield processed_records
+            else:
+                async for records in chunks:
+                    with self.__telemetry.timer(ETLStage.TRANSFORM):
+                        processed_records = await self.transform(records)
+                    yield processed_records
+
     async def __process_chunked_load(self):
         """
         Process records in chunks and load them into the database.
@@ -621,45 +1223,65 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         Chunks are processed with size determined by extract. Each chunk
         is loaded, but commits and roll-backs happen according to `batch_size` parameter
         and according to ETL mode.
+
+        If the plugin is pipelined, extract, transform, and load run as
+        concurrent stages linked by bounded queues (`pipeline_queue_size`);
+        chunks are still loaded and committed in extract order, so checkpoints
+        are unaffected.
         """
 
         buffer: list = []
 
+        chunks = self.__extract_transform()
+        if self.is_pipelined:
+            self.__load_queue = asyncio.Queue(self._params.pipeline_queue_size)
+            chunks = prefetch(chunks, queue=self.__load_queue)
+
         async with self.session_ctx(allow_null_if_unintialized=True) as session:
             self.__attach_etl_transaction_listener(session)
-            for records in self.extract():
-                processed_records = await self.transform(records)
-
-                if session is not None:  # load
-                    # chunked can yield one or a list of records
-                    if isinstance(processed_records, list):
-                        buffer.extend(processed_records)
-                    else:
-                        buffer.append(processed_records)
-
-                    if len(buffer) >= self._batch_size:
-                        residuals = False
-                        batches = chunker(
-                            buffer, self._batch_size, return_iterator=True
-                        )
-                        for batch in batches:
-                            if len(batch) == self._batch_size:
-                                checkpoint = await self.__load_buffer(batch, session)
-                                await self.__handle_transaction(session, checkpoint)
-                            else:
-                                buffer = batch  # residuals
-                                residuals = True
-                        if not residuals:
-                            buffer = self.__clear_buffer(buffer)
+            async with aclosing(chunks):
+                async for processed_records in chunks:
+                    if session is not None:  # load
+                        # chunked can yield one or a list of records
+                        if isinstance(processed_records, list):
+                            buffer.extend(processed_records)
+                        else:
+                            buffer.append(processed_records)
+
+                        if len(buffer) >= self._batch_size:
+                            residuals = False
+                            # adaptive sizing may change self._batch_size after each commit
+                            batch_size = self._batch_size
+                            batches = chunker(buffer, batch_size, return_iterator=True)
+                            for batch in batches:
+                                if len(batch) == batch_size:
+                                    checkpoint = await self.__load_buffer(
+                                        batch, session
+                                    )
+                                    await self.__handle_transaction(
+                                        session, checkpoint
+                                    )
+                                else:
+                                    buffer = batch  # residuals
+                                    residuals = True
+                            if not residuals:
+                                buffer = self.__clear_buffer(buffer)
 
             if session is not None:  # handle residuals
                 if buffer:
                     checkpoint = await self.__load_buffer(buffer, session)
                     await self.__handle_transaction(session, checkpoint)
 
+    async def __extract_transform_all(self):
+        """Extract and transform the whole dataset (BULK and non-streaming BATCH loads)."""
+        # a lazy `extract` (generator) is timed as part of the transform
+        with self.__telemetry.timer(ETLStage.EXTRACT):
+            records = self.extract()
+        with self.__telemetry.timer(ETLStage.TRANSFORM):
+            return await self.transform(records)
+
     async def __process_bulk_load(self) -> ResumeCheckpoint:
-        records = self.extract()
-        processed_records = await self.transform(records)
+        processed_records = await self.__extract_transform_all()
 
         async with self.session_ctx(allow_null_if_unintialized=True) as session:
             if session is not None:
@@ -667,18 +1289,23 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
                 # Bulk: load all at once, ignore batch_size
                 checkpoint = None
                 if not self.is_dry_run:
-                    checkpoint = await self.__execute_load(session, processed_records)
+                    with self.__telemetry.timer(ETLStage.LOAD):
+                        checkpoint = await self.__execute_load(
+                            session, processed_records
+                        )
                     await self.__handle_transaction(session, checkpoint)
                 return checkpoint
 
     async def __process_bulk_in_batch_load(self):
-        records = self.extract()
-        processed_records = await self.transform(records)
-        batches = chunker(processed_records, self._batch_size, return_iterator=True)
+        processed_records = await self.__extract_transform_all()
         async with self.session_ctx(allow_null_if_unintialized=True) as session:
             if session is not None:
                 self.__attach_etl_transaction_listener(session)
-                for batch in batches:
+                # slice instead of chunker, b/c batch size may be adapted after each commit
+                start = 0
+                while start < len(processed_records):
+                    batch = processed_records[start : start + self._batch_size]
+                    start += len(batch)
                     checkpoint = await self.__load_buffer(batch, session)
                     await self.__handle_transaction(session, checkpoint)
 
@@ -702,6 +1329,7 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
                     start_time=self.__start_time,
                     rows_processed=0,
                     is_test_run=not self.commit,
+                    fingerprint=self._params.fingerprint,
                 )
 
                 # no if session is not None check here b/c I want to throw an error,
@@ -720,6 +1348,9 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
                 )
 
         # do this second so can assign run_id correctly
+        self.__initialize_status_report()
+
+    def __initialize_status_report(self):
         self.__status_report = ETLRunStatus(
             status=self.__execution_status,
             mode=self._mode,
@@ -740,18 +1371,7 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         Update the plugin status trackers
         """
 
-        total_transactions = self.__get_total_transactions()
-
-        end_time = datetime.now()
-        runtime = (end_time - self.__start_time).total_seconds()
-        mem_mb = psutil.Process().memory_info().rss / (1024 * 1024)
-
-        self.__status_report.runtime = runtime
-        self.__status_report.memory = mem_mb
-        self.__status_report.status = self.__execution_status
-
-        if self.is_dry_run:
-            self.__status_report.estimated_transaction_count = total_transactions
+        total_transactions, end_time = self.__update_status_report()
 
         if self.is_etl_run:
             self.__etl_run.rows_processed = total_transactions
@@ -767,13 +1387,47 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
             except Exception as db_error:
                 self.logger.exception(f"Failed to update ETLRun entry: {db_error}")
 
-    def create_checkpoint(self, line=None, record=None) -> ResumeCheckpoint:
+    def __update_status_report(self) -> tuple[int, datetime]:
+        """
+        Update runtime, memory, throughput, and status in the status report.
+
+        Returns:
+            tuple[int, datetime]: total transactions and end time of the run
+        """
+        total_transactions = self.__get_total_transactions()
+
+        end_time = datetime.now()
+        runtime = (end_time - self.__start_time).total_seconds()
+        mem_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+
+        self.__status_report.runtime = runtime
+        self.__status_report.memory = mem_mb
+        if runtime > 0:
+            self.__status_report.rows_per_second = total_transactions / runtime
+        self.__status_report.status = self.__execution_status
+        self.__status_report.checkpoint = self.__checkpoint
+        telemetry = self.__telemetry.totals
+        if telemetry.batches > 0 or (
+            telemetry.extract_seconds + telemetry.transform_seconds > 0
+        ):
+            self.__status_report.telemetry = telemetry
+
+        if self.is_dry_run:
+            self.__status_report.estimated_transaction_count = total_transactions
+
+        return total_transactions, end_time
+
+    def create_checkpoint(
+        self, line=None, record=None, offset: Optional[int] = None
+    ) -> ResumeCheckpoint:
         """
         Generate a checkpoint for the current ETL state.
 
         Args:
             line (int): The line number or position in the input data.
             record (Any): The current record to checkpoint.
+            offset (int, optional): Byte (or BGZF virtual) offset of the record in the
+                source file; lets `extract` seek to the checkpoint on resume (`--resume-offset`).
 
         Returns:
             ResumeCheckpoint: Checkpoint object for resuming ETL from this state.
@@ -784,6 +1438,7 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
             line=line,
             record=record,
             record_id=self.get_record_id(record) if record is not None else None,
+            offset=offset,
         )
 
     async def __summarize_transactions(self):
@@ -832,10 +1487,6 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
     async def __undo(self):
         if self._mode == ETLExecutionMode.UNDO:
             # checks here in case plugin overrides UNDO method
-            if self.is_large_dataset:
-                raise NotImplementedError(
-                    "Batch UNDO for large datasets not yet implemented"
-                )
             if self.affected_tables is None or len(self.affected_tables) == 0:
                 self.logger.exception(
                     "No `affected tables` specified for this plugin.  Cannot UNDO."
@@ -849,27 +1500,256 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
             # If we reach here, ETL completed successfully
             self.__execution_status = ProcessStatus.SUCCESS
 
-    async def __run(self):
-        if self.is_etl_run or self.is_dry_run:
-            async with self.session_ctx(allow_null_if_unintialized=True) as session:
-                if session is not None:
-                    await self.on_run_start(session)
+    def __resolve_partitions(self) -> Optional[List[str]]:
+        """
+        Partitions to load concurrently, or None if the run is not partitioned
+        (`partition_workers` = 1, a single `partition` requested, or the plugin
+        does not support or cannot partition its input).
+        """
+        if (
+            self._params.partition_workers <= 1
+            or self.partition is not None
+            or not self.is_partitioned
+        ):
+            return None
+
+        partitions = self.partitions()
+        if not partitions:
+            self.logger.warning(
+                "Input cannot be partitioned; ignoring `partition_workers` and loading as a single stream"
+            )
+            return None
+        return partitions
+
+    async def __process_partitioned_load(self, partitions: List[str]):
+        """
+        Load partitions concurrently, each in its own (spawned) process.
+
+        Each partition is loaded by a new instance of the plugin with `partition`
+        set, which has its own database session manager, checkpoints, and log
+        file (`<name>.<partition>.log`), and writes rows under this run's run_id.
+        Transaction tallies are merged into this run as partitions complete.
+        Available transform workers are divided among the concurrent partitions.
+
+        Raises:
+            RuntimeError: if any partition fails; the checkpoint of each failed
+                partition is logged so it can be resumed with `--partition`.
+        """
+        num_workers = min(self._params.partition_workers, len(partitions))
+        params = self._params.model_dump()
+        params.update(
+            database_uri=self._database_uri,
+            partition_workers=1,
+            transform_workers=max(1, self.transform_workers // num_workers),
+        )
+
+        self.logger.info(
+            f"Loading {len(partitions)} partitions with {num_workers} workers"
+        )
+
+        loop = asyncio.get_running_loop()
+        failed: List[PartitionResult] = []
+        with ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    _run_partition,
+                    type(self),
+                    {**params, "partition": partition},
+                    f"{self._name}.{partition}",
+                    self.__resolve_partition_log_path(partition),
+                    self._debug,
+                    self._verbose,
+                    self.run_id,
+                )
+                for partition in partitions
+            ]
+            for future in asyncio.as_completed(futures):
+                result: PartitionResult = await future
+                for table_name, counts in result.transaction_record.items():
+                    for operation, count in counts.items():
+                        self.inc_tx_count(table_name, operation, count)
+                if result.telemetry is not None:
+                    self.__telemetry.summary.merge(result.telemetry)
+
+                self.logger.info(
+                    f"Partition {result.partition}: {result.status}; "
+                    f"{sum(sum(c.values()) for c in result.transaction_record.values())} transactions"
+                )
+                if result.status != ProcessStatus.SUCCESS:
+                    failed.append(result)
+
+        if failed:
+            for result in failed:
+                self.logger.warning(f"Partition {result.partition} failed: {result.error}")
+                if result.checkpoint is not None:
+                    self.logger.checkpoint(result.checkpoint)
+            raise RuntimeError(
+                f"{len(failed)} of {len(partitions)} partitions failed: "
+                f"{[result.partition for result in failed]}"
+            )
+
+    def __resolve_partition_log_path(self, partition: str) -> Optional[str]:
+        """Log file path for a partition: `<name>.<partition>.log` alongside the plugin log."""
+        if self.__log_path and ".log" in self.__log_path:
+            return self.__log_path.replace(".log", f".{partition}.log")
+        return self.__log_path  # directory (or cwd); partition name is in the file name
+
+    def __start_profiler(self) -> Optional[PluginProfiler]:
+        """Start the `--profile` profiler, if requested."""
+        if self._params.profile is None:
+            return None
+
+        if self._params.profile_output:
+            output_prefix = self._params.profile_output
+            if self.partition is not None:  # partitions are profiled separately
+                output_prefix = f"{output_prefix}.{self.partition}"
+        else:
+            output_prefix = os.path.splitext(self.__log_file)[0]
+
+        profiler = PluginProfiler(
+            self._params.profile, output_prefix, top_n=self._params.profile_top_n
+        )
+        try:
+            profiler.start()
+        except ValueError as err:  # e.g., another profiler active in this thread
+            self.logger.warning(f"Unable to start {self._params.profile} profiler: {err}")
+            return None
+        return profiler
+
+    def __stop_profiler(self, profiler: Optional[PluginProfiler]):
+        """Stop the profiler and log the hotspot summary."""
+        if profiler is None:
+            return
+        try:
+            lines = profiler.stop()
+        except OSError as err:
+            self.logger.warning(f"Unable to write profile: {err}")
+            return
+        self.logger.report_section("Profile")
+        for line in lines:
+            self.logger.info(line)
+        self.logger.report_section_end("Profile")
+
+    async def __run_load(self):
+        profiler = self.__start_profiler()
+        try:
+            await self.__process_load()
+        finally:
+            self.__stop_profiler(profiler)
 
-            if self.load_strategy == ETLLoadStrategy.CHUNKED:
+    async def __process_load(self):
+        async with self.session_ctx(allow_null_if_unintialized=True) as session:
+            if session is not None:
+                await self.on_run_start(session)
+
+        if self.load_strategy == ETLLoadStrategy.CHUNKED:
+            await self.__process_chunked_load()
+        elif self.load_strategy == ETLLoadStrategy.BULK:
+            await self.__process_bulk_load()
+        elif self.load_strategy == ETLLoadStrategy.BATCH:
+            if self.is_streaming:
                 await self.__process_chunked_load()
-            elif self.load_strategy == ETLLoadStrategy.BULK:
-                await self.__process_bulk_load()
-            elif self.load_strategy == ETLLoadStrategy.BATCH:
-                await self.__process_bulk_in_batch_load()
             else:
-                raise RuntimeError(f"Unknown load strategy: {self.load_strategy}")
+                await self.__process_bulk_in_batch_load()
+        else:
+            raise RuntimeError(f"Unknown load strategy: {self.load_strategy}")
 
-            await self.__summarize_transactions()
-            await self.on_run_complete()
+        await self.__summarize_transactions()
+        await self.on_run_complete()
+
+    async def __run(self):
+        if self.is_etl_run or self.is_dry_run:
+            partitions = self.__resolve_partitions()
+            if partitions is not None:
+                await self.__process_partitioned_load(partitions)
+                await self.__summarize_transactions()
+            else:
+                await self.__run_load()
 
             # If we reach here, ETL completed successfully
             self.__execution_status = ProcessStatus.SUCCESS
 
+    def __initialize_run(self):
+        self.__execution_status = ProcessStatus.IN_PROGRESS
+        self.__start_time = datetime.now()
+        self.__batch_start_time = time.perf_counter()
+        self.__telemetry = ETLTelemetry(
+            self._name,
+            metrics_file=self._params.metrics_file,
+            prometheus_textfile=self.__resolve_prometheus_textfile(),
+            pushgateway_url=self._params.pushgateway_url,
+        )
+        if self._params.adaptive_batch_size:
+            self.__batch_sizer = AdaptiveBatchSizer(
+                self._params.batch_size,
+                min_batch_size=self._params.min_batch_size,
+                max_batch_size=self._params.max_batch_size,
+                target_seconds=self._params.target_commit_seconds,
+                max_memory_mb=self._params.max_memory_mb,
+            )
+            self._batch_size = self.__batch_sizer.batch_size
+        else:
+            self.__batch_sizer = None
+
+    async def run_partition(self, run_id: Optional[int]) -> PartitionResult:
+        """
+        Load this instance's `partition` as part of a partitioned run.
+
+        Called in a partition worker process; the ETLRun is registered and
+        finalized by the parent plugin, so rows are written under its `run_id`.
+        Errors are not raised but reported in the result, along with the
+        transaction tally and last committed checkpoint of the partition.
+
+        Args:
+            run_id (Optional[int]): run_id of the parent's ETLRun (None if DRY_RUN).
+
+        Returns:
+            PartitionResult: outcome of the partition load.
+        """
+        self.__initialize_run()
+        if self.is_etl_run:
+            self.__etl_run = ETLRun(run_id=run_id)
+        self.__initialize_status_report()
+
+        self.logger.log_plugin_configuration(self._params)
+        self.logger.log_plugin_run_start(self.run_id)
+
+        error_message = None
+        try:
+            await self.__run_load()
+            self.__execution_status = ProcessStatus.SUCCESS
+
+        except KeyboardInterrupt:
+            raise
+
+        except BaseException as err:  # SystemExit raised by logger handlers
+            self.__execution_status = ProcessStatus.FAIL
+            error_message = str(err) or repr(err)
+            if self.__checkpoint is not None:
+                self.logger.checkpoint(self.__checkpoint)
+            try:
+                self.logger.exception(f"ETL Partition Load Failed: {error_message}")
+            except SystemExit:
+                pass
+
+        await self.__summarize_transactions()
+        self.__telemetry.close()
+        self.__update_status_report()
+        self.logger.status(self.__status_report)
+        self.logger.close()
+
+        return PartitionResult(
+            partition=self.partition,
+            status=self.__execution_status,
+            transaction_record=self.__transaction_record,
+            checkpoint=self.__checkpoint,
+            telemetry=self.__status_report.telemetry,
+            error=error_message,
+        )
+
     async def run(
         self,
         runtime_params: Optional[Dict[str, Any]] = None,
@@ -884,11 +1764,14 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
 
         Returns:
             ProcessStatus: SUCCESS if ETL completed, FAIL otherwise.
+
+        Raises:
+            asyncio.CancelledError: if the run is cancelled (e.g., `asyncio.wait_for`
+                timeout); the ETLRun is finalized as FAIL first.
         """
 
         restore_params = self.__set_runtime_params(runtime_params)
-        self.__execution_status = ProcessStatus.IN_PROGRESS
-        self.__start_time = datetime.now()
+        self.__initialize_run()
 
         await self.__register_etl_run()
 
@@ -896,11 +1779,22 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         self.logger.log_plugin_run_start(self.run_id)
 
         error_message = None
+        cancelled = False
         try:
             await self.__preprocess()
             await self.__undo()
             await self.__run()
 
+        except asyncio.CancelledError:  # e.g., pipeline task timeout
+            # finalize the run (below), then re-raise so the caller sees the cancellation
+            cancelled = True
+            self.__execution_status = ProcessStatus.FAIL
+            error_message = "ETL Plugin Run Cancelled"
+            if self.is_etl_run and self.__checkpoint is not None:
+                self.logger.checkpoint(self.__checkpoint)
+            self.logger.warning(error_message)
+            raise
+
         except Exception as err:
             # ETL failed
             self.__execution_status = ProcessStatus.FAIL
@@ -914,10 +1808,17 @@ class AbstractBasePlugin(ABC, ComponentBaseMixin):
         finally:
             if self.__execution_status != ProcessStatus.SUCCESS:
                 await self.__summarize_transactions()
+            self.__telemetry.close()
             await self.__finalize_etl_run(error_message)
             self.logger.status(self.__status_report)
 
+            if self.commit and not self.is_dry_run and self.affected_tables:
+                # references loaded from tables this run wrote to are stale
+                ReferenceCache.invalidate(self.affected_tables)
+
             if runtime_params:  # restore plugin parameters
                 self._params = self.parameter_model(**restore_params)
 
-            return self.__execution_status
+            self.logger.close()  # write out the log and stop the log writer thread
+            if not cancelled:  # returning would swallow the CancelledError
+                return self.__execution_status
@@ -0,0 +1,90 @@
+from typing import Optional
+
+
+class AdaptiveBatchSizer:
+    """
+    Tunes the commit batch size of a plugin at runtime.
+
+    After each commit, the batch size is scaled toward the size expected to
+    meet the target commit latency (the wall time of a batch, from the
+    previous commit to this one).  Changes are limited to a factor of 2 per
+    batch and ignored if < 10% to avoid oscillation.  If the process memory
+    (RSS) exceeds the ceiling, the batch size is halved regardless of latency,
+    and it is not grown within 10% of the ceiling.
+
+    Adjustments only take effect at batch boundaries, so resume checkpoints
+    (always the last record of a committed batch) are unaffected.
+
+    Args:
+        batch_size (int): initial batch size.
+        min_batch_size (int): lower bound.
+        max_batch_size (int): upper bound.
+        target_seconds (float): target batch (commit) latency in seconds.
+        max_memory_mb (Optional[float]): RSS ceiling in MB; no ceiling if None.
+    """
+
+    MAX_SCALE_FACTOR = 2.0
+    MIN_RELATIVE_CHANGE = 0.1
+    MEMORY_HEADROOM = 0.9
+
+    def __init__(
+        self,
+        batch_size: int,
+        min_batch_size: int,
+        max_batch_size: int,
+        target_seconds: float,
+        max_memory_mb: Optional[float] = None,
+    ):
+        if min_batch_size > max_batch_size:
+            raise ValueError(
+                f"Invalid batch size bounds: min ({min_batch_size}) > max ({max_batch_size})"
+            )
+        self.__min_batch_size = min_batch_size
+        self.__max_batch_size = max_batch_size
+        self.__target_seconds = target_seconds
+        self.__max_memory_mb = max_memory_mb
+        self.__batch_size = self.__bound(batch_size)
+
+    @property
+    def batch_size(self) -> int:
+        return self.__batch_size
+
+    def __bound(self, batch_size: float) -> int:
+        return int(max(self.__min_batch_size, min(self.__max_batch_size, batch_size)))
+
+    def update(self, seconds: float, memory_mb: float) -> Optional[str]:
+        """
+        Update the batch size given the latency and memory usage of the last batch.
+
+        Args:
+            seconds (float): wall time of the last batch.
+            memory_mb (float): current process RSS in MB.
+
+        Returns:
+            Optional[str]: reason for the adjustment, or None if the batch size
+                was not changed.
+        """
+        if self.__max_memory_mb is not None and memory_mb > self.__max_memory_mb:
+            new_size = self.__bound(self.__batch_size / self.MAX_SCALE_FACTOR)
+            reason = f"RSS {memory_mb:.0f}MB > {self.__max_memory_mb:.0f}MB"
+        elif seconds > 0:
+            scale = self.__target_seconds / seconds
+            scale = max(1 / self.MAX_SCALE_FACTOR, min(self.MAX_SCALE_FACTOR, scale))
+            if abs(scale - 1) < self.MIN_RELATIVE_CHANGE:
+                return None
+            if (
+                scale > 1
+                and self.__max_memory_mb is not None
+                and memory_mb > self.MEMORY_HEADROOM * self.__max_memory_mb
+            ):  # don't grow close to the memory ceiling
+                return None
+            new_size = self.__bound(self.__batch_size * scale)
+            reason = f"batch latency {seconds:.2f}s; target {self.__target_seconds:.2f}s"
+        else:
+            return None
+
+        if new_size == self.__batch_size:
+            return None
+
+        self.__batch_size = new_size
+        return reason
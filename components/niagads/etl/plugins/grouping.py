@@ -0,0 +1,128 @@
+"""
+Helpers for streaming group-by aggregation in BATCH loads.
+
+Records are grouped by key so that all records sharing a key reach the same
+`transform` call, without materializing the whole dataset in memory:
+
+- sorted input: adjacent records are grouped as they are read
+- unsorted input: records are spilled to hash partitioned temporary files
+  and each partition is grouped in memory, so memory is bounded by the
+  largest partition rather than the input size
+"""
+
+import pickle
+import tempfile
+from itertools import groupby
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Optional
+
+
+def group_sorted(records: Iterable, key: Callable[[Any], Hashable]) -> Iterator[List]:
+    """
+    Group records from an iterable that is sorted by key.
+
+    Args:
+        records (Iterable): records, sorted by key.
+        key (Callable): function returning the group key of a record.
+
+    Yields:
+        List: lists of records sharing a key, in input order.
+
+    Raises:
+        ValueError: if the input is found to be out of order.
+    """
+    previous_key = None
+    for group_key, group in groupby(records, key=key):
+        if previous_key is not None and group_key < previous_key:
+            raise ValueError(
+                f"Input is not sorted by group key: `{group_key}` found after `{previous_key}`"
+            )
+        previous_key = group_key
+        yield list(group)
+
+
+def group_external(
+    records: Iterable,
+    key: Callable[[Any], Hashable],
+    num_partitions: int = 64,
+    temp_dir: Optional[str] = None,
+) -> Iterator[List]:
+    """
+    Group records from unsorted input by spilling them to disk.
+
+    Records are pickled into `num_partitions` temporary files by hash of their
+    key; each partition is then read back and grouped in memory.  Groups are
+    yielded partition by partition (not in input order).
+
+    Args:
+        records (Iterable): records (must be picklable).
+        key (Callable): function returning the group key of a record.
+        num_partitions (int, optional): number of spill files. Defaults to 64.
+        temp_dir (Optional[str], optional): directory for the spill files;
+            system temp directory if None. Defaults to None.
+
+    Yields:
+        List: lists of records sharing a key.
+    """
+    with tempfile.TemporaryDirectory(dir=temp_dir, prefix="etl-groupby-") as spill_dir:
+        partitions = [
+            open(f"{spill_dir}/partition_{index}.pkl", "w+b")
+            for index in range(num_partitions)
+        ]
+        try:
+            for record in records:
+                pickle.dump(
+                    record,
+                    partitions[hash(key(record)) % num_partitions],
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            for partition in partitions:
+                partition.seek(0)
+                groups = {}
+                while True:
+                    try:
+                        record = pickle.load(partition)
+                    except EOFError:
+                        break
+                    groups.setdefault(key(record), []).append(record)
+
+                partition.close()
+                yield from groups.values()
+        finally:
+            for partition in partitions:
+                partition.close()
+
+
+def chunk_groups(groups: Iterable[List], size: int) -> Iterator[List]:
+    """
+    Concatenate groups into chunks of ~`size` records, never splitting a group.
+
+    Args:
+        groups (Iterable[List]): lists of records sharing a key.
+        size (int): target number of records per chunk.
+
+    Yields:
+        List: chunks of whole groups.
+    """
+    chunk = []
+    for group in groups:
+        chunk.extend(group)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def chunk_stream(records: Iterable, size: int) -> Iterator[List]:
+    """
+    Split a stream of (ungrouped) records into lists of `size` records.
+
+    Args:
+        records (Iterable): records.
+        size (int): number of records per chunk (the last may be smaller).
+
+    Yields:
+        List: chunks of records.
+    """
+    return chunk_groups(([record] for record in records), size)
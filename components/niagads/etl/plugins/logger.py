@@ -1,6 +1,8 @@
 import logging
 import os
-from typing import Any, Optional
+import queue
+from logging.handlers import QueueListener
+from typing import Any, Dict, List, Optional
 
 
 from niagads.common.types import ETLOperation
@@ -10,7 +12,7 @@ from niagads.etl.plugins.parameters import BasePluginParams
 from niagads.loaders.core import Settings
 from niagads.utils.logging import (
     LOG_FORMAT_STR,
-    ExitOnExceptionHandler,
+    ExitOnExceptionQueueHandler,
     FunctionContextLoggerWrapper,
 )
 
@@ -21,21 +23,51 @@ from niagads.utils.string import matches
 
 KEYW = 16
 
+# max log records buffered for the log writer thread
+LOG_QUEUE_SIZE = 10000
+
+# max occurrences of a repeated warning logged per batch (all in debug mode)
+REPEATED_WARNING_LIMIT = 5
+
 
 class ETLLogger:
     """
     ETL-specific text logger
     Always logs in human-readable text format and includes run_id, plugin, and task_id in all logs automatically.
+
+    Records are written to the log file by a background thread (through a
+    bounded queue), so logging does not block the event loop on disk I/O.
+    ERROR and CRITICAL records flush the queue and exit, as with
+    `ExitOnExceptionHandler`; `flush` waits until all queued records are written.
     """
 
     def __init__(self, name: str, log_file: str, debug: bool = False):
         self._debug = debug
         logger = logging.getLogger(name)  # , run_id=run_id)# , plugin, task_id)
-        handler = ExitOnExceptionHandler(
-            filename=log_file, mode="w", format=LOG_FORMAT_STR
-        )
+
+        # replace (and stop the log writer thread of) the handler of a previous logger w/the same name
+        for previous in list(logger.handlers):
+            if isinstance(previous, ExitOnExceptionQueueHandler):
+                logger.removeHandler(previous)
+                previous.close()
+
+        # truncate, then append, so records logged after `close` reopen the file
+        open(log_file, "w").close()
+        file_handler = logging.FileHandler(log_file, mode="a", delay=True)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT_STR))
+        log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+
+        # not registered w/atexit (which would keep the logger alive);
+        # `logging.shutdown` closes the handler, writing out queued records, on exit
+        handler = ExitOnExceptionQueueHandler(log_queue, listener)
+        self.__handler = handler
         logger.addHandler(handler)
 
+        # repeated warning summary -> (count, logged) in the current batch
+        self.__repeated_warnings: Dict[str, List[int]] = {}
+
         # deal with sqlalchemy echo in debug+verbose mode
         sqlalchemy.log._add_default_handler = lambda x: None
         sqlalchemy_logger = logging.getLogger("sqlalchemy.engine")
@@ -54,12 +86,18 @@ class ETLLogger:
             sqlalchemy_logger.setLevel(logging.INFO)
 
     def flush(self):
-        for h in self.__logger.handlers:
+        """Wait until queued records are written to the log file."""
+        self.__handler.drain()
+        for h in self.__handler.listener.handlers:
             try:
                 h.flush()
             except Exception:
                 pass
 
+    def close(self):
+        """Write out queued records and stop the log writer thread."""
+        self.__handler.close()
+
     def _format_message(self, *args):
         """
         Simple string formatting for all arguments. No pretty-printing of complex objects.
@@ -88,6 +126,33 @@ class ETLLogger:
     def debug(self, *args):
         self.__logger.debug(self._format_message(*args))
 
+    def repeated_warning(self, summary: str, *args, limit: int = REPEATED_WARNING_LIMIT):
+        """
+        Log a warning that may repeat for many records (e.g., skipped duplicates).
+
+        Only the first `limit` occurrences in a batch are logged (all in debug
+        mode); `summarize_repeated_warnings` logs the batch totals, e.g.,
+        "1520 duplicate variants skipped in last batch".
+
+        Args:
+            summary (str): summary of the warning, used as the aggregation key.
+            *args: warning message.
+            limit (int, optional): max occurrences logged per batch.
+                Defaults to REPEATED_WARNING_LIMIT.
+        """
+        counts = self.__repeated_warnings.setdefault(summary, [0, 0])
+        counts[0] += 1
+        if self._debug or counts[1] < limit:
+            counts[1] += 1
+            self.warning(*args)
+
+    def summarize_repeated_warnings(self):
+        """Log the totals of repeated warnings since the last summary and reset them."""
+        for summary, (count, logged) in self.__repeated_warnings.items():
+            suppressed = f" ({count - logged} not logged)" if count > logged else ""
+            self.warning(f"{count} {summary} in last batch{suppressed}")
+        self.__repeated_warnings = {}
+
     def report_section(
         self, section: str, width: int = 60, char: str = "-", returnStr: bool = False
     ):
@@ -183,6 +248,8 @@ class ETLLogger:
         Logs zero if inserts/updates are empty.
         """
 
+        self.summarize_repeated_warnings()
+
         prefix = "TEST" if status.mode == ETLExecutionMode.DRY_RUN else "RUN"
         self.report_section(f"{prefix} Transaction Summary")
 
@@ -214,7 +281,22 @@ class ETLLogger:
         if status.memory is not None:
             self.info(f"{'MEMORY':<{KEYW}} : {status.memory:.2f}MB")
 
+        if status.rows_per_second is not None:
+            self.info(f"{'THROUGHPUT':<{KEYW}} : {status.rows_per_second:.0f} rows/sec")
+
+        if status.batch_rows_per_second is not None:
+            stats = status.batch_rows_per_second
+            self.info(
+                f"{'BATCH THROUGHPUT':<{KEYW}} : {status.batch_count} batches; "
+                f"rows/sec min = {stats['min']:.0f} | mean = {stats['mean']:.0f} | "
+                f"max = {stats['max']:.0f} | last = {stats['last']:.0f}"
+            )
+
+        if status.telemetry is not None:
+            self.info(f"{'STAGE TIMES':<{KEYW}} : {status.telemetry.as_info_string()}")
+
         self.report_section_end("Transaction Summary")
+        self.flush()
 
     @property
     def level(self):
@@ -2,7 +2,7 @@ from typing import List, Optional, Type
 
 from niagads.common.types import ETLOperation
 from niagads.etl.plugins.parameters import BasePluginParams
-from niagads.etl.plugins.types import ETLLoadStrategy
+from niagads.etl.plugins.types import ETLInsertMethod, ETLLoadStrategy
 from pydantic import BaseModel
 from sqlalchemy.orm import DeclarativeBase
 
@@ -17,3 +17,7 @@ class PluginMetadata(BaseModel, arbitrary_types_allowed=True):
     is_large_dataset: bool = False
     parameter_model: Type[BasePluginParams]
     can_resume: Optional[bool] = False
+    pipelined: Optional[bool] = False
+    streaming: Optional[bool] = False
+    transform_workers: Optional[int] = None
+    insert_method: ETLInsertMethod = ETLInsertMethod.ORM
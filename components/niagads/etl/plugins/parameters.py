@@ -1,5 +1,6 @@
 from typing import Optional, Union
 
+from niagads.etl.plugins.profiling import ProfileMode
 from niagads.etl.plugins.types import ResumeCheckpoint
 from niagads.etl.types import ETLExecutionMode
 from niagads.nlp.llm_types import LLM, NLPModelType
@@ -12,8 +13,22 @@ class BasePluginParams(BaseModel):
 
     Attributes:
         batch_size (int): Number of records to buffer before each load/commit in streaming mode.
+        adaptive_batch_size (bool): Tune batch size at runtime between `min_batch_size` and `max_batch_size`
+            to meet `target_commit_seconds` without exceeding `max_memory_mb`.
+        pipeline_queue_size (int): Max chunks buffered between stages in pipelined CHUNKED loads.
+        transform_workers (Optional[int]): Override the number of transform worker processes set in the plugin metadata.
+        partition_workers (int): Number of partitions loaded concurrently by plugins that implement `partitions`.
+        partition (Optional[str]): Load only this partition (e.g., a chromosome).
+        reference_cache_dir (Optional[str]): Directory for persistent reference lookup table snapshots.
+        metrics_file (Optional[str]): JSON-lines file for per-batch telemetry.
+        prometheus_textfile (Optional[str]): Prometheus textfile for the latest batch telemetry.
+        pushgateway_url (Optional[str]): Prometheus Pushgateway URL for the latest batch telemetry.
+        profile (Optional[ProfileMode]): Profile the extract/transform/load run (SAMPLE or CPROFILE).
+        profile_output (Optional[str]): Profile output path (without extension); defaults to the log file path.
+        profile_top_n (Optional[int]): Number of hotspots reported in the plugin log.
         log_file (str): Path to the JSON log file for this plugin invocation.
         resume_at (Optional[ResumeFrom]): Resume checkpoint hints, interpreted by plugins (extract/transform).
+        resume_offset (Optional[int]): File (byte or BGZF virtual) offset of the resume checkpoint record.
         run_id (Optional[str]): Pipeline run identifier, provided by the pipeline.
         connection_string (Optional[str]): Database connection string, if needed.
 
@@ -31,9 +46,98 @@ class BasePluginParams(BaseModel):
         ge=1,
         description="load batch size; indicates number of records to buffer or bulk insert per commit",
     )
+    adaptive_batch_size: Optional[bool] = Field(
+        default=False,
+        description="tune the batch size at runtime to meet `target_commit_seconds` and `max_memory_mb`; `batch_size` is the initial value",
+    )
+    min_batch_size: Optional[int] = Field(
+        default=500, ge=1, description="lower bound for adaptive batch sizing"
+    )
+    max_batch_size: Optional[int] = Field(
+        default=100000, ge=1, description="upper bound for adaptive batch sizing"
+    )
+    target_commit_seconds: Optional[float] = Field(
+        default=10.0,
+        gt=0,
+        description="target time (in seconds) to load and commit a batch when using adaptive batch sizing",
+    )
+    max_memory_mb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="memory (RSS) ceiling in MB for adaptive batch sizing; batch size is reduced when exceeded",
+    )
+    pipeline_queue_size: Optional[int] = Field(
+        default=4,
+        ge=1,
+        description="max number of extracted or transformed chunks buffered between stages in pipelined CHUNKED loads",
+    )
+    transform_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="number of transform worker processes; overrides the plugin metadata (CHUNKED or streaming BATCH loads only)",
+    )
+    partition_workers: Optional[int] = Field(
+        default=1,
+        ge=1,
+        description="plugins that support partitioned loads: number of partitions (e.g., chromosomes) to load concurrently, each in its own process",
+    )
+    partition: Optional[str] = Field(
+        default=None,
+        description="plugins that support partitioned loads: load (or resume) only this partition",
+    )
+    reference_cache_dir: Optional[str] = Field(
+        default=None,
+        description="directory for persistent snapshots of reference lookup tables (e.g., bin index, gene and ontology term maps), "
+        "reused across pipeline tasks and runs; references are cached in memory only if not set",
+    )
+    metrics_file: Optional[str] = Field(
+        default=None,
+        description="JSON-lines file to append per-batch telemetry to (stage times, rows/sec, commit latency, RSS, queue depths, checkpoint)",
+    )
+    prometheus_textfile: Optional[str] = Field(
+        default=None,
+        description="Prometheus textfile (node_exporter textfile collector) to export the latest batch telemetry to",
+    )
+    pushgateway_url: Optional[str] = Field(
+        default=None,
+        description="Prometheus Pushgateway URL to push the latest batch telemetry to",
+    )
+    profile: Optional[ProfileMode] = Field(
+        default=None,
+        description="profile the extract/transform/load run: SAMPLE (low-overhead sampling profiler; "
+        "writes collapsed stacks for flamegraphs) or CPROFILE (deterministic, for short runs; writes a pstats file); "
+        "top hotspots are reported in the plugin log",
+    )
+    profile_output: Optional[str] = Field(
+        default=None,
+        description="profile output path, without extension (.collapsed or .prof); defaults to the log file path",
+    )
+    profile_top_n: Optional[int] = Field(
+        default=20,
+        ge=1,
+        description="number of profile hotspots reported in the plugin log",
+    )
+    group_input_sorted: Optional[bool] = Field(
+        default=False,
+        description="streaming BATCH loads w/group-by: input is sorted by group key, so records can be grouped without spilling to disk",
+    )
+    group_spill_partitions: Optional[int] = Field(
+        default=64,
+        ge=1,
+        description="streaming BATCH loads w/group-by: number of temporary files used to group unsorted input",
+    )
     resume_after: Optional[Union[str, int]] = Field(
         default=None, description="resume checkpoint, a line number or record ID."
     )
+    resume_offset: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="file offset from the resume checkpoint (`offset`); lets plugins that support it seek to the checkpoint instead of re-parsing the file",
+    )
+    undo_drop_indexes: Optional[bool] = Field(
+        default=False,
+        description="UNDO large datasets only: drop secondary indexes on affected tables before deleting and recreate them after",
+    )
     database_uri: Optional[str] = Field(
         default=None,
         description="database connection string; if not provided, the plugin will try to assign from `DATABASE_URI` property in an `.env` file",
@@ -41,6 +145,11 @@ class BasePluginParams(BaseModel):
     run_id: Optional[int] = Field(
         default=None, description="ETL run ID  (required for UNDO)", exclude=True
     )
+    fingerprint: Optional[str] = Field(
+        default=None,
+        description="pipeline task fingerprint recorded with the ETL run; provided by the pipeline",
+        exclude=True,
+    )
 
     # this shouldn't happen BTW b/c ge validator already set
     @model_validator(mode="after")
@@ -49,6 +158,33 @@ class BasePluginParams(BaseModel):
             self.batch_size = None
         return self
 
+    @model_validator(mode="after")
+    def validate_resume_offset(self):
+        if self.resume_offset is not None and self.resume_after is None:
+            raise ValueError("`resume_offset` requires `resume_after`")
+        return self
+
+    @model_validator(mode="after")
+    def validate_partitioned_resume(self):
+        if (
+            self.resume_after is not None
+            and self.partition_workers > 1
+            and self.partition is None
+        ):
+            raise ValueError(
+                "Checkpoints are per partition; use `partition` to resume a partitioned load"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_batch_size_bounds(self):
+        if self.adaptive_batch_size and self.min_batch_size > self.max_batch_size:
+            raise ValueError(
+                f"Invalid adaptive batch size bounds: min_batch_size ({self.min_batch_size}) "
+                f"> max_batch_size ({self.max_batch_size})"
+            )
+        return self
+
     @staticmethod
     def log_validation_errors(validation_error: ValidationError, logger) -> str:
         errors = [f"--{e['loc'][0]} - {e["msg"]}" for e in validation_error.errors()]
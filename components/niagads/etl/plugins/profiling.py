@@ -0,0 +1,177 @@
+"""
+Profilers for plugin runs (`--profile`).
+
+- SAMPLE: a low-overhead sampling profiler; a background thread samples the
+  stacks of all threads in the process (e.g., the event loop and pipelined
+  extract threads) and writes them in the collapsed stack format used by
+  flamegraph tools (`flamegraph.pl`, speedscope, inferno)
+- CPROFILE: deterministic `cProfile`; higher overhead, best for short runs;
+  writes a `pstats` file (e.g., for snakeviz)
+
+Both log a top-N hotspot summary.  Transform worker and partition processes
+are not sampled by the parent's profiler (partitions are profiled separately).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from enum import auto
+from typing import List, Optional, Tuple
+
+from niagads.enums.core import CaseInsensitiveEnum
+
+# leaf frames of idle threads (e.g., pool workers waiting for work); not sampled
+_IDLE_FRAMES = {("threading.py", "wait"), ("queue.py", "get")}
+
+
+class ProfileMode(CaseInsensitiveEnum):
+    """
+    Plugin profiler:
+    - SAMPLE:   sampling profiler (low overhead); collapsed stacks for flamegraphs
+    - CPROFILE: deterministic profiler (cProfile); pstats file
+    """
+
+    SAMPLE = auto()
+    CPROFILE = auto()
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the call stacks of all other threads every `interval` seconds.
+
+    Args:
+        interval (float, optional): sampling interval in seconds. Defaults to 0.01.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.__interval = interval
+        self.__stacks: Counter = Counter()
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def samples(self) -> int:
+        return sum(self.__stacks.values())
+
+    def start(self):
+        self.__thread = threading.Thread(
+            target=self.__sample, name="etl-profiler", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __sample(self):
+        own_ident = threading.get_ident()
+        while not self.__stop.wait(self.__interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(thread_names.get(ident, str(ident)))
+                self.__stacks[tuple(reversed(stack))] += 1
+
+    def write_collapsed(self, path: str):
+        """Write `frame;frame;...;leaf count` lines (root first)."""
+        with open(path, "w") as fh:
+            for stack, count in self.__stacks.most_common():
+                fh.write(f"{';'.join(stack)} {count}\n")
+
+    def hotspots(self, top_n: int = 20) -> Tuple[List, List]:
+        """
+        Top functions by self samples (leaf frame) and by total samples (on the stack).
+
+        Returns:
+            Tuple[List, List]: (function, samples) pairs for self and total samples.
+        """
+        own, total = Counter(), Counter()
+        for stack, count in self.__stacks.items():
+            own[stack[-1]] += count
+            for frame in set(stack[1:]):  # skip thread name; count recursion once
+                total[frame] += count
+        return own.most_common(top_n), total.most_common(top_n)
+
+
+class PluginProfiler:
+    """
+    Profiles a plugin run and reports the results.
+
+    Args:
+        mode (ProfileMode): profiler to use.
+        output_prefix (str): output file path without extension;
+            `.collapsed` (SAMPLE) or `.prof` (CPROFILE) is appended.
+        top_n (int, optional): number of hotspots to report. Defaults to 20.
+    """
+
+    def __init__(self, mode: ProfileMode, output_prefix: str, top_n: int = 20):
+        self.__mode = ProfileMode(mode)
+        self.__output_prefix = output_prefix
+        self.__top_n = top_n
+        self.__profiler = None
+
+    def start(self):
+        """
+        Start profiling.
+
+        Raises:
+            ValueError: if another profiler (e.g., cProfile) is already active in this thread.
+        """
+        if self.__mode == ProfileMode.CPROFILE:
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+        else:
+            self.__profiler = SamplingProfiler()
+            self.__profiler.start()
+
+    def stop(self) -> List[str]:
+        """
+        Stop profiling and write the profile file.
+
+        Returns:
+            List[str]: report lines (output file and top-N hotspots).
+        """
+        if self.__mode == ProfileMode.CPROFILE:
+            self.__profiler.disable()
+            path = f"{self.__output_prefix}.prof"
+            self.__profiler.dump_stats(path)
+
+            stream = io.StringIO()
+            stats = pstats.Stats(self.__profiler, stream=stream)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.__top_n)
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(self.__top_n)
+            return [f"PROFILE: {path}"] + [
+                line for line in stream.getvalue().splitlines() if line.strip()
+            ]
+
+        self.__profiler.stop()
+        path = f"{self.__output_prefix}.collapsed"
+        self.__profiler.write_collapsed(path)
+
+        samples = self.__profiler.samples or 1
+        own, total = self.__profiler.hotspots(self.__top_n)
+        lines = [f"PROFILE: {path} ({self.__profiler.samples} samples)"]
+        for title, hotspots in (("SELF", own), ("TOTAL", total)):
+            lines.append(f"TOP {self.__top_n} BY {title} SAMPLES:")
+            lines.extend(
+                f"{count / samples:6.1%} {count:>8} {function}"
+                for function, count in hotspots
+            )
+        return lines
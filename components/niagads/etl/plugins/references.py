@@ -0,0 +1,193 @@
+"""
+Process-wide cache of reference lookup tables (e.g., the interval bin index,
+gene and ontology term primary key maps) shared by the plugins run in one
+pipeline.
+
+A reference is loaded once per process and reused by later plugins, as long
+as its source tables are unchanged.  A table's version is its max `run_id`
+(the ETL run that last inserted or updated rows), so references are reloaded
+after an upstream task writes to a source table.  Plugins also invalidate the
+references built from their `affected_tables` when they complete.
+
+If a cache directory is provided, references are also persisted as pickle
+snapshots and reused across processes (e.g., PROCESS stage workers) and
+pipeline runs.  References built from tables without a `run_id` are neither
+versioned nor persisted; they are only reloaded after an explicit
+invalidation.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase
+
+logger = logging.getLogger(__name__)
+
+
+def _table_name(table: Type[DeclarativeBase]) -> str:
+    return f"{table.__table__.schema}.{table.__table__.name}"
+
+
+class ReferenceCache:
+    """
+    Cache of reference lookup tables, keyed by name and loader arguments.
+
+    Usage:
+        bin_index = await ReferenceCache.get(
+            session, "bin_index", load_bin_index, sources=[IntervalBin]
+        )
+    """
+
+    # key -> (source table versions, value)
+    _entries: Dict[str, Tuple[Dict[str, Optional[int]], Any]] = {}
+    # key -> source table names
+    _sources: Dict[str, List[str]] = {}
+    # (event loop, key) -> lock; plugins may run in several event loops per process
+    _locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+
+    @staticmethod
+    def _key(name: str, database: str, **args) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                {"name": name, "database": database, **args},
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+
+    @staticmethod
+    async def _table_versions(
+        session: AsyncSession, sources: List[Type[DeclarativeBase]]
+    ) -> Dict[str, Optional[int]]:
+        """Max `run_id` of each source table (None if the table has no `run_id`)."""
+        versions = {}
+        for table in sources:
+            if "run_id" in table.__table__.columns:
+                versions[_table_name(table)] = (
+                    await session.execute(select(func.max(table.run_id)))
+                ).scalar_one_or_none()
+            else:
+                versions[_table_name(table)] = None
+        return versions
+
+    @staticmethod
+    def _snapshot_path(cache_dir: str, name: str, key: str) -> str:
+        return os.path.join(cache_dir, f"{name}-{key[:16]}.pkl")
+
+    @classmethod
+    def _read_snapshot(
+        cls, path: str, versions: Dict[str, Optional[int]]
+    ) -> Tuple[bool, Any]:
+        try:
+            with open(path, "rb") as fh:
+                snapshot = pickle.load(fh)
+        except FileNotFoundError:
+            return False, None
+        except Exception as err:  # corrupt or incompatible snapshot
+            logger.warning(f"Unable to read reference snapshot {path}: {err}")
+            return False, None
+        if snapshot["versions"] != versions:
+            return False, None
+        return True, snapshot["value"]
+
+    @staticmethod
+    def _write_snapshot(
+        path: str, versions: Dict[str, Optional[int]], value: Any
+    ) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(
+                    {"versions": versions, "value": value},
+                    fh,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, path)  # atomic; concurrent readers see old or new
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @classmethod
+    async def get(
+        cls,
+        session: AsyncSession,
+        name: str,
+        loader: Callable[[AsyncSession], Awaitable[Any]],
+        sources: List[Type[DeclarativeBase]],
+        cache_dir: Optional[str] = None,
+        **args,
+    ) -> Any:
+        """
+        Get a reference, loading it if not cached or if a source table changed.
+
+        The cached value is shared; callers must not modify it.
+
+        Args:
+            session (AsyncSession): database session.
+            name (str): reference name.
+            loader (Callable[[AsyncSession], Awaitable[Any]]): async function
+                loading the reference (the value must be picklable to persist it).
+            sources (List[Type[DeclarativeBase]]): tables the reference is built from.
+            cache_dir (Optional[str], optional): directory for persistent
+                snapshots; memory only if None. Defaults to None.
+            **args: loader arguments that identify the reference (e.g., an
+                external_database_id); part of the cache key.
+
+        Returns:
+            Any: the reference.
+        """
+        key = cls._key(name, str(session.bind.url), **args)
+        lock = cls._locks.setdefault(
+            (id(asyncio.get_running_loop()), key), asyncio.Lock()
+        )
+        async with lock:
+            versions = await cls._table_versions(session, sources)
+            persist = cache_dir is not None and None not in versions.values()
+
+            if key in cls._entries and cls._entries[key][0] == versions:
+                logger.debug(f"Reference `{name}` cache hit")
+                return cls._entries[key][1]
+
+            path = cls._snapshot_path(cache_dir, name, key) if persist else None
+            found, value = cls._read_snapshot(path, versions) if persist else (False, None)
+            if found:
+                logger.info(f"Reference `{name}` loaded from snapshot {path}")
+            else:
+                value = await loader(session)
+                logger.info(f"Reference `{name}` loaded from the database")
+                if persist:
+                    try:
+                        cls._write_snapshot(path, versions, value)
+                    except Exception as err:
+                        logger.warning(
+                            f"Unable to write reference snapshot {path}: {err}"
+                        )
+
+            cls._entries[key] = (versions, value)
+            cls._sources[key] = [_table_name(table) for table in sources]
+            return value
+
+    @classmethod
+    def invalidate(cls, tables: Optional[List[Type[DeclarativeBase]]] = None) -> None:
+        """
+        Drop the cached references built from any of the tables (all if None).
+        Snapshots are revalidated against the table versions when next read.
+
+        Args:
+            tables (Optional[List[Type[DeclarativeBase]]], optional): changed
+                tables. Defaults to None.
+        """
+        names = None if tables is None else {_table_name(table) for table in tables}
+        for key in list(cls._entries):
+            if names is None or names.intersection(cls._sources[key]):
+                del cls._entries[key]
+                del cls._sources[key]
@@ -0,0 +1,281 @@
+"""
+Per-batch ETL telemetry.
+
+The plugin base times the extract, transform, load, and commit stages and
+records a `BatchMetrics` entry after each committed (or rolled back) batch.
+Metrics are appended to a JSON-lines file and, optionally, exported in the
+Prometheus text exposition format, to a textfile (for the node_exporter
+textfile collector) and / or a Pushgateway.
+"""
+
+import logging
+import os
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional
+
+from niagads.etl.plugins.types import BatchMetrics, ETLStage, TelemetrySummary
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "niagads_etl"
+
+
+def timed_iterator(
+    iterable: Iterable, telemetry: "ETLTelemetry", stage: ETLStage
+) -> Iterator:
+    """
+    Wrap an iterable, adding the time spent producing each item to a stage.
+
+    The wrapped iterable is closed (if it is a generator) when iteration ends
+    or the consumer stops early.
+    """
+    iterator = iter(iterable)
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                telemetry.add_time(stage, time.perf_counter() - start)
+            yield item
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()
+
+
+class ETLTelemetry:
+    """
+    Collects stage timings and emits per-batch metrics for a plugin run.
+
+    Stage times may be added from a producer thread (pipelined extract);
+    each stage is only timed by one thread.
+
+    Args:
+        plugin (str): plugin (task) name.
+        metrics_file (Optional[str]): JSON-lines metrics file (appended to).
+        prometheus_textfile (Optional[str]): Prometheus textfile, rewritten
+            after each batch (at most every `export_interval` seconds).
+        pushgateway_url (Optional[str]): Prometheus Pushgateway base URL.
+        export_interval (float): min seconds between Prometheus exports. Defaults to 15.
+    """
+
+    def __init__(
+        self,
+        plugin: str,
+        metrics_file: Optional[str] = None,
+        prometheus_textfile: Optional[str] = None,
+        pushgateway_url: Optional[str] = None,
+        export_interval: float = 15,
+    ):
+        self.__plugin = plugin
+        self.__metrics_file = metrics_file
+        self.__prometheus_textfile = prometheus_textfile
+        self.__pushgateway_url = pushgateway_url.rstrip("/") if pushgateway_url else None
+        self.__export_interval = export_interval
+
+        self.__stage_seconds: Dict[ETLStage, float] = {stage: 0.0 for stage in ETLStage}
+        self.__last_stage_seconds: Dict[ETLStage, float] = dict(self.__stage_seconds)
+        self.__summary = TelemetrySummary()
+        self.__last: Optional[BatchMetrics] = None
+        self.__last_export: float = 0
+        self.__push_thread: Optional[threading.Thread] = None
+        self.__push_failed = False
+
+    @property
+    def summary(self) -> TelemetrySummary:
+        return self.__summary
+
+    @property
+    def totals(self) -> TelemetrySummary:
+        """
+        Batch totals plus the stage times not (yet) attributed to a batch,
+        e.g., the extract and transform times of a DRY_RUN (nothing is loaded).
+        """
+        totals = self.__summary.model_copy()
+        for stage in ETLStage:
+            field = f"{str(stage).lower()}_seconds"
+            residual = self.__stage_seconds[stage] - self.__last_stage_seconds[stage]
+            setattr(totals, field, getattr(totals, field) + residual)
+        return totals
+
+    @property
+    def is_exporting(self) -> bool:
+        """Whether batch metrics are written anywhere (otherwise only summarized)."""
+        return any(
+            (self.__metrics_file, self.__prometheus_textfile, self.__pushgateway_url)
+        )
+
+    def add_time(self, stage: ETLStage, seconds: float):
+        self.__stage_seconds[stage] += seconds
+
+    @contextmanager
+    def timer(self, stage: ETLStage):
+        """Context manager adding the time spent in the block to a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def record_batch(
+        self,
+        rows: int,
+        seconds: float,
+        batch_size: int,
+        rss_mb: float,
+        run_id: Optional[int] = None,
+        partition: Optional[str] = None,
+        checkpoint: Optional[str] = None,
+        extract_queue_depth: Optional[int] = None,
+        load_queue_depth: Optional[int] = None,
+    ) -> BatchMetrics:
+        """
+        Record the metrics of a batch, with the stage times since the previous batch.
+
+        Returns:
+            BatchMetrics: the batch metrics.
+        """
+        stage_seconds = {
+            stage: self.__stage_seconds[stage] - self.__last_stage_seconds[stage]
+            for stage in ETLStage
+        }
+        self.__last_stage_seconds = dict(self.__stage_seconds)
+
+        metrics = BatchMetrics(
+            plugin=self.__plugin,
+            run_id=run_id,
+            partition=partition,
+            batch=self.__summary.batches + 1,
+            timestamp=time.time(),
+            rows=rows,
+            seconds=seconds,
+            rows_per_second=rows / seconds if seconds > 0 else 0.0,
+            batch_size=batch_size,
+            extract_seconds=stage_seconds[ETLStage.EXTRACT],
+            transform_seconds=stage_seconds[ETLStage.TRANSFORM],
+            load_seconds=stage_seconds[ETLStage.LOAD],
+            commit_seconds=stage_seconds[ETLStage.COMMIT],
+            rss_mb=rss_mb,
+            extract_queue_depth=extract_queue_depth,
+            load_queue_depth=load_queue_depth,
+            checkpoint=checkpoint,
+        )
+        self.__summary.add(metrics)
+        self.__last = metrics
+
+        if self.__metrics_file:
+            self.__write_metrics_line(metrics)
+        if time.monotonic() - self.__last_export >= self.__export_interval:
+            self.__export_prometheus()
+        return metrics
+
+    def close(self):
+        """Export the final metrics and wait for the Pushgateway push."""
+        if self.__push_thread is not None:
+            self.__push_thread.join()
+        if self.__last is not None:
+            self.__export_prometheus()
+        if self.__push_thread is not None:
+            self.__push_thread.join()
+
+    def __write_metrics_line(self, metrics: BatchMetrics):
+        try:
+            # single write per line, so concurrent partitions can share the file
+            with open(self.__metrics_file, "a") as fh:
+                fh.write(metrics.model_dump_json() + "\n")
+        except OSError as err:
+            logger.warning(f"Unable to write ETL metrics to {self.__metrics_file}: {err}")
+
+    def __export_prometheus(self):
+        if self.__last is None or not (
+            self.__prometheus_textfile or self.__pushgateway_url
+        ):
+            return
+        self.__last_export = time.monotonic()
+        text = self.__exposition()
+        if self.__prometheus_textfile:
+            try:
+                temp_file = f"{self.__prometheus_textfile}.{os.getpid()}.tmp"
+                with open(temp_file, "w") as fh:
+                    fh.write(text)
+                os.replace(temp_file, self.__prometheus_textfile)
+            except OSError as err:
+                logger.warning(
+                    f"Unable to write Prometheus textfile {self.__prometheus_textfile}: {err}"
+                )
+        if self.__pushgateway_url and not self.__push_failed:
+            if self.__push_thread is None or not self.__push_thread.is_alive():
+                self.__push_thread = threading.Thread(
+                    target=self.__push, args=(text,), daemon=True
+                )
+                self.__push_thread.start()
+
+    def __push(self, text: str):
+        labels = self.__labels()
+        url = f"{self.__pushgateway_url}/metrics/job/{METRIC_PREFIX}/plugin/{labels['plugin']}"
+        if "partition" in labels:
+            url += f"/partition/{labels['partition']}"
+        request = urllib.request.Request(
+            url,
+            data=text.encode(),
+            method="PUT",
+            headers={"Content-Type": "text/plain; version=0.0.4"},
+        )
+        try:
+            urllib.request.urlopen(request, timeout=5).close()
+        except Exception as err:
+            self.__push_failed = True  # don't retry (and slow down) every batch
+            logger.warning(f"Unable to push ETL metrics to {self.__pushgateway_url}: {err}")
+
+    def __labels(self) -> Dict[str, str]:
+        labels = {"plugin": self.__plugin}
+        if self.__last.run_id is not None:
+            labels["run_id"] = str(self.__last.run_id)
+        if self.__last.partition is not None:
+            labels["partition"] = self.__last.partition
+        return labels
+
+    def __exposition(self) -> str:
+        """Current metrics in the Prometheus text exposition format."""
+        labels = self.__labels()
+        label_str = ",".join(f'{key}="{value}"' for key, value in labels.items())
+        summary, last = self.__summary, self.__last
+
+        lines = []
+        declared = set()
+
+        def metric(name, kind, help, value, extra_labels: str = ""):
+            full_name = f"{METRIC_PREFIX}_{name}"
+            if full_name not in declared:
+                declared.add(full_name)
+                lines.append(f"# HELP {full_name} {help}")
+                lines.append(f"# TYPE {full_name} {kind}")
+            all_labels = ",".join(filter(None, (label_str, extra_labels)))
+            lines.append(f"{full_name}{{{all_labels}}} {value}")
+
+        metric("rows_total", "counter", "Transactions in committed batches", summary.rows)
+        metric("batches_total", "counter", "Committed batches", summary.batches)
+        for stage in ETLStage:
+            metric(
+                "stage_seconds_total",
+                "counter",
+                "Time spent in each load stage",
+                f"{self.__stage_seconds[stage]:.6f}",
+                f'stage="{str(stage).lower()}"',
+            )
+        metric("batch_rows_per_second", "gauge", "Throughput of the last batch", f"{last.rows_per_second:.3f}")
+        metric("batch_size", "gauge", "Current batch size", last.batch_size)
+        metric("rss_bytes", "gauge", "Resident memory of the plugin process", int(last.rss_mb * 1024 * 1024))
+        for queue, depth in (
+            ("extract", last.extract_queue_depth),
+            ("load", last.load_queue_depth),
+        ):
+            if depth is not None:
+                metric("queue_depth", "gauge", "Chunks waiting in the pipelined load queues", depth, f'queue="{queue}"')
+        metric("last_batch_timestamp_seconds", "gauge", "Unix time of the last batch", f"{last.timestamp:.3f}")
+        return "\n".join(lines) + "\n"
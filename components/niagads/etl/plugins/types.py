@@ -15,6 +15,8 @@ class ResumeCheckpoint(CustomBaseModel):
     Resume checkpoint.
     - Use 'line' for source-relative resume (handled in extract()).
     - Use 'record' for domain resume (handled in extract() or load()).
+    - 'offset' optionally locates the checkpoint record in the source file, so
+      extract() can seek to it instead of re-parsing (see `niagads.etl.utils.offset_line_reader`).
     """
 
     line: Optional[int] = Field(
@@ -25,6 +27,13 @@ class ResumeCheckpoint(CustomBaseModel):
         None, description="Natural identifier or full record to resume from"
     )
     record: Optional[dict] = None
+    offset: Optional[int] = Field(
+        None,
+        description=(
+            "Byte offset (BGZF virtual offset for bgzipped files) "
+            "of the start of the record in the source file"
+        ),
+    )
 
     @field_validator("record", mode="before")
     @classmethod
@@ -55,12 +64,108 @@ class ResumeCheckpoint(CustomBaseModel):
         return dict_to_info_string(values)
 
 
+class ETLStage(CaseInsensitiveEnum):
+    """Plugin load stages, timed by the ETL telemetry."""
+
+    EXTRACT = auto()
+    TRANSFORM = auto()
+    LOAD = auto()
+    COMMIT = auto()
+
+
+class BatchMetrics(BaseModel):
+    """
+    Telemetry for one committed (or rolled back) batch.
+
+    Stage times are the time spent in each stage since the previous batch; in
+    pipelined loads the stages overlap, so they can add up to more than `seconds`.
+    """
+
+    plugin: str
+    run_id: Optional[int] = None
+    partition: Optional[str] = None
+    batch: int = Field(..., description="Batch number (1-based)")
+    timestamp: float = Field(..., description="Unix time the batch was committed")
+    rows: int = Field(..., description="Transactions in the batch")
+    seconds: float = Field(..., description="Wall time since the previous batch")
+    rows_per_second: float
+    batch_size: int
+    extract_seconds: float = 0
+    transform_seconds: float = 0
+    load_seconds: float = 0
+    commit_seconds: float = Field(0, description="Flush + commit (or rollback) latency")
+    rss_mb: float
+    extract_queue_depth: Optional[int] = Field(
+        None, description="Extracted chunks waiting to be transformed (pipelined loads)"
+    )
+    load_queue_depth: Optional[int] = Field(
+        None, description="Transformed chunks waiting to be loaded (pipelined loads)"
+    )
+    checkpoint: Optional[str] = None
+
+
+class TelemetrySummary(BaseModel):
+    """Batch telemetry totals for a plugin run (or a pipeline stage)."""
+
+    batches: int = 0
+    rows: int = 0
+    seconds: float = 0
+    extract_seconds: float = 0
+    transform_seconds: float = 0
+    load_seconds: float = 0
+    commit_seconds: float = 0
+    max_rss_mb: float = 0
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        return self.rows / self.seconds if self.seconds > 0 else None
+
+    def add(self, metrics: BatchMetrics):
+        self.batches += 1
+        self.rows += metrics.rows
+        self.seconds += metrics.seconds
+        self.extract_seconds += metrics.extract_seconds
+        self.transform_seconds += metrics.transform_seconds
+        self.load_seconds += metrics.load_seconds
+        self.commit_seconds += metrics.commit_seconds
+        self.max_rss_mb = max(self.max_rss_mb, metrics.rss_mb)
+
+    def merge(self, other: "TelemetrySummary"):
+        """Add the totals of another run (e.g., a partition or a task in the same stage)."""
+        for field in (
+            "batches",
+            "rows",
+            "seconds",
+            "extract_seconds",
+            "transform_seconds",
+            "load_seconds",
+            "commit_seconds",
+        ):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self.max_rss_mb = max(self.max_rss_mb, other.max_rss_mb)
+
+    def as_info_string(self) -> str:
+        rate = self.rows_per_second
+        return (
+            f"{self.batches} batches; {self.rows} rows"
+            + (f" ({rate:.0f} rows/sec)" if rate is not None else "")
+            + f"; extract = {self.extract_seconds:.2f}s | transform = {self.transform_seconds:.2f}s"
+            f" | load = {self.load_seconds:.2f}s | commit = {self.commit_seconds:.2f}s"
+            f"; max RSS = {self.max_rss_mb:.0f}MB"
+        )
+
+
 class ETLRunStatus(BaseModel):
     """
     Status report for ETL operations.
 
     transactions: Dict mapping table names to operation counts.
         Format: {table_name: {operation: count}} or flat {table_name: count} for legacy.
+    rows_per_second: overall throughput (transactions / runtime).
+    batch_rows_per_second: {last, min, max, mean} throughput of committed batches.
+    checkpoint: checkpoint of the last committed batch (for resuming a failed run).
+    telemetry: per-stage time and throughput totals of the committed batches
+        (stage times include work not followed by a batch, e.g., in DRY_RUN).
     """
 
     transaction_record: Dict[str, Any] = None
@@ -73,6 +178,33 @@ class ETLRunStatus(BaseModel):
     memory: Optional[float] = None
     task_id: Optional[int] = None
     run_id: Optional[int] = None
+    rows_per_second: Optional[float] = None
+    batch_count: int = 0
+    batch_rows_per_second: Optional[Dict[str, float]] = None
+    checkpoint: Optional[ResumeCheckpoint] = None
+    telemetry: Optional[TelemetrySummary] = None
+
+    def record_batch(self, rows: int, seconds: float):
+        """
+        Update per-batch (commit) throughput statistics.
+
+        Args:
+            rows (int): number of transactions in the batch.
+            seconds (float): time elapsed since the previous batch was committed.
+        """
+        if seconds <= 0:
+            return
+        rate = rows / seconds
+        self.batch_count += 1
+        if self.batch_rows_per_second is None:
+            self.batch_rows_per_second = {"last": rate, "min": rate, "max": rate, "mean": rate}
+            return
+
+        stats = self.batch_rows_per_second
+        stats["last"] = rate
+        stats["min"] = min(stats["min"], rate)
+        stats["max"] = max(stats["max"], rate)
+        stats["mean"] += (rate - stats["mean"]) / self.batch_count
 
     def total_transactions(self):
         if self.transaction_record is None:
@@ -104,3 +236,34 @@ class ETLLoadStrategy(CaseInsensitiveEnum):
     CHUNKED = auto()
     BULK = auto()
     BATCH = auto()
+
+
+class ETLInsertMethod(CaseInsensitiveEnum):
+    """
+    How `AbstractBasePlugin.submit_many` writes new records.
+
+    - ORM: session `add_all` + flush; primary keys are fetched and records stay
+      attached to the session
+    - CORE: Core executemany `INSERT`; bypasses the ORM identity map and flush
+      events, but can return generated primary keys
+    - COPY: PostgreSQL COPY on the session connection; fastest, but bypasses
+      the ORM (no generated primary keys or relationships)
+    """
+
+    ORM = auto()
+    CORE = auto()
+    COPY = auto()
+
+
+class PartitionResult(BaseModel):
+    """
+    Outcome of loading one partition of a partitioned (sharded) plugin run;
+    returned by a partition worker process to the parent plugin.
+    """
+
+    partition: str
+    status: ProcessStatus
+    transaction_record: Dict[str, Dict[str, int]] = Field(default_factory=dict)
+    checkpoint: Optional[ResumeCheckpoint] = None
+    telemetry: Optional[TelemetrySummary] = None
+    error: Optional[str] = None
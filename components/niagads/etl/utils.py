@@ -1,7 +1,10 @@
+import bz2
+import gzip
 import importlib
 import pkgutil
 import re
-from typing import Any, Dict, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 from niagads.etl.plugins.projects import RegisteredETLProject
 
@@ -102,3 +105,79 @@ def register_plugins(
 
     for package_name in packages_list:
         register_package_plugins(package_name)
+
+
+BGZF_MAGIC = b"\x1f\x8b\x08\x04"  # gzip w/FEXTRA flag set
+
+
+def is_bgzf(path: str) -> bool:
+    """
+    Check if a file is BGZF (blocked gzip, e.g., bgzip / tabix indexed) compressed.
+
+    Args:
+        path (str): path to the file.
+
+    Returns:
+        bool: True if the first block has a BGZF ('BC') extra subfield.
+    """
+    with open(path, "rb") as fh:
+        header = fh.read(18)
+    return (
+        len(header) == 18 and header[:4] == BGZF_MAGIC and header[12:14] == b"BC"
+    )
+
+
+@contextmanager
+def offset_line_reader(
+    path: str, offset: Optional[int] = None, encoding: str = "utf-8"
+) -> Iterator[Iterator[Tuple[int, str]]]:
+    """
+    Context manager to read lines from a (compressed) text file along with the
+    offset of each line, optionally starting at an offset from a resume checkpoint.
+
+    Offsets are positions that can be passed back to `seek`:
+        - BGZF files (.gz/.bgz compressed w/bgzip): BGZF virtual offsets
+        - plain text files: byte offsets
+        - other .gz or .bz2 files: offsets in the uncompressed stream; seeking
+          still avoids re-parsing, but the skipped data must be decompressed
+
+    Args:
+        path (str): path to the file.
+        offset (Optional[int], optional): offset of the first line to read;
+            must be the start of a line (e.g., from `ResumeCheckpoint.offset`).
+            Defaults to None (start of file).
+        encoding (str, optional): text encoding. Defaults to "utf-8".
+
+    Yields:
+        Iterator[Tuple[int, str]]: (offset, line) pairs; lines include the newline.
+
+    Example:
+        with offset_line_reader(self._params.file, self._params.resume_offset) as reader:
+            for offset, line in reader:
+                ...
+    """
+    if is_bgzf(path):
+        from pysam import BGZFile
+
+        file_handle = BGZFile(path, "rb")
+    elif path.endswith(".gz"):
+        file_handle = gzip.open(path, "rb")
+    elif path.endswith(".bz2"):
+        file_handle = bz2.open(path, "rb")
+    else:
+        file_handle = open(path, "rb")
+
+    def read_lines():
+        while True:
+            line_offset = file_handle.tell()
+            line = file_handle.readline()
+            if not line:
+                return
+            yield line_offset, line.decode(encoding)
+
+    try:
+        if offset is not None:
+            file_handle.seek(offset)
+        yield read_lines()
+    finally:
+        file_handle.close()
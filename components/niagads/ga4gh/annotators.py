@@ -2,10 +2,10 @@ from ast import Dict
 import hashlib
 import json
 import logging
-from typing import Union
+from typing import List, Optional, Sequence, Union
 
 from ga4gh.core import ga4gh_identify
-from ga4gh.vrs.dataproxy import DataProxyValidationError, create_dataproxy
+from ga4gh.vrs.dataproxy import DataProxyValidationError
 from ga4gh.vrs.extras.translator import AlleleTranslator
 from ga4gh.vrs.models import (
     Allele,
@@ -21,9 +21,11 @@ from niagads.common.genomic.regions.models import (
     OneBasedGenomicRegion,
     ZeroBasedGenomicRegion,
 )
+from niagads.common.variant.models.ga4gh_vrs import Allele as VariantAllele
 from niagads.common.variant.models.record import VariantRecord
 from niagads.common.variant.types import VariantClass
 from niagads.exceptions.core import ValidationError
+from niagads.ga4gh.dataproxy import get_dataproxy
 from niagads.ga4gh.types import VariantNomenclature
 from niagads.genome_reference.human import GenomeBuild, HumanGenome
 
@@ -31,12 +33,16 @@ from niagads.genome_reference.human import GenomeBuild, HumanGenome
 logging.getLogger("ga4gh.vrs").setLevel(logging.WARNING)
 logging.getLogger("seqrepo").setLevel(logging.WARNING)
 
+# short indels with longer combined ref + alt alleles are keyed by a hashed VRS allele
+MAX_POSITIONAL_PRIMARY_KEY_ALLELE_LENGTH = 20
+
 
 class PrimaryKeyGenerator(ComponentBaseMixin):
     def __init__(
         self,
         genome_build: GenomeBuild,
         seqrepo_service_url: str,
+        sequence_cache_dir: Optional[str] = None,
         debug: bool = False,
         verbose: bool = False,
         logger=None,
@@ -44,13 +50,111 @@ class PrimaryKeyGenerator(ComponentBaseMixin):
         super().__init__(debug=debug, verbose=verbose, logger=logger)
         # self.logger.propagate = True
         self._vrs_service: GA4GHVRSService = GA4GHVRSService(
-            genome_build, seqrepo_service_url, debug=debug, verbose=verbose
+            genome_build,
+            seqrepo_service_url,
+            sequence_cache_dir=sequence_cache_dir,
+            debug=debug,
+            verbose=verbose,
         )
 
     @property
     def ga4gh_service(self):
         return self._vrs_service
 
+    @staticmethod
+    def is_positional_primary_key(ref: str, alt: str) -> bool:
+        """
+        Check if the primary key of a variant is its positional ID (`chrom:pos:ref:alt`),
+        i.e., SNVs, MNVs, and short indels with combined allele length ≤ 20.
+
+        Mirrors the variant class resolution of `VariantRecord` and `set_primary_key`.
+
+        Args:
+            ref (str): reference allele.
+            alt (str): alternative allele.
+
+        Returns:
+            bool: True if the primary key is the positional ID.
+        """
+        len_ref = len(ref)
+        len_alt = len(alt)
+        if len_ref == len_alt:  # SNV / MNV, regardless of length
+            return True
+        if len_ref >= 50 or len_alt >= 50:  # structural variant
+            return False
+        return len_ref + len_alt <= MAX_POSITIONAL_PRIMARY_KEY_ALLELE_LENGTH
+
+    def primary_keys(
+        self,
+        chromosomes: Sequence[str],
+        positions: Sequence[int],
+        refs: Sequence[str],
+        alts: Sequence[str],
+        require_validation: bool = True,
+        normalize: bool = True,
+    ) -> List[str]:
+        """
+        Generate the primary keys for a batch of variants.
+
+        Keys are identical to those assigned by the VCF loaders, i.e., by
+        `set_primary_key` to a `VariantRecord` whose `ga4gh_vrs` is the GA4GH VRS
+        allele of the variant (normalized if `normalize` is True).
+        SNVs, MNVs, and short indels (the bulk of dbSNP) are keyed by their
+        positional ID without creating variant records or GA4GH VRS alleles;
+        only structural variants and long indels take the `set_primary_key` path.
+
+        Args:
+            chromosomes (Sequence[str]): chromosome of each variant.
+            positions (Sequence[int]): 1-based position of each variant.
+            refs (Sequence[str]): reference allele of each variant.
+            alts (Sequence[str]): alternative allele of each variant.
+            require_validation (bool, optional): If True, validate reference alleles
+                of long indels against the reference sequence. Default is True.
+            normalize (bool, optional): If True, long indels are keyed by their
+                normalized GA4GH VRS allele (see the loaders' `skip_normalization`).
+                Default is True.
+
+        Returns:
+            List[str]: primary key of each variant.
+
+        Raises:
+            ValueError: If a chromosome is not a valid human chromosome.
+        """
+        for chromosome in set(chromosomes):
+            HumanGenome(chromosome)  # raises ValueError, like `from_positional_id`
+
+        keys = [
+            (
+                f"{chromosome}:{position}:{ref}:{alt}"
+                if self.is_positional_primary_key(ref, alt)
+                else None
+            )
+            for chromosome, position, ref, alt in zip(
+                chromosomes, positions, refs, alts
+            )
+        ]
+
+        for index, key in enumerate(keys):
+            if key is None:
+                variant = VariantRecord.from_positional_id(
+                    f"{chromosomes[index]}:{positions[index]}:{refs[index]}:{alts[index]}"
+                )
+                if variant.variant_class.is_short_indel():
+                    # long indels are keyed by a hash of the stored `ga4gh_vrs` allele
+                    allele = self._vrs_service.variant_to_vrs_allele(
+                        variant,
+                        require_validation=require_validation,
+                        normalize=normalize,
+                        as_json=False,
+                    )
+                    variant.ga4gh_vrs = VariantAllele(
+                        **allele.model_dump(exclude_none=True)
+                    )
+                self.set_primary_key(variant, require_validation=False)
+                keys[index] = variant.id
+
+        return keys
+
     def set_primary_key(self, variant: VariantRecord, require_validation: bool = True):
         if variant.variant_class.is_structural_variant():
             self.sv_primary_key(variant)
@@ -135,7 +239,10 @@ class PrimaryKeyGenerator(ComponentBaseMixin):
             )
 
         primary_key = variant.positional_id
-        if len(variant.ref) + len(variant.alt) > 20:
+        if (
+            len(variant.ref) + len(variant.alt)
+            > MAX_POSITIONAL_PRIMARY_KEY_ALLELE_LENGTH
+        ):
             # too long to be human readable and indexable
             # Hash the entire Allele (includes ref/alt), not just location
             allele = (
@@ -169,18 +276,29 @@ class PrimaryKeyGenerator(ComponentBaseMixin):
 class GA4GHVRSService(ComponentBaseMixin):
     """
     this normalizes, generates primary keys, and validates, standardizes using ga4gh.vrs
+
+    `seqrepo_service_url` may be a seqrepo REST service URL, a local seqrepo
+    directory, or a local (bgzipped) faidx-indexed FASTA file (`fasta+/path/to/GRCh38.fa.gz`);
+    see `niagads.ga4gh.dataproxy.get_dataproxy`
+
+    if `sequence_cache_dir` is set, refget accessions and reference sequence
+    windows fetched from seqrepo are cached on disk and shared with other
+    processes and runs (see `niagads.ga4gh.cache`)
     """
 
     def __init__(
         self,
         genome_build: GenomeBuild,
         seqrepo_service_url: str,
+        sequence_cache_dir: Optional[str] = None,
         debug: bool = False,
         verbose: bool = False,
         logger=None,
     ):
         super().__init__(debug=debug, verbose=verbose, logger=logger)
-        self._seqrepo_data_proxy = create_dataproxy(f"seqrepo+{seqrepo_service_url}")
+        self._seqrepo_data_proxy = get_dataproxy(
+            seqrepo_service_url, genome_build, sequence_cache_dir=sequence_cache_dir
+        )
         self._assembly: GenomeBuild = genome_build
         self._refget_accession_cache: dict = {}
 
@@ -510,6 +628,7 @@ class GA4GHVRSService(ComponentBaseMixin):
             refget_accession = self._seqrepo_data_proxy.translate_sequence_identifier(
                 key, "ga4gh"
             )[0]
+            self._refget_accession_cache[key] = refget_accession
         if not refget_accession:
             raise ValueError(
                 f"Unable to map chromosome {chromosome} to a GA4GH RefGet Accession"
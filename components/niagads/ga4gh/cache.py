@@ -0,0 +1,233 @@
+"""
+Persistent reference sequence cache for GA4GH VRS.
+
+`SequenceCache` stores refget accessions (by sequence identifier, e.g.,
+`GRCh38:1`) and fixed-size reference sequence tiles (by refget accession and
+tile offset) in a SQLite database, so that repeated loads, partitions, and
+transform worker processes do not re-fetch the same reference windows from a
+seqrepo service.
+
+The database is opened in WAL mode: any number of processes can read while
+one writes.  It is bounded by size; once full, the oldest tiles are evicted
+first.  Refget accessions are never evicted.
+
+`CachedDataProxy` wraps a `ga4gh.vrs` data proxy with a `SequenceCache`.
+"""
+
+import os
+import sqlite3
+from typing import List, Optional
+
+from ga4gh.vrs.dataproxy import _DataProxy
+
+DEFAULT_TILE_SIZE = 4096  # bases
+DEFAULT_MAX_SIZE_MB = 2048
+# reads longer than this many tiles (e.g., whole structural variants) bypass the cache
+MAX_CACHED_READ_TILES = 16
+# check the size bound after every N tile inserts
+EVICTION_INTERVAL = 1000
+BUSY_TIMEOUT_MS = 30000
+
+
+class SequenceCache:
+    """
+    SQLite cache of refget accessions and reference sequence tiles.
+
+    Args:
+        cache_file (str): SQLite database file (created if it does not exist).
+        tile_size (int, optional): tile size in bases; must match the size used to
+            create the cache file. Defaults to DEFAULT_TILE_SIZE.
+        max_size_mb (int, optional): approximate max size of the cached tiles (MB).
+            Defaults to DEFAULT_MAX_SIZE_MB.
+
+    Raises:
+        ValueError: if `tile_size` does not match the tile size of an existing cache file.
+    """
+
+    def __init__(
+        self,
+        cache_file: str,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        max_size_mb: int = DEFAULT_MAX_SIZE_MB,
+    ):
+        self.__tile_size = tile_size
+        self.__max_tiles = max(1, max_size_mb * 1024 * 1024 // tile_size)
+        self.__inserts = 0
+
+        directory = os.path.dirname(cache_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # autocommit; each statement is its own (short) transaction
+        self.__connection = sqlite3.connect(
+            cache_file,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                name TEXT PRIMARY KEY, value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS refget_accession (
+                identifier TEXT PRIMARY KEY, accession TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sequence_tile (
+                accession TEXT NOT NULL,
+                tile INTEGER NOT NULL,
+                sequence TEXT NOT NULL,
+                UNIQUE (accession, tile)
+            );
+            """
+        )
+        self.__connection.execute(
+            "INSERT OR IGNORE INTO settings VALUES ('tile_size', ?)", (tile_size,)
+        )
+        cached_tile_size = self.__connection.execute(
+            "SELECT value FROM settings WHERE name = 'tile_size'"
+        ).fetchone()[0]
+        if int(cached_tile_size) != tile_size:
+            raise ValueError(
+                f"Tile size {tile_size} does not match the tile size of "
+                f"the sequence cache {cache_file}: {cached_tile_size}"
+            )
+
+    @property
+    def tile_size(self) -> int:
+        return self.__tile_size
+
+    def close(self):
+        self.__connection.close()
+
+    def get_refget_accession(self, identifier: str) -> Optional[str]:
+        row = self.__connection.execute(
+            "SELECT accession FROM refget_accession WHERE identifier = ?",
+            (identifier,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_refget_accession(self, identifier: str, accession: str):
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO refget_accession VALUES (?, ?)",
+            (identifier, accession),
+        )
+
+    def get_tile(self, accession: str, tile: int) -> Optional[str]:
+        row = self.__connection.execute(
+            "SELECT sequence FROM sequence_tile WHERE accession = ? AND tile = ?",
+            (accession, tile),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_tile(self, accession: str, tile: int, sequence: str):
+        cursor = self.__connection.execute(
+            "INSERT OR IGNORE INTO sequence_tile VALUES (?, ?, ?)",
+            (accession, tile, sequence),
+        )
+        self.__inserts += 1
+        if self.__inserts % EVICTION_INTERVAL == 0 and cursor.lastrowid:
+            # rowids increase with each insert, so this evicts the oldest tiles
+            self.__connection.execute(
+                "DELETE FROM sequence_tile WHERE rowid <= ?",
+                (cursor.lastrowid - self.__max_tiles,),
+            )
+
+
+class CachedDataProxy(_DataProxy):
+    """
+    `ga4gh.vrs` data proxy that reads sequences through a `SequenceCache`.
+
+    Sequence reads are split into tiles; missing tiles are fetched from the
+    wrapped data proxy and cached.  Metadata is always read from the wrapped
+    data proxy.
+
+    Args:
+        data_proxy (_DataProxy): wrapped data proxy (e.g., seqrepo REST service).
+        cache (SequenceCache): sequence cache.
+    """
+
+    def __init__(self, data_proxy: _DataProxy, cache: SequenceCache):
+        super().__init__()
+        self.__data_proxy = data_proxy
+        self.__cache = cache
+
+    @property
+    def cache(self) -> SequenceCache:
+        return self.__cache
+
+    def warm(self, identifiers: List[str]):
+        """
+        Cache the refget accessions of the sequence identifiers
+        (e.g., the chromosomes of a genome build); unknown identifiers are skipped.
+        """
+        for identifier in identifiers:
+            try:
+                self.get_refget_accession(identifier)
+            except KeyError:
+                continue
+
+    def get_refget_accession(self, identifier: str) -> str:
+        """
+        Get the `ga4gh:SQ.*` refget accession for a sequence identifier.
+
+        Raises:
+            KeyError: if the identifier is unknown to the wrapped data proxy.
+        """
+        if identifier.startswith("ga4gh:"):
+            return identifier
+        if identifier.startswith("SQ."):
+            return f"ga4gh:{identifier}"
+
+        accession = self.__cache.get_refget_accession(identifier)
+        if accession is None:
+            accessions = self.__data_proxy.translate_sequence_identifier(
+                identifier, "ga4gh"
+            )
+            if not accessions:
+                raise KeyError(f"No refget accession for sequence: {identifier}")
+            accession = accessions[0]
+            self.__cache.set_refget_accession(identifier, accession)
+        return accession
+
+    def __get_tile(self, accession: str, tile: int) -> str:
+        sequence = self.__cache.get_tile(accession, tile)
+        if sequence is None:
+            tile_size = self.__cache.tile_size
+            sequence = self.__data_proxy.get_sequence(
+                accession, start=tile * tile_size, end=(tile + 1) * tile_size
+            )
+            self.__cache.set_tile(accession, tile, sequence)
+        return sequence
+
+    def _get_sequence(
+        self, identifier: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> str:
+        tile_size = self.__cache.tile_size
+        if (
+            start is None
+            or end is None
+            or (end - start) > MAX_CACHED_READ_TILES * tile_size
+        ):
+            return self.__data_proxy.get_sequence(identifier, start=start, end=end)
+
+        accession = self.get_refget_accession(identifier)
+        first_tile, last_tile = start // tile_size, (end - 1) // tile_size
+        sequence = "".join(
+            self.__get_tile(accession, tile)
+            for tile in range(first_tile, last_tile + 1)
+        )
+        offset = first_tile * tile_size
+        return sequence[start - offset : end - offset]
+
+    def _get_metadata(self, identifier: str) -> dict:
+        return self.__data_proxy.get_metadata(identifier)
+
+    def translate_sequence_identifier(
+        self, identifier: str, namespace: Optional[str] = None
+    ) -> List[str]:
+        if namespace == "ga4gh":
+            return [self.get_refget_accession(identifier)]
+        return self.__data_proxy.translate_sequence_identifier(identifier, namespace)
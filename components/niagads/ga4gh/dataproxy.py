@@ -0,0 +1,271 @@
+"""
+GA4GH VRS sequence data proxies.
+
+`get_dataproxy` resolves a sequence source to a `ga4gh.vrs` data proxy:
+- seqrepo REST service URL (e.g., `http://localhost:5000/seqrepo`)
+- local seqrepo directory (e.g., `/usr/local/share/seqrepo/2024-12-20`)
+- local faidx-indexed FASTA file, plain or bgzipped (e.g., `fasta+/data/GRCh38.fa.gz`);
+  served by `FastaDataProxy`, so VRS normalization runs offline
+
+Sequences from seqrepo can be cached on disk (see `niagads.ga4gh.cache`).
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from typing import Dict, List, Optional
+
+import pysam
+from ga4gh.core import sha512t24u
+from ga4gh.vrs.dataproxy import _DataProxy, create_dataproxy
+from niagads.ga4gh.cache import CachedDataProxy, SequenceCache
+from niagads.genome_reference.human import GenomeBuild, HumanGenome
+
+FASTA_URI_SCHEME = "fasta+"
+FASTA_FILE_EXTENSIONS = (".fa", ".fasta", ".fna", ".fa.gz", ".fasta.gz", ".fna.gz")
+BGZIP_FILE_EXTENSIONS = (".gz", ".bgz")
+
+# refget digests are computed from the full contig sequence (~1s per large
+# chromosome) so they are stored next to the FASTA, like the .fai index
+REFGET_DIGEST_FILE_SUFFIX = ".refget.json"
+
+
+class FastaDataProxy(_DataProxy):
+    """
+    `ga4gh.vrs` data proxy backed by a local faidx-indexed FASTA file.
+
+    Sequences are read by random access: plain FASTA files are memory-mapped
+    and sliced using the `.fai` offsets; bgzipped FASTA files are read
+    through htslib (`pysam.FastaFile`), which also creates missing `.fai` /
+    `.gzi` indexes.
+
+    Contigs are identified by their FASTA name and the aliases:
+    - `{genome_build}:{chromosome}` with and without the `chr` prefix (`M` and `MT` for mitochondria)
+    - `ga4gh:SQ.*` (refget accession) and `MD5:*` sequence digests
+    - any aliases (e.g., `refseq:NC_000001.11`) listed in the refget digest file
+
+    Refget digests are computed from the sequence on first use and saved to
+    the refget digest file (`{fasta_file}.refget.json`) so they are only
+    computed once per FASTA file.  Entries in the file have the form:
+    `{"1": {"ga4gh": "SQ....", "md5": "...", "aliases": ["refseq:NC_000001.11"]}}`.
+
+    Args:
+        fasta_file (str): path to the (optionally bgzipped) FASTA file.
+        genome_build (GenomeBuild): genome build (assembly) of the FASTA file.
+        refget_digest_file (str, optional): refget digest file.
+            Defaults to `{fasta_file}.refget.json`.
+    """
+
+    def __init__(
+        self,
+        fasta_file: str,
+        genome_build: GenomeBuild,
+        refget_digest_file: Optional[str] = None,
+    ):
+        super().__init__()
+        self.__assembly = str(GenomeBuild(genome_build))
+        self.__digest_file = (
+            refget_digest_file or f"{fasta_file}{REFGET_DIGEST_FILE_SUFFIX}"
+        )
+
+        # builds the .fai (and for bgzipped files, .gzi) index if missing
+        self.__fasta = pysam.FastaFile(fasta_file)
+        self.__lengths: Dict[str, int] = dict(
+            zip(self.__fasta.references, self.__fasta.lengths)
+        )
+
+        self.__mmap: Optional[mmap.mmap] = None
+        self.__fai: Dict[str, tuple] = {}
+        if not fasta_file.endswith(BGZIP_FILE_EXTENSIONS):
+            self.__fasta.close()
+            self.__fai = self.__read_fai(f"{fasta_file}.fai")
+            with open(fasta_file, "rb") as fh:
+                self.__mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__digests: Dict[str, dict] = self.__read_digest_file()
+        self.__aliases: Dict[str, str] = {}
+        for contig in self.__lengths:
+            self.__index_aliases(contig)
+
+    @staticmethod
+    def __read_fai(fai_file: str) -> Dict[str, tuple]:
+        """Read (offset, line bases, line width) for each contig from a `.fai` index."""
+        index = {}
+        with open(fai_file) as fh:
+            for line in fh:
+                name, _, offset, line_bases, line_width = line.split("\t")[:5]
+                index[name] = (int(offset), int(line_bases), int(line_width))
+        return index
+
+    def __read_digest_file(self) -> Dict[str, dict]:
+        if not os.path.exists(self.__digest_file):
+            return {}
+        with open(self.__digest_file) as fh:
+            return json.load(fh)
+
+    def __write_digest_file(self):
+        """Write the digest file atomically (transform workers may share it)."""
+        tmp_file = f"{self.__digest_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w") as fh:
+                json.dump(self.__digests, fh, indent=2)
+            os.replace(tmp_file, self.__digest_file)
+        except OSError:  # e.g., read-only reference directory; recompute next time
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def __assembly_aliases(self, contig: str) -> List[str]:
+        """`{assembly}:{chromosome}` aliases; w/out the `chr` prefix first."""
+        chromosome = contig[3:] if contig.lower().startswith("chr") else contig
+        names = ["M", "MT"] if chromosome.upper() in ("M", "MT") else [chromosome]
+        names += [f"chr{name}" for name in names]
+        return [f"{self.__assembly}:{name}" for name in names]
+
+    def __index_aliases(self, contig: str):
+        self.__aliases[contig] = contig
+        digests = self.__digests.get(contig, {})
+        aliases = self.__assembly_aliases(contig) + digests.get("aliases", [])
+        if "ga4gh" in digests:
+            aliases += [f"ga4gh:{digests['ga4gh']}", f"MD5:{digests['md5']}"]
+        for alias in aliases:
+            self.__aliases.setdefault(alias, contig)
+
+    def __compute_digests(self, contigs: List[str]):
+        """Compute (and save) missing refget digests for the contigs."""
+        missing = [c for c in contigs if "ga4gh" not in self.__digests.get(c, {})]
+        if not missing:
+            return
+        for contig in missing:
+            sequence = self.__fetch(contig, 0, self.__lengths[contig]).encode("ascii")
+            self.__digests.setdefault(contig, {}).update(
+                {
+                    "ga4gh": f"SQ.{sha512t24u(sequence)}",
+                    "md5": hashlib.md5(sequence).hexdigest(),
+                }
+            )
+            self.__index_aliases(contig)
+        self.__write_digest_file()
+
+    def __fetch(self, contig: str, start: int, end: int) -> str:
+        if self.__mmap is None:
+            return self.__fasta.fetch(contig, start, end).upper()
+
+        # byte offset of a position = contig offset + full lines + bases into the line
+        offset, line_bases, line_width = self.__fai[contig]
+        first = offset + (start // line_bases) * line_width + start % line_bases
+        last = offset + (end // line_bases) * line_width + end % line_bases
+        return self.__mmap[first:last].translate(None, b"\r\n").decode("ascii").upper()
+
+    def __resolve_contig(self, identifier: str) -> str:
+        """
+        Map a sequence identifier to a FASTA contig.
+
+        Raises:
+            KeyError: if the identifier does not match a contig.
+        """
+        if identifier.startswith("SQ."):
+            identifier = f"ga4gh:{identifier}"
+
+        contig = self.__aliases.get(identifier)
+        if contig is None and identifier.startswith(("ga4gh:", "MD5:")):
+            # reverse lookup requires the digests of all contigs
+            self.__compute_digests(list(self.__lengths))
+            contig = self.__aliases.get(identifier)
+        if contig is None and ":" not in identifier:
+            # unqualified accession (e.g., NC_000001.11 from HGVS)
+            contig = self.__aliases.get(f"refseq:{identifier}")
+        if contig is None:
+            raise KeyError(f"Sequence identifier not found: {identifier}")
+        return contig
+
+    def _get_sequence(
+        self, identifier: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> str:
+        contig = self.__resolve_contig(identifier)
+        length = self.__lengths[contig]
+        start = 0 if start is None else max(0, start)
+        end = length if end is None else min(end, length)
+        return self.__fetch(contig, start, end) if start < end else ""
+
+    def _get_metadata(self, identifier: str) -> dict:
+        contig = self.__resolve_contig(identifier)
+        self.__compute_digests([contig])
+        return {
+            "added": None,
+            "aliases": [
+                alias
+                for alias, alias_contig in self.__aliases.items()
+                if alias_contig == contig and alias != contig
+            ],
+            "length": self.__lengths[contig],
+        }
+
+    def translate_sequence_identifier(
+        self, identifier: str, namespace: Optional[str] = None
+    ) -> List[str]:
+        """
+        Translate a sequence identifier to its aliases (in the namespace if given).
+
+        Overrides `_DataProxy` to keep alias order, so that
+        `{assembly}:{chromosome}` w/out the `chr` prefix is always returned first.
+
+        Raises:
+            KeyError: if the identifier does not match a contig.
+        """
+        aliases = self.get_metadata(identifier)["aliases"]
+        if namespace is not None:
+            aliases = [alias for alias in aliases if alias.startswith(f"{namespace}:")]
+        return aliases
+
+
+def get_dataproxy(
+    sequence_source: str,
+    genome_build: GenomeBuild,
+    sequence_cache_dir: Optional[str] = None,
+) -> _DataProxy:
+    """
+    Create a `ga4gh.vrs` data proxy for a sequence source.
+
+    Args:
+        sequence_source (str): one of
+            - seqrepo REST service URL (`http(s)://...`)
+            - local seqrepo directory (or `file://` URI)
+            - FASTA file path (or `fasta+` URI), faidx-indexed, optionally bgzipped
+            - `seqrepo+` URI, passed to `ga4gh.vrs.dataproxy.create_dataproxy` as is
+        genome_build (GenomeBuild): genome build of the sequences
+            (used to alias FASTA contigs).
+        sequence_cache_dir (str, optional): directory for the persistent sequence cache
+            (`{genome_build}.sqlite`); seqrepo sequences are read through the cache and
+            the refget accessions of the genome build's chromosomes are cached on first use.
+            Not used for FASTA files, which are already read locally. Defaults to None.
+
+    Returns:
+        _DataProxy: the data proxy.
+    """
+    if sequence_source.startswith(FASTA_URI_SCHEME) or sequence_source.endswith(
+        FASTA_FILE_EXTENSIONS
+    ):
+        fasta_file = sequence_source.removeprefix(FASTA_URI_SCHEME)
+        return FastaDataProxy(fasta_file.removeprefix("file://"), genome_build)
+
+    if sequence_source.startswith("seqrepo+"):
+        data_proxy = create_dataproxy(sequence_source)
+    elif sequence_source.startswith("file://"):
+        data_proxy = create_dataproxy(f"seqrepo+{sequence_source}")
+    elif os.path.isdir(sequence_source):
+        data_proxy = create_dataproxy(
+            f"seqrepo+file://{os.path.abspath(sequence_source)}"
+        )
+    else:
+        data_proxy = create_dataproxy(f"seqrepo+{sequence_source}")
+
+    if sequence_cache_dir is None:
+        return data_proxy
+
+    assembly = str(GenomeBuild(genome_build))
+    data_proxy = CachedDataProxy(
+        data_proxy, SequenceCache(os.path.join(sequence_cache_dir, f"{assembly}.sqlite"))
+    )
+    data_proxy.warm([f"{assembly}:{chromosome.value}" for chromosome in HumanGenome])
+    return data_proxy
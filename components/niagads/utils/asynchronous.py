@@ -1,6 +1,20 @@
 """library of helpers supporting async"""
 
+import asyncio
 import contextlib
+import threading
+from typing import Any, AsyncIterator, Iterable, Optional
+
+
+class _EndOfStream:
+    """marks the end of a queued stream"""
+
+
+class _StreamError:
+    """wraps an exception raised by a queued stream's producer"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
 
 
 @contextlib.asynccontextmanager
@@ -14,3 +28,156 @@ async def null_async_context():
     Usage: see components.niagads.etl.plugins.base.py
     """
     yield None
+
+
+async def as_async_iterator(iterable: Iterable) -> AsyncIterator[Any]:
+    """
+    Wrap a sync iterable as an async iterator (items are produced in the
+    event loop thread).
+
+    The iterable is closed (if it is a generator) when iteration ends or
+    the consumer stops early.
+
+    Args:
+        iterable (Iterable): the sync iterable.
+
+    Yields:
+        Any: items from the iterable, in order.
+    """
+    try:
+        for item in iterable:
+            yield item
+    finally:
+        if hasattr(iterable, "close"):
+            iterable.close()
+
+
+async def threaded_iterator(
+    iterable: Iterable,
+    max_queue_size: int = 1,
+    queue: Optional[asyncio.Queue] = None,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over a blocking (sync) iterable in a producer thread and yield
+    its items asynchronously.
+
+    Items are passed through a bounded queue, so the producer blocks
+    (backpressure) once `max_queue_size` items are waiting to be consumed.
+    Exceptions raised by the iterable are re-raised in the consumer in order,
+    i.e., after all items produced before the error are consumed.
+
+    If the consumer stops early, the producer is signaled to stop and the
+    iterable is closed (if it is a generator) after its current item.
+
+    Args:
+        iterable (Iterable): the blocking iterable (e.g., a file parsing generator).
+        max_queue_size (int, optional): max number of produced items waiting
+            to be consumed. Defaults to 1.
+        queue (Optional[asyncio.Queue], optional): bounded queue to use instead
+            of creating one of `max_queue_size` (e.g., to monitor its depth).
+            Defaults to None.
+
+    Yields:
+        Any: items from the iterable, in order.
+
+    Usage: see components.niagads.etl.plugins.base.py
+    """
+    loop = asyncio.get_running_loop()
+    if queue is None:
+        queue = asyncio.Queue(maxsize=max_queue_size)
+    stop = threading.Event()
+
+    def put(item):
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def produce():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    break
+                put(item)
+            else:
+                put(_EndOfStream())
+        except BaseException as err:  # SystemExit raised by logger handlers
+            if not stop.is_set():
+                put(_StreamError(err))
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _EndOfStream):
+                break
+            if isinstance(item, _StreamError):
+                raise item.error
+            yield item
+
+    finally:
+        stop.set()
+        # drain so a producer blocked on a full queue can see the stop signal
+        while not producer.done():
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.sleep(0.01)
+
+
+async def prefetch(
+    aiterable: AsyncIterator,
+    max_queue_size: int = 1,
+    queue: Optional[asyncio.Queue] = None,
+) -> AsyncIterator[Any]:
+    """
+    Consume an async iterable in a background task, buffering up to
+    `max_queue_size` items ahead of the consumer.
+
+    Allows the work done to produce the next item (e.g., a transform) to
+    overlap with awaited work done by the consumer on the current item
+    (e.g., a database flush).  Order is preserved and producer exceptions
+    are re-raised in the consumer after all previously produced items.
+
+    Args:
+        aiterable (AsyncIterator): the async iterable to consume.
+        max_queue_size (int, optional): max number of produced items waiting
+            to be consumed. Defaults to 1.
+        queue (Optional[asyncio.Queue], optional): bounded queue to use instead
+            of creating one of `max_queue_size` (e.g., to monitor its depth).
+            Defaults to None.
+
+    Yields:
+        Any: items from the async iterable, in order.
+
+    Usage: see components.niagads.etl.plugins.base.py
+    """
+    if queue is None:
+        queue = asyncio.Queue(maxsize=max_queue_size)
+
+    async def produce():
+        try:
+            async for item in aiterable:
+                await queue.put(item)
+            await queue.put(_EndOfStream())
+        except asyncio.CancelledError:
+            raise
+        except BaseException as err:
+            await queue.put(_StreamError(err))
+        finally:
+            if hasattr(aiterable, "aclose"):
+                await aiterable.aclose()
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _EndOfStream):
+                break
+            if isinstance(item, _StreamError):
+                raise item.error
+            yield item
+
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
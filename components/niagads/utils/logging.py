@@ -1,7 +1,9 @@
 import asyncio
 import inspect
 import logging
+import queue
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from time import perf_counter
 from typing import Any
 
@@ -220,6 +222,62 @@ class ExitOnCriticalExceptionHandler(logging.Handler):
             raise SystemExit(-1)
 
 
+class ExitOnExceptionQueueHandler(QueueHandler):
+    """Non-blocking counterpart of ExitOnExceptionHandler.
+
+    Records are put on a bounded queue and written by a `QueueListener`
+    thread, so callers (e.g., the event loop) do not block on disk I/O.
+    On ERROR and CRITICAL records, waits until the queue is written out and
+    exits, as ExitOnExceptionHandler does.  When the queue is full, callers
+    block until the listener catches up (records are never dropped).
+
+    The queue must be a `queue.Queue` (for `join`) consumed by the running
+    `listener`.  Closing the handler writes out the queue and stops (and
+    closes the handlers of) the listener; records emitted after that are
+    handled synchronously by the listener's handlers.
+    """
+
+    def __init__(self, log_queue: queue.Queue, listener: QueueListener):
+        super().__init__(log_queue)
+        self.listener = listener
+        self.__closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def enqueue(self, record):
+        self.queue.put(record)  # block (bounded memory) instead of dropping
+
+    def drain(self):
+        """Wait until all queued records are handled by the listener."""
+        if not self.__closed:
+            self.queue.join()
+
+    def close(self):
+        """Write out queued records and stop the listener; idempotent."""
+        self.acquire()
+        try:
+            if not self.__closed:
+                self.drain()
+                self.__closed = True
+                self.listener.stop()
+                for handler in self.listener.handlers:
+                    handler.close()
+        finally:
+            self.release()
+        super().close()
+
+    def emit(self, record):
+        if self.__closed:  # no listener thread; write synchronously
+            self.listener.handle(self.prepare(record))
+        else:
+            super().emit(record)
+        if record.levelno in (logging.ERROR, logging.CRITICAL):
+            self.drain()
+            raise SystemExit(-1)
+
+
 def _timed(fn):
     """Universal timing decorator for sync and async functions, for debugging only"""
 
@@ -98,3 +98,193 @@ class VCFEntry(BaseModel):
             ),
             format=".",  # FIXME: appears sometimes empty list, sometimes bool when not present at all
         )
+
+
+class VCFRecord:
+    """
+    Lightweight (`__slots__`) VCF record for high-throughput parsing (e.g., ETL loaders).
+
+    Fields are not validated.  Records parsed from a VCF line (`from_line`)
+    keep INFO as the raw INFO string; a key is parsed only when it is accessed
+    (`get_info`).  Records created from cyvcf2 Variants hold the INFO values
+    read by cyvcf2 (typed from the VCF header).  Convert to a `VCFEntry`
+    (`to_vcf_entry`) at API boundaries.
+
+    INFO values are converted like `VCFEntry.from_line`: JSON-parseable
+    values (e.g., numbers) are converted, flags are True, and everything else
+    is returned as a string.
+    """
+
+    __slots__ = (
+        "chrom",
+        "pos",
+        "id",
+        "ref",
+        "alt",
+        "qual",
+        "filter",
+        "_info_string",
+        "_info",
+    )
+
+    def __init__(
+        self,
+        chrom: str,
+        pos: int,
+        id: str,
+        ref: str,
+        alt: Union[list, str] = ".",
+        qual: str = ".",
+        filter: str = ".",
+        info: Union[dict, str] = ".",
+    ):
+        self.chrom = chrom
+        self.pos = pos
+        self.id = id
+        self.ref = ref
+        self.alt = alt
+        self.qual = qual
+        self.filter = filter
+        # parsed (or set) INFO values; the raw string is dropped once fully parsed
+        if isinstance(info, dict):
+            self._info_string = None
+            self._info = dict(info)
+        else:
+            self._info_string = None if info == "." else info
+            self._info = {}
+
+    def __repr__(self):
+        return f"VCFRecord({self.chrom}:{self.pos}:{self.ref}:{self.alt}; {self.id})"
+
+    @classmethod
+    def from_line(cls, entry: str, alt_allele: str = None) -> Self:
+        """Create a VCFRecord from a VCF line; with a single ALT allele if `alt_allele` is specified."""
+        fields = entry.rstrip("\n").split("\t", 8)
+        chrom, pos, id, ref, alt, qual, filter, info = fields[:8]
+        return cls(
+            chrom=chrom,
+            pos=int(pos),
+            id=id,
+            ref=ref,
+            alt=alt_allele or alt.split(","),
+            qual=qual,
+            filter=filter,
+            info=info,
+        )
+
+    @staticmethod
+    def cyvcf2_info(variant: cyvcf.Variant, info_keys: List[str] = None) -> dict:
+        """INFO values of a cyvcf2 Variant (typed by cyvcf2 from the VCF header); only `info_keys` if provided."""
+        if info_keys is None:
+            return dict(variant.INFO)
+        info = {}
+        for key in info_keys:
+            value = variant.INFO.get(key)
+            if value is not None:
+                info[key] = value
+        return info
+
+    @classmethod
+    def from_cyvcf2_variant(
+        cls,
+        variant: cyvcf.Variant,
+        alt_allele: str = None,
+        info_keys: List[str] = None,
+    ) -> Self:
+        """Create VCFRecord from a cyvcf2 Variant object.
+
+        Args:
+            variant: cyvcf2 Variant object to parse.
+            alt_allele: Optional specific ALT allele to extract (not validated
+                against the variant's ALT alleles).
+            info_keys: Optional INFO keys to extract.  If provided, only these
+                keys are read; otherwise all INFO values are read.
+
+        Returns:
+            VCFRecord with single ALT allele (if alt_allele specified) or
+            the full ALT list from the variant.
+        """
+        return cls(
+            chrom=variant.CHROM,
+            pos=variant.POS,
+            id=variant.ID or ".",
+            ref=variant.REF,
+            alt=alt_allele or variant.ALT or ".",
+            qual=str(variant.QUAL) if variant.QUAL is not None else ".",
+            filter=variant.FILTER or ".",
+            info=cls.cyvcf2_info(variant, info_keys),
+        )
+
+    @classmethod
+    def from_cyvcf2_site(
+        cls, variant: cyvcf.Variant, info_keys: List[str] = None
+    ) -> List[Self]:
+        """Create one VCFRecord per ALT allele of a cyvcf2 Variant object.
+
+        The site fields and INFO values are read once and shared by the records
+        (each record gets its own copy of the INFO values).
+
+        Args:
+            variant: cyvcf2 Variant object to parse.
+            info_keys: Optional INFO keys to extract.  If provided, only these
+                keys are read; otherwise all INFO values are read.
+
+        Returns:
+            List of VCFRecords, in ALT allele order.
+        """
+        chrom, pos, id, ref = variant.CHROM, variant.POS, variant.ID or ".", variant.REF
+        qual = str(variant.QUAL) if variant.QUAL is not None else "."
+        filter = variant.FILTER or "."
+        info = cls.cyvcf2_info(variant, info_keys)
+        return [
+            cls(
+                chrom=chrom,
+                pos=pos,
+                id=id,
+                ref=ref,
+                alt=alt,
+                qual=qual,
+                filter=filter,
+                info=info,
+            )
+            for alt in variant.ALT
+        ]
+
+    def get_info(self, key: str, default: Any = None) -> Any:
+        """Get the value of an INFO key (parsed on first access) or `default` if not present."""
+        if key in self._info:
+            return self._info[key]
+        if self._info_string is None:
+            return default
+
+        for item in self._info_string.split(";"):
+            name, has_value, value = item.partition("=")
+            if name == key:
+                self._info[key] = to_json(value) if has_value else True  # flag
+                return self._info[key]
+        return default
+
+    def set_info(self, key: str, value: Any):
+        self._info[key] = value
+
+    @property
+    def info(self) -> dict:
+        """All INFO values (parses the full INFO string)."""
+        if self._info_string is not None:
+            parsed = info_string_to_dict(self._info_string)
+            parsed.update(self._info)
+            self._info = parsed
+            self._info_string = None
+        return self._info
+
+    def to_vcf_entry(self) -> VCFEntry:
+        return VCFEntry(
+            chrom=self.chrom,
+            pos=self.pos,
+            id=self.id,
+            ref=self.ref,
+            alt=self.alt,
+            qual=self.qual,
+            filter=self.filter,
+            info=self.info or ".",
+        )
@@ -0,0 +1,118 @@
+"""
+Compare the TransactionTableMixin insert paths (ORM `submit_many`, Core
+`insert_many_core`, and COPY `copy_many`) across batch sizes.
+
+Creates a scratch table (public.etl_insert_benchmark) that mimics the column
+types of the variant table (INT4RANGE, JSONB, ltree), loads the same synthetic
+rows with each path, and reports rows / second.  The table is dropped at the end.
+
+usage:
+    DATABASE_URI=postgresql://... python benchmark_insert_methods.py --rows 100000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from niagads.common.models.types import Range
+from niagads.database import RangeType
+from niagads.database.mixins.transactions import TransactionTableMixin
+from niagads.database.session import DatabaseSessionManager
+from niagads.settings.core import CustomSettings
+from niagads.utils.list import chunker
+from sqlalchemy import Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy_utils import LtreeType
+
+
+class Settings(CustomSettings):
+    DATABASE_URI: str
+
+
+class InsertBenchmark(TransactionTableMixin):
+    _schema = "public"
+    __tablename__ = "etl_insert_benchmark"
+    __table_args__ = {"schema": "public"}
+
+    benchmark_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    label: Mapped[str] = mapped_column(String(150), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    span: Mapped[Range] = mapped_column(RangeType, nullable=False)
+    bin_index: Mapped[str] = mapped_column(LtreeType)
+    payload: Mapped[Optional[dict]] = mapped_column(JSONB(none_as_null=True))
+
+
+def generate_records(num_rows: int):
+    return [
+        InsertBenchmark(
+            label=f"1:{i}:A:G",
+            position=i,
+            span=Range(start=i, end=i + 1),
+            bin_index=f"chr1.L1.B{i % 64}",
+            payload={"freq": {"gnomAD": 0.01, "ALFA": None}, "rank": i},
+        )
+        for i in range(num_rows)
+    ]
+
+
+async def time_insert(
+    session_manager: DatabaseSessionManager, method: str, num_rows: int, batch_size
+):
+    records = generate_records(num_rows)
+    start = time.perf_counter()
+    async with session_manager.session_ctx() as session:
+        for batch in chunker(records, batch_size):
+            if method == "orm":
+                await InsertBenchmark.submit_many(session, batch)
+                session.expunge_all()
+            elif method == "core":
+                await InsertBenchmark.insert_many_core(session, batch)
+            elif method == "core+returning":
+                await InsertBenchmark.insert_many_core(
+                    session, batch, return_primary_keys=True
+                )
+            else:
+                await InsertBenchmark.copy_many(session, batch)
+            await session.commit()
+    elapsed = time.perf_counter() - start
+
+    async with session_manager.session_ctx() as session:
+        await session.execute(text(f"TRUNCATE {InsertBenchmark.table_name()}"))
+        await session.commit()
+
+    return elapsed
+
+
+async def main(num_rows: int, batch_sizes: list[int]):
+    session_manager = DatabaseSessionManager(Settings.from_env().DATABASE_URI)
+    try:
+        async with session_manager.engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS ltree"))
+            await conn.run_sync(InsertBenchmark.__table__.create, checkfirst=True)
+
+        print(f"{'method':<16}{'batch size':>12}{'seconds':>12}{'rows/sec':>14}")
+        for batch_size in batch_sizes:
+            for method in ["orm", "core", "core+returning", "copy"]:
+                elapsed = await time_insert(
+                    session_manager, method, num_rows, batch_size
+                )
+                print(
+                    f"{method:<16}{batch_size:>12}{elapsed:>12.2f}{num_rows / elapsed:>14.0f}"
+                )
+
+    finally:
+        async with session_manager.engine.begin() as conn:
+            await conn.run_sync(InsertBenchmark.__table__.drop, checkfirst=True)
+        await session_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1000, 5000, 10000, 50000]
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch_sizes))
@@ -0,0 +1,333 @@
+"""
+Synthetic inputs for the ETL throughput benchmarks.
+
+Each generator writes a file in the format parsed by the corresponding plugin
+and returns the number of input records (variants, genes, annotations, terms,
+or merge records).  Output is deterministic for a given record count and seed.
+
+usage:
+    python synthetic_inputs.py --format vcf --records 100000 --output dbsnp.vcf.gz
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from xml.sax.saxutils import escape
+
+import pysam
+
+CHROMOSOMES = [str(c) for c in range(1, 23)] + ["X", "Y"]
+BASES = "ACGT"
+FREQUENCY_SOURCES = ["1000Genomes", "ALFA", "GnomAD", "TOPMED"]
+EVIDENCE_CODES = ["IBA", "IDA", "IEA", "IMP", "IPI", "ISS", "TAS"]
+BIOTYPES = ["protein_coding", "lncRNA", "processed_pseudogene", "miRNA"]
+
+
+def _chromosome_counts(num_records: int):
+    """Split records over the chromosomes (in VCF / GFF3 sort order)."""
+    per_chromosome, residual = divmod(num_records, len(CHROMOSOMES))
+    return [
+        (chromosome, per_chromosome + (1 if index < residual else 0))
+        for index, chromosome in enumerate(CHROMOSOMES)
+    ]
+
+
+def _random_sequence(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(BASES) for _ in range(length))
+
+
+def write_vcf(path: str, num_records: int, seed: int = 42) -> int:
+    """
+    dbSNP-style VCF (bgzipped and tabix indexed): SNVs, ~10% short indels,
+    ~5% multi-allelic sites, and ALFA-style `FREQ` INFO annotations.
+
+    Returns:
+        int: number of (site, alt allele) records.
+    """
+    rng = random.Random(seed)
+    plain_path = path[: -len(".gz")] if path.endswith(".gz") else path
+    alleles = 0
+    with open(plain_path, "w") as fh:
+        fh.write("##fileformat=VCFv4.2\n")
+        fh.write("##source=niagads-etl-benchmark\n")
+        for chromosome in CHROMOSOMES:
+            fh.write(f"##contig=<ID={chromosome}>\n")
+        fh.write('##INFO=<ID=RS,Number=1,Type=Integer,Description="dbSNP ID">\n')
+        fh.write('##INFO=<ID=VC,Number=1,Type=String,Description="Variation class">\n')
+        fh.write(
+            '##INFO=<ID=FREQ,Number=.,Type=String,Description="Allele frequencies by source">\n'
+        )
+        fh.write("#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n")
+
+        rsid = 1000
+        for chromosome, count in _chromosome_counts(num_records):
+            position = 10000
+            for _ in range(count):
+                position += rng.randint(1, 200)
+                rsid += rng.randint(1, 5)
+                ref = rng.choice(BASES)
+                kind = rng.random()
+                if kind < 0.05:  # deletion
+                    ref = _random_sequence(rng, rng.randint(2, 8))
+                    alts = [ref[0]]
+                    variant_class = "DEL"
+                elif kind < 0.10:  # insertion
+                    alts = [ref + _random_sequence(rng, rng.randint(1, 8))]
+                    variant_class = "INS"
+                else:
+                    alts = [base for base in BASES if base != ref]
+                    alts = rng.sample(alts, 2 if rng.random() < 0.05 else 1)
+                    variant_class = "SNV"
+                alleles += len(alts)
+
+                frequencies = []
+                for source in rng.sample(FREQUENCY_SOURCES, rng.randint(1, 3)):
+                    alt_frequencies = [round(rng.random() / 10, 5) for _ in alts]
+                    ref_frequency = round(max(0.0, 1 - sum(alt_frequencies)), 5)
+                    values = [ref_frequency] + alt_frequencies
+                    if rng.random() < 0.1:
+                        values[-1] = "."
+                    frequencies.append(f"{source}:{','.join(map(str, values))}")
+
+                info = f"RS={rsid};VC={variant_class};FREQ={'|'.join(frequencies)}"
+                fh.write(
+                    f"{chromosome}\t{position}\trs{rsid}\t{ref}\t{','.join(alts)}\t.\t.\t{info}\n"
+                )
+                position += len(ref)
+
+    if path.endswith(".gz"):
+        pysam.tabix_compress(plain_path, path, force=True)
+        pysam.tabix_index(path, preset="vcf", force=True)
+        os.remove(plain_path)
+    return alleles
+
+
+def write_gff3(path: str, num_genes: int, seed: int = 42) -> int:
+    """
+    Ensembl-style GFF3 gene models: 1-4 transcripts per gene, 2-10 exons
+    per transcript, and CDS (protein) features for protein coding transcripts.
+
+    Returns:
+        int: number of genes.
+    """
+    rng = random.Random(seed)
+    gene_number = transcript_number = exon_number = protein_number = 0
+    with open(path, "w") as fh:
+        fh.write("##gff-version 3\n")
+        for chromosome, count in _chromosome_counts(num_genes):
+            position = 10000
+            for _ in range(count):
+                gene_number += 1
+                gene_id = f"ENSG{gene_number:011d}"
+                strand = rng.choice("+-")
+                biotype = rng.choice(BIOTYPES)
+                gene_start = position + rng.randint(1000, 50000)
+                gene_end = gene_start + rng.randint(2000, 100000)
+                position = gene_end
+                fh.write(
+                    f"{chromosome}\tensembl_havana\tgene\t{gene_start}\t{gene_end}\t.\t{strand}\t.\t"
+                    f"ID=gene:{gene_id};Name=GENE{gene_number};biotype={biotype};"
+                    f"description=synthetic gene {gene_number} [Source:HGNC Symbol%3BAcc:HGNC:{gene_number}];"
+                    f"gene_id={gene_id};version=1\n"
+                )
+
+                for transcript_index in range(rng.randint(1, 4)):
+                    transcript_number += 1
+                    transcript_id = f"ENST{transcript_number:011d}"
+                    tag = "basic,Ensembl_canonical" if transcript_index == 0 else "basic"
+                    fh.write(
+                        f"{chromosome}\thavana\tmRNA\t{gene_start}\t{gene_end}\t.\t{strand}\t.\t"
+                        f"ID=transcript:{transcript_id};Parent=gene:{gene_id};"
+                        f"Name=GENE{gene_number}-{201 + transcript_index};biotype={biotype};"
+                        f"tag={tag};transcript_id={transcript_id};version=1\n"
+                    )
+
+                    num_exons = rng.randint(2, 10)
+                    exon_length = max(1, (gene_end - gene_start) // (2 * num_exons))
+                    for rank in range(1, num_exons + 1):
+                        exon_number += 1
+                        exon_id = f"ENSE{exon_number:011d}"
+                        exon_start = gene_start + (rank - 1) * 2 * exon_length
+                        exon_end = exon_start + exon_length - 1
+                        fh.write(
+                            f"{chromosome}\thavana\texon\t{exon_start}\t{exon_end}\t.\t{strand}\t.\t"
+                            f"Parent=transcript:{transcript_id};Name={exon_id};constitutive=0;"
+                            f"exon_id={exon_id};rank={rank};version=1\n"
+                        )
+
+                    if biotype == "protein_coding":
+                        protein_number += 1
+                        protein_id = f"ENSP{protein_number:011d}"
+                        fh.write(
+                            f"{chromosome}\thavana\tCDS\t{gene_start}\t{gene_start + exon_length - 1}\t.\t{strand}\t0\t"
+                            f"ID=CDS:{protein_id};Parent=transcript:{transcript_id};protein_id={protein_id}\n"
+                        )
+                fh.write("###\n")
+    return num_genes
+
+
+def write_gaf(path: str, num_annotations: int, seed: int = 42) -> int:
+    """
+    GAF 2.2 GO annotations, unsorted, with ~20% repeated UniProt / GO term
+    associations (merged by the loader) and multi-valued `with/from` columns.
+
+    Returns:
+        int: number of annotation lines.
+    """
+    rng = random.Random(seed)
+    num_proteins = max(1, num_annotations // 8)
+    associations = []
+    with open(path, "w") as fh:
+        fh.write("!gaf-version: 2.2\n")
+        fh.write("!generated-by: niagads-etl-benchmark\n")
+        for _ in range(num_annotations):
+            if associations and rng.random() < 0.2:
+                protein, go_id = rng.choice(associations)
+            else:
+                protein = f"P{rng.randint(0, num_proteins):05d}"
+                go_id = f"GO:{rng.randint(1, 99999):07d}"
+                associations.append((protein, go_id))
+            with_or_from = "|".join(
+                f"UniProtKB:Q{rng.randint(0, 99999):05d}"
+                for _ in range(rng.randint(0, 3))
+            )
+            fields = [
+                "UniProtKB",
+                protein,
+                f"SYM{protein}",
+                rng.choice(["enables", "involved_in", "located_in", "part_of"]),
+                go_id,
+                f"GO_REF:{rng.randint(1, 120):07d}|PMID:{rng.randint(1, 40000000)}",
+                rng.choice(EVIDENCE_CODES),
+                with_or_from,
+                rng.choice("FCP"),
+                f"synthetic protein {protein}",
+                "",
+                "protein",
+                "taxon:9606",
+                f"2024{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+                "UniProt",
+                "",
+                "",
+            ]
+            fh.write("\t".join(fields) + "\n")
+    return num_annotations
+
+
+def write_owl(path: str, num_terms: int, seed: int = 42) -> int:
+    """
+    OWL (RDF/XML) ontology with labelled, defined classes, synonyms,
+    namespaces, and ~2% deprecated terms.
+
+    Returns:
+        int: number of classes.
+    """
+    rng = random.Random(seed)
+    with open(path, "w") as fh:
+        fh.write(
+            '<?xml version="1.0"?>\n'
+            '<rdf:RDF xmlns="http://purl.obolibrary.org/obo/bench.owl#"\n'
+            '     xml:base="http://purl.obolibrary.org/obo/bench.owl"\n'
+            '     xmlns:obo="http://purl.obolibrary.org/obo/"\n'
+            '     xmlns:owl="http://www.w3.org/2002/07/owl#"\n'
+            '     xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"\n'
+            '     xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"\n'
+            '     xmlns:oboInOwl="http://www.geneontology.org/formats/oboInOwl#">\n'
+            '    <owl:Ontology rdf:about="http://purl.obolibrary.org/obo/bench.owl"/>\n'
+        )
+        for number in range(1, num_terms + 1):
+            curie = f"BENCH:{number:07d}"
+            iri = f"http://purl.obolibrary.org/obo/BENCH_{number:07d}"
+            words = " ".join(
+                rng.choice(["binding", "cell", "process", "kinase", "membrane", "transport"])
+                for _ in range(rng.randint(1, 4))
+            )
+            fh.write(f'    <owl:Class rdf:about="{iri}">\n')
+            if number > 1:
+                parent = f"http://purl.obolibrary.org/obo/BENCH_{rng.randint(1, number - 1):07d}"
+                fh.write(f'        <rdfs:subClassOf rdf:resource="{parent}"/>\n')
+            fh.write(f"        <oboInOwl:id>{curie}</oboInOwl:id>\n")
+            fh.write(f"        <rdfs:label>{escape(words)} {number}</rdfs:label>\n")
+            fh.write(
+                f"        <obo:IAO_0000115>Synthetic definition of {escape(words)} term {number}.</obo:IAO_0000115>\n"
+            )
+            for index in range(rng.randint(0, 3)):
+                fh.write(
+                    f"        <oboInOwl:hasExactSynonym>{escape(words)} synonym {number}.{index}</oboInOwl:hasExactSynonym>\n"
+                )
+            fh.write(
+                "        <oboInOwl:hasOBONamespace>benchmark</oboInOwl:hasOBONamespace>\n"
+            )
+            if rng.random() < 0.02:
+                fh.write(
+                    '        <owl:deprecated rdf:datatype="http://www.w3.org/2001/XMLSchema#boolean">true</owl:deprecated>\n'
+                )
+            fh.write("    </owl:Class>\n")
+        fh.write("</rdf:RDF>\n")
+    return num_terms
+
+
+def write_merge_history(path: str, num_records: int, seed: int = 42) -> int:
+    """
+    dbSNP RefSNP merge history JSON lines (`refsnp-merged.json`), with ~30% of
+    records carrying dbSNP 1.x merge histories and ~5% without a merge target
+    (skipped by the loader).
+
+    Returns:
+        int: number of records w/a merge target (loaded records).
+    """
+    rng = random.Random(seed)
+    epoch = datetime(2005, 1, 1, tzinfo=timezone.utc)
+    loaded = 0
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt") as fh:
+        for number in range(num_records):
+            refsnp_id = str(1000 + number)
+            has_target = rng.random() >= 0.05
+            loaded += has_target
+            timestamp = epoch + timedelta(days=rng.randint(0, 7000))
+            entry = {
+                "refsnp_id": refsnp_id,
+                "merged_snapshot_data": {
+                    "proxy_time": timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "proxy_build_id": str(rng.randint(100, 157)),
+                    "merged_into": (
+                        [str(rng.randint(1, 999))] if has_target else []
+                    ),
+                },
+                "dbsnp1_merges": [
+                    {
+                        "merged_rsid": str(rng.randint(1, 10**8)),
+                        "revision": str(rng.randint(80, 130)),
+                        "merge_date": (
+                            timestamp - timedelta(days=rng.randint(1, 900))
+                        ).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    }
+                    for _ in range(rng.randint(1, 3) if rng.random() < 0.3 else 0)
+                ],
+            }
+            fh.write(json.dumps(entry) + "\n")
+    return loaded
+
+
+GENERATORS = {
+    "vcf": write_vcf,
+    "gff3": write_gff3,
+    "gaf": write_gaf,
+    "owl": write_owl,
+    "merge_history": write_merge_history,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--format", choices=list(GENERATORS), required=True)
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+    count = GENERATORS[args.format](args.output, args.records, seed=args.seed)
+    print(f"Wrote {count} records to {args.output}")
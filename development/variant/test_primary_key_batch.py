@@ -0,0 +1,144 @@
+"""
+Golden output check for `PrimaryKeyGenerator.primary_keys` (batch API).
+
+Compares the batch primary keys against the keys assigned by the VCF loaders
+(`BaseVCFLoader._build_variant_identifier_record`) for synthetic variants of
+every class (SNVs, MNVs, short and long indels, structural variants) and,
+optionally, for the variants in a VCF file.  Exits with status 1 if any key
+differs.
+
+usage:
+    python test_primary_key_batch.py --seqrepo-service-url fasta+/data/GRCh38.fa.gz
+    python test_primary_key_batch.py --seqrepo-service-url /usr/local/share/seqrepo/2024-12-20 \
+        --vcf dbsnp.vcf.gz --skip-normalization
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import cyvcf2
+from niagads.ga4gh.annotators import PrimaryKeyGenerator
+from niagads.genome_reference.human import GenomeBuild
+from niagads.genomicsdb_etl.plugins.variant.vcf_loaders.base import BaseVCFLoader
+from niagads.vcf.types import VCFRecord
+
+BASES = "ACGT"
+
+
+def synthetic_variants(num_variants: int, seed: int = 42):
+    """(chromosome, position, ref, alt) tuples; allele lengths chosen to hit each key path."""
+    rng = random.Random(seed)
+    allele_lengths = [
+        (1, 1),  # SNV
+        (2, 2),  # MNV
+        (12, 12),  # MNV (combined length > 20)
+        (1, 5),  # short insertion
+        (5, 1),  # short deletion
+        (3, 4),  # short indel
+        (1, 20),  # short insertion (combined length > 20)
+        (15, 8),  # short indel (combined length > 20)
+        (1, 60),  # structural insertion
+        (60, 1),  # structural deletion
+    ]
+    variants = []
+    for _ in range(num_variants):
+        len_ref, len_alt = rng.choice(allele_lengths)
+        ref = "".join(rng.choice(BASES) for _ in range(len_ref))
+        alt = "".join(rng.choice(BASES) for _ in range(len_alt))
+        if len_ref == 1 and len_alt > 1:
+            alt = ref + alt[1:]  # VCF-style anchored insertion
+        elif len_alt == 1 and len_ref > 1:
+            alt = ref[0]
+        elif ref == alt:
+            continue
+        chromosome = rng.choice([str(c) for c in range(1, 23)] + ["X", "Y"])
+        variants.append((chromosome, rng.randint(100000, 20000000), ref, alt))
+    return variants
+
+
+def vcf_variants(file: str, limit: int):
+    variants = []
+    reader = cyvcf2.Reader(file)
+    try:
+        for entry in reader:
+            for alt in entry.ALT:
+                variants.append((entry.CHROM, entry.POS, entry.REF, alt))
+            if len(variants) >= limit:
+                break
+    finally:
+        reader.close()
+    return variants
+
+
+def check(
+    pk_generator: PrimaryKeyGenerator, variants: list, skip_normalization: bool
+) -> int:
+    start = time.perf_counter()
+    expected = []
+    for chromosome, position, ref, alt in variants:
+        record = BaseVCFLoader._build_variant_identifier_record(
+            pk_generator,
+            VCFRecord(chromosome, position, ".", ref, alt),
+            skip_normalization=skip_normalization,
+            require_validation=False,
+        )
+        expected.append(record.id)
+    record_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chromosomes, positions, refs, alts = (list(column) for column in zip(*variants))
+    keys = pk_generator.primary_keys(
+        chromosomes,
+        positions,
+        refs,
+        alts,
+        require_validation=False,
+        normalize=not skip_normalization,
+    )
+    batch_elapsed = time.perf_counter() - start
+
+    mismatches = [
+        (variant, key, expected_key)
+        for variant, key, expected_key in zip(variants, keys, expected)
+        if key != expected_key
+    ]
+    for variant, key, expected_key in mismatches[:20]:
+        print(f"MISMATCH {':'.join(map(str, variant))}: {key} != {expected_key}")
+
+    print(
+        f"{len(variants)} variants; {len(mismatches)} mismatches; "
+        f"loader: {record_elapsed:.2f}s; primary_keys: {batch_elapsed:.2f}s"
+    )
+    return len(mismatches)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seqrepo-service-url", required=True)
+    parser.add_argument("--genome-build", default=GenomeBuild.GRCh38.value)
+    parser.add_argument("--variants", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--vcf", help="also check the variants in this VCF file")
+    parser.add_argument("--limit", type=int, default=100000)
+    parser.add_argument(
+        "--skip-normalization",
+        action="store_true",
+        help="key long indels by the unnormalized VRS allele (as the dbSNP loader does)",
+    )
+    args = parser.parse_args()
+
+    generator = PrimaryKeyGenerator(
+        GenomeBuild(args.genome_build), args.seqrepo_service_url
+    )
+    failures = check(
+        generator,
+        synthetic_variants(args.variants, seed=args.seed),
+        args.skip_normalization,
+    )
+    if args.vcf is not None:
+        failures += check(
+            generator, vcf_variants(args.vcf, args.limit), args.skip_normalization
+        )
+    sys.exit(1 if failures else 0)